@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Microbenchmark of per-line response collection overhead.
+
+Compares the original collection loop (an asyncio.Queue plus one get task
+and one asyncio.wait per line against a separate timer task) with the
+current one (lines routed straight to the waiting command, which awaits a
+single future under one deadline). No GDB process is involved; lines are
+fed from memory so only the collection cost is measured.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gdb_mcp.gdb_manager import GDBSession, _PendingCommand
+
+
+def make_lines(count: int, token: int) -> list:
+    """Console output lines followed by the result record and prompt."""
+    lines = [f'~"#{i}  0x{i:016x} in frame_{i} () at prog.c:{i}\\n"' for i in range(count)]
+    return lines + [f"{token}^done", "(gdb)"]
+
+
+async def old_collect(lines: list) -> float:
+    """Time the original queue/task-per-line loop."""
+    queue: asyncio.Queue = asyncio.Queue()
+    for line in lines:
+        queue.put_nowait(line)
+
+    start = time.perf_counter()
+    output_lines = []
+    timeout_task = asyncio.create_task(asyncio.sleep(5))
+    while True:
+        get_task = asyncio.create_task(queue.get())
+        done, pending = await asyncio.wait({get_task, timeout_task}, return_when=asyncio.FIRST_COMPLETED)
+        if timeout_task in done:
+            break
+        line = await get_task
+        output_lines.append(line)
+        if line == '(gdb)':
+            timeout_task.cancel()
+            break
+    '\n'.join(output_lines)
+    return time.perf_counter() - start
+
+
+async def new_collect(lines: list) -> float:
+    """Time routing through GDBSession._dispatch_line to a single future."""
+    session = GDBSession("bench")
+    pending = _PendingCommand(1, "bt")
+    session._pending[1] = pending
+
+    async def feed():
+        for line in lines:
+            session._dispatch_line(line)
+
+    start = time.perf_counter()
+    feeder = asyncio.create_task(feed())
+    await asyncio.wait_for(asyncio.shield(pending.future), 5)
+    '\n'.join(pending.lines)
+    await feeder
+    return time.perf_counter() - start
+
+
+async def run(count: int, repeat: int) -> dict:
+    lines = make_lines(count, 1)
+    old = min([await old_collect(lines) for _ in range(repeat)])
+    new = min([await new_collect(lines) for _ in range(repeat)])
+    return {
+        "lines": len(lines),
+        "old_us_per_line": round(old / len(lines) * 1e6, 3),
+        "new_us_per_line": round(new / len(lines) * 1e6, 3),
+        "speedup": round(old / new, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20000, help="Output lines per command")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.lines, args.repeat)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Compare the cost of returning target memory via `call` and `read_memory`.
+
+The `call` path returns a -data-read-memory-bytes result as parsed data plus
+the raw MI output, JSON-encoded into a text block. The `read_memory` path
+returns the same bytes base64-encoded. Both are measured from the GDB output
+lines to the final MCP text payload.
+"""
+
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gdb_mcp.memory import DEFAULT_CHUNK_SIZE
+from gdb_mcp.mi_parser import parse_result_record
+
+
+def mi_lines(data: bytes, chunk_size: int) -> list:
+    """Build -data-read-memory-bytes result records for data in chunks."""
+    lines = []
+    for pos in range(0, len(data), chunk_size):
+        chunk = data[pos:pos + chunk_size]
+        lines.append(
+            f'^done,memory=[{{begin="0x{0x601000 + pos:x}",offset="0x0",'
+            f'end="0x{0x601000 + pos + len(chunk):x}",contents="{chunk.hex()}"}}]'
+        )
+    return lines
+
+
+def call_path(line: str) -> str:
+    """Encode one whole-range result the way the call tool does."""
+    response = {"result": parse_result_record(line), "output": ""}
+    return json.dumps({"type": "ok", "content": response})
+
+
+def read_memory_path(lines: list, size: int) -> str:
+    """Encode chunked results the way the read_memory tool does."""
+    data = bytearray(size)
+    for line in lines:
+        for block in parse_result_record(line)["data"]["memory"]:
+            begin = int(block["begin"], 16) - 0x601000
+            contents = bytes.fromhex(block["contents"])
+            data[begin:begin + len(contents)] = contents
+    content = {
+        "address": "0x601000",
+        "offset": 0,
+        "length": size,
+        "encoding": "base64",
+        "data": base64.b64encode(data).decode("ascii"),
+        "unreadable": [],
+        "next_offset": None,
+    }
+    return json.dumps({"type": "ok", "content": content})
+
+
+def bench(fn, repeat: int):
+    """Return the best time and the payload of repeated calls."""
+    best = float("inf")
+    payload = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1024 * 1024, help="Bytes of memory")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = bytes(range(256)) * (args.size // 256)
+    whole = mi_lines(data, len(data))[0]
+    chunked = mi_lines(data, DEFAULT_CHUNK_SIZE)
+
+    call_time, call_payload = bench(lambda: call_path(whole), args.repeat)
+    read_time, read_payload = bench(lambda: read_memory_path(chunked, len(data)), args.repeat)
+
+    print(json.dumps({
+        "bytes": len(data),
+        "call": {
+            "payload_bytes": len(call_payload),
+            "ratio": round(len(call_payload) / len(data), 2),
+            "seconds": round(call_time, 6),
+        },
+        "read_memory": {
+            "payload_bytes": len(read_payload),
+            "ratio": round(len(read_payload) / len(data), 2),
+            "seconds": round(read_time, 6),
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
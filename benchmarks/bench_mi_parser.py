@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark the GDB/MI record parser on large synthetic outputs.
+
+Generates the kind of single-line results GDB produces for
+``-stack-list-frames`` on deep recursion and ``-data-read-memory-bytes`` on
+large ranges, and reports parse throughput in MB/s.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gdb_mcp.mi_parser import parse_record
+
+
+def make_stack_frames(depth: int) -> str:
+    """Build a -stack-list-frames result for a recursion of the given depth."""
+    frames = ",".join(
+        f'frame={{level="{i}",addr="0x{0x401000 + i * 16:016x}",func="recurse",'
+        f'file="deep.c",fullname="/home/user/src/deep.c",line="{10 + i % 5}",'
+        f'arch="i386:x86-64"}}'
+        for i in range(depth)
+    )
+    return f"42^done,stack=[{frames}]"
+
+
+def make_memory_bytes(size: int) -> str:
+    """Build a -data-read-memory-bytes result covering size bytes."""
+    contents = (bytes(range(256)) * (size // 256 + 1))[:size].hex()
+    return (
+        f'43^done,memory=[{{begin="0x00007ffff7a00000",offset="0x0000000000000000",'
+        f'end="0x{0x7ffff7a00000 + size:016x}",contents="{contents}"}}]'
+    )
+
+
+def make_console_stream(lines: int) -> list:
+    """Build console stream records with escapes, as from 'bt full'."""
+    return [
+        f'~"#{i}  0x{i:016x} in recurse (n={i}) at deep.c:12\\n\\tlocal = \\"value\\"\\n"'
+        for i in range(lines)
+    ]
+
+
+def bench(name: str, lines: list, repeat: int) -> dict:
+    """Parse the given lines repeatedly and report the best run."""
+    size = sum(len(line) for line in lines)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            parse_record(line)
+        best = min(best, time.perf_counter() - start)
+    return {
+        "name": name,
+        "bytes": size,
+        "seconds": round(best, 6),
+        "mb_per_s": round(size / best / 1e6, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=20000, help="Stack depth")
+    parser.add_argument("--memory", type=int, default=4 * 1024 * 1024, help="Bytes of memory")
+    parser.add_argument("--lines", type=int, default=50000, help="Console stream lines")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = [
+        bench("stack-list-frames", [make_stack_frames(args.depth)], args.repeat),
+        bench("data-read-memory-bytes", [make_memory_bytes(args.memory)], args.repeat),
+        bench("console-stream", make_console_stream(args.lines), args.repeat),
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
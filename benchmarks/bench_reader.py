@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Throughput of the GDB output reader against the original readline loop.
+
+Feeds a StreamReader with MI output in pipe-sized chunks and times how long
+each reader takes to turn it into stripped lines. The original loop used
+readline() (limited to 64 KiB lines), then decoded and stripped each line;
+the current one is gdb_mcp.reader.read_lines. A second run adds one line
+larger than the readline limit, which the original loop could not read.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gdb_mcp.reader import read_lines
+
+# Bytes the kernel pipe hands over per read
+PIPE_CHUNK = 64 * 1024
+
+
+def make_output(lines: int, huge_line: int) -> bytes:
+    """Console and result records, optionally with one huge memory line."""
+    out = [f'~"#{i}  0x{i:016x} in frame_{i} (arg=0x{i:x}) at prog.c:{i}\\n"\n' for i in range(lines)]
+    if huge_line:
+        out.append(f'7^done,memory=[{{begin="0x601000",offset="0x0",end="0x0",contents="{"ab" * (huge_line // 2)}"}}]\n')
+    out.append("(gdb) \n")
+    return "".join(out).encode()
+
+
+async def feed(stream: asyncio.StreamReader, data: bytes):
+    for pos in range(0, len(data), PIPE_CHUNK):
+        stream.feed_data(data[pos:pos + PIPE_CHUNK])
+        await asyncio.sleep(0)
+    stream.feed_eof()
+
+
+async def old_reader(stream: asyncio.StreamReader, on_line):
+    """The original _read_output loop."""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        decoded = line.decode('utf-8', errors='replace').strip()
+        if decoded:
+            on_line(decoded)
+
+
+async def measure(reader, data: bytes) -> dict:
+    stream = asyncio.StreamReader()  # default 64 KiB limit, as for the GDB pipe
+    lines = []
+    start = time.perf_counter()
+    feeder = asyncio.create_task(feed(stream, data))
+    try:
+        await reader(stream, lines.append)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start
+    feeder.cancel()
+    return {
+        "lines": len(lines),
+        "seconds": round(elapsed, 6),
+        "mb_per_second": round(len(data) / elapsed / 1e6, 1),
+        "error": error,
+    }
+
+
+async def run(lines: int, huge_line: int, repeat: int) -> dict:
+    results = {}
+    for label, data in (("small_lines", make_output(lines, 0)), ("with_huge_line", make_output(lines, huge_line))):
+        old = [await measure(old_reader, data) for _ in range(repeat)]
+        new = [await measure(read_lines, data) for _ in range(repeat)]
+        results[label] = {
+            "bytes": len(data),
+            "old": min(old, key=lambda r: r["seconds"]),
+            "new": min(new, key=lambda r: r["seconds"]),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200000)
+    parser.add_argument("--huge-line", type=int, default=4 * 1024 * 1024, help="Bytes of the oversized line")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.lines, args.huge_line, args.repeat)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Load test of the session registry with many sessions and concurrent calls.
+
+For each session count N, opens N sessions against the stub GDB
+(benchmarks/stub_gdb.py), then issues M concurrent calls per session while
+one more session is being opened with a slow GDB startup. Reports call
+latency percentiles, which should stay flat as N grows and should not
+include the slow spawn.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gdb_mcp.gdb_manager import GDBManager
+from gdb_mcp.pool import percentiles
+
+STUB_GDB = str(Path(__file__).parent / "stub_gdb.py")
+
+
+async def run_one(sessions: int, calls: int, spawn_delay: float, cache_dir: str) -> dict:
+    manager = GDBManager(pool_min_size=0, pool_max_size=0, cache_dir=cache_dir, gdb_path=STUB_GDB)
+    await manager.start()
+    try:
+        start = time.perf_counter()
+        ids = await asyncio.gather(*(manager.create_session() for _ in range(sessions)))
+        open_seconds = time.perf_counter() - start
+
+        latencies = []
+
+        async def call(session_id: str, i: int):
+            call_start = time.perf_counter()
+            await manager.send_command(session_id, f"-data-evaluate-expression {i}")
+            latencies.append(time.perf_counter() - call_start)
+
+        # Every spawn from here on is slow, which only the extra open may see
+        os.environ["STUB_GDB_STARTUP_DELAY"] = str(spawn_delay)
+        try:
+            slow_open = asyncio.create_task(manager.create_session())
+            await asyncio.sleep(0)
+            start = time.perf_counter()
+            await asyncio.gather(*(call(sid, i) for sid in ids for i in range(calls)))
+            calls_seconds = time.perf_counter() - start
+            ids.append(await slow_open)
+        finally:
+            del os.environ["STUB_GDB_STARTUP_DELAY"]
+
+        start = time.perf_counter()
+        for session_id in ids:
+            await manager.close_session(session_id)
+        close_seconds = time.perf_counter() - start
+
+        return {
+            "sessions": sessions,
+            "calls": len(latencies),
+            "open_seconds": round(open_seconds, 3),
+            "calls_per_second": round(len(latencies) / calls_seconds),
+            "call_latency_ms": percentiles(latencies, (50, 99)),
+            "close_seconds": round(close_seconds, 4),
+        }
+    finally:
+        await manager.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50, 100, 200])
+    parser.add_argument("--calls", type=int, default=20, help="Concurrent calls per session")
+    parser.add_argument("--spawn-delay", type=float, default=2.0, help="Startup delay of the concurrently opened session")
+    parser.add_argument("--cache-dir", default=str(Path("/tmp") / "gdb-mcp-bench"))
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(run_one(n, args.calls, args.spawn_delay, args.cache_dir))
+        for n in args.sessions
+    ]
+    print(json.dumps({"spawn_delay": args.spawn_delay, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Cold start of the stdio server: time to the first `initialize` response.
+
+MCP clients start a stdio server per connection, so this is latency every
+user sees. Each run spawns `python -m gdb_mcp --startup-profile` against the
+stub GDB (benchmarks/stub_gdb.py), times the `initialize` handshake and the
+first `open` (which starts the first GDB process), and collects the server's
+startup profile from its log. Exits with status 1 if the median time to
+`initialize` exceeds --max-initialize-ms, so it can guard against startup
+regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from gdb_mcp.pool import percentiles
+
+STUB_GDB = str(Path(__file__).parent / "stub_gdb.py")
+
+_PROFILE_RE = re.compile(r"Startup profile: (.*)")
+
+
+async def run_once(cache_dir: str) -> Dict[str, Any]:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "gdb_mcp", "--startup-profile", "--gdb", STUB_GDB, "--cache-dir", cache_dir],
+        env={**os.environ, "PYTHONPATH": str(ROOT / "src")},
+    )
+    with tempfile.TemporaryFile("w+") as errlog:
+        start = time.perf_counter()
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                result = await session.call_tool("open", {})
+                opened = time.perf_counter()
+                if json.loads(result.content[0].text)["type"] != "ok":
+                    raise RuntimeError(f"open failed: {result.content[0].text}")
+        errlog.seek(0)
+        m = _PROFILE_RE.search(errlog.read())
+    profile = {}
+    if m:
+        for phase in m.group(1).split(", "):
+            name, ms, _ = phase.split(" ")
+            profile[name] = float(ms) / 1000
+    # Seconds, as percentiles() expects
+    return {"initialize": initialized - start, "first_open": opened - initialized, "profile": profile}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Server starts to measure")
+    parser.add_argument(
+        "--max-initialize-ms", type=float, default=1500,
+        help="Fail if the median time to the initialize response exceeds this"
+    )
+    parser.add_argument("--cache-dir", default=str(Path("/tmp") / "gdb-mcp-bench"))
+    args = parser.parse_args()
+
+    runs = [asyncio.run(run_once(args.cache_dir)) for _ in range(args.repeat)]
+    phases = sorted({name for run in runs for name in run["profile"]})
+    report = {
+        "cpus": os.cpu_count(),
+        "initialize_ms": percentiles(r["initialize"] for r in runs),
+        "first_open_ms": percentiles(r["first_open"] for r in runs),
+        "profile_ms": {
+            name: percentiles(r["profile"][name] for r in runs if name in r["profile"])
+            for name in phases
+        },
+        "max_initialize_ms": args.max_initialize_ms,
+    }
+    print(json.dumps(report, indent=2))
+    if report["initialize_ms"]["p50"] > args.max_initialize_ms:
+        print(
+            f"Median time to initialize {report['initialize_ms']['p50']:.1f} ms "
+            f"exceeds {args.max_initialize_ms} ms",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Throughput of the single-process manager against worker processes.
+
+Opens sessions against the stub GDB (benchmarks/stub_gdb.py) and keeps a
+fixed number of `-stack-list-frames` calls in flight per session. Every
+result is JSON-encoded the way the `call` tool returns it, so the numbers
+include the work the front process still does in worker mode. Throughput
+should scale with the number of workers up to the number of cores.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gdb_mcp.gdb_manager import GDBManager
+from gdb_mcp.workers import WorkerPoolManager
+
+STUB_GDB = str(Path(__file__).parent / "stub_gdb.py")
+
+
+async def run_one(workers: int, sessions: int, inflight: int, duration: float, cache_dir: str) -> dict:
+    options = dict(pool_min_size=0, pool_max_size=0, cache_dir=cache_dir, gdb_path=STUB_GDB)
+    manager = WorkerPoolManager(workers, **options) if workers else GDBManager(**options)
+    await manager.start()
+    try:
+        ids = await asyncio.gather(*(manager.create_session() for _ in range(sessions)))
+        completed = 0
+        payload_bytes = 0
+        deadline = time.perf_counter() + duration
+
+        async def client(session_id: str):
+            nonlocal completed, payload_bytes
+            while time.perf_counter() < deadline:
+                result = await manager.send_command(session_id, "-stack-list-frames")
+                payload_bytes += len(json.dumps({"type": "ok", "content": result}))
+                completed += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client(sid) for sid in ids for _ in range(inflight)))
+        elapsed = time.perf_counter() - start
+        for session_id in ids:
+            await manager.close_session(session_id)
+        return {
+            "workers": workers,
+            "calls": completed,
+            "calls_per_second": round(completed / elapsed),
+            "mb_per_second": round(payload_bytes / elapsed / 1e6, 1),
+        }
+    finally:
+        await manager.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4], help="Worker counts; 0 is single-process")
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--inflight", type=int, default=4, help="Concurrent calls per session")
+    parser.add_argument("--frames", type=int, default=200, help="Frames per backtrace")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per measurement")
+    parser.add_argument("--cache-dir", default=str(Path("/tmp") / "gdb-mcp-bench"))
+    args = parser.parse_args()
+
+    os.environ["STUB_GDB_FRAMES"] = str(args.frames)
+    results = [
+        asyncio.run(run_one(n, args.sessions, args.inflight, args.duration, args.cache_dir))
+        for n in args.workers
+    ]
+    print(json.dumps({"cpus": os.cpu_count(), "frames": args.frames, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Minimal GDB/MI responder for benchmarks that don't need a real debugger.
+
+Prints a prompt, then answers every command with a console echo and a
+tokened ``^done`` result record. Delays can be injected through the
+environment:
+
+- ``STUB_GDB_STARTUP_DELAY``: seconds to wait before the first prompt
+- ``STUB_GDB_COMMAND_DELAY``: seconds to wait before each answer
+
+``-stack-list-frames`` answers with ``STUB_GDB_FRAMES`` frames (default
+100), giving the server a realistic amount of MI output to parse.
+
+Use it as ``--gdb benchmarks/stub_gdb.py`` (or ``gdb_path=``).
+"""
+
+import os
+import re
+import sys
+import time
+
+_COMMAND_RE = re.compile(r"(\d*)(.*)")
+
+
+def main():
+    startup_delay = float(os.environ.get("STUB_GDB_STARTUP_DELAY", "0"))
+    command_delay = float(os.environ.get("STUB_GDB_COMMAND_DELAY", "0"))
+    frames = int(os.environ.get("STUB_GDB_FRAMES", "100"))
+    stack = ",".join(
+        f'frame={{level="{i}",addr="0x{0x401000 + i * 16:016x}",func="function_{i}",'
+        f'file="source_{i % 7}.c",fullname="/src/project/source_{i % 7}.c",line="{i + 10}",arch="i386:x86-64"}}'
+        for i in range(frames)
+    )
+    out = sys.stdout
+
+    time.sleep(startup_delay)
+    out.write('=thread-group-added,id="i1"\n(gdb)\n')
+    out.flush()
+
+    for line in sys.stdin:
+        token, command = _COMMAND_RE.match(line.rstrip("\n")).groups()
+        command = command.strip()
+        if command in ("quit", "-gdb-exit"):
+            out.write(f"{token}^exit\n")
+            out.flush()
+            break
+        if command_delay:
+            time.sleep(command_delay)
+        if command == "-stack-list-frames":
+            out.write(f"{token}^done,stack=[{stack}]\n(gdb)\n")
+        elif command == "-list-thread-groups":
+            out.write(f'{token}^done,groups=[{{id="i1",type="process"}}]\n(gdb)\n')
+        else:
+            escaped = command.replace("\\", "\\\\").replace('"', '\\"')
+            out.write(f'~"{escaped}\\n"\n{token}^done\n(gdb)\n')
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark suite driving the server against the tests/src programs.
+
+Builds the buggy C programs from tests/src with debug information, then
+drives GDBMCPServer through its MCP tool handlers, both in-process and over
+stdio with a real MCP client, and measures:
+
+- session open latency (pooled and with a binary's symbols loaded)
+- per-command latency of a fixed set of commands
+- throughput of concurrent sessions issuing commands
+- time from `open` to the documented crash of each program, checked against
+  the signal and function in tests/expects.md
+- peak RSS of the server and of its GDB processes (in-process only)
+
+Results are printed (or written with --output) as JSON, tagged with the git
+commit, so runs can be compared between commits. Exits with status 1 if a
+program did not stop the way tests/expects.md documents.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from gdb_mcp.limits import process_rss
+from gdb_mcp.pool import percentiles
+
+TEST_SOURCES = ROOT / "tests" / "src"
+
+# Compiler flags of tests/src/Makefile, but with debug information and
+# without optimization so that crash frames and locals are meaningful
+CFLAGS = ["-O0", "-g", "-Wall", "-Wextra", "-Werror", "-std=c11"]
+EXTRA_CFLAGS = {"5": ["-march=native"], "6": ["-m32"]}
+
+# Documented outcome of each tests/src program (see tests/expects.md): the
+# signals it may stop with, the functions the crash may be reported in (the
+# first frame with source) and whether it may also run to completion, for
+# bugs whose effect depends on the memory layout
+EXPECTED_CRASHES = {
+    "1": {"signals": ["SIGSEGV"], "functions": ["process_results"], "may_exit": False},
+    "2": {"signals": ["SIGABRT"], "functions": ["cleanup_list"], "may_exit": False},
+    "3": {"signals": ["SIGSEGV", "SIGABRT"], "functions": ["analyze_data"], "may_exit": True},
+    "4": {"signals": ["SIGSEGV"], "functions": ["append_to_current"], "may_exit": True},
+    "5": {"signals": ["SIGSEGV", "SIGBUS"], "functions": ["compute_averages"], "may_exit": False},
+    "6": {"signals": ["SIGSEGV", "SIGBUS", "SIGILL"], "functions": ["run_calculations", "main"], "may_exit": True},
+    "7": {"signals": ["SIGSEGV", "SIGABRT"], "functions": ["parse_input", "main"], "may_exit": True},
+}
+
+# Commands timed by the command latency scenario
+COMMANDS = [
+    "-data-evaluate-expression sizeof(int)",
+    "-break-insert -t main",
+    "-break-list",
+    "info line main",
+    "-symbol-info-functions --name main",
+]
+
+
+def build(build_dir: Path) -> Dict[str, Any]:
+    """Compile tests/src/*.c into build_dir; returns programs and failures."""
+    build_dir.mkdir(parents=True, exist_ok=True)
+    compiler = os.environ.get("CC") or shutil.which("gcc") or shutil.which("cc")
+    if not compiler:
+        raise RuntimeError("No C compiler found (set CC)")
+    programs, failures = {}, {}
+    for source in sorted(TEST_SOURCES.glob("*.c")):
+        name = source.stem
+        output = build_dir / name
+        cmd = [compiler, *CFLAGS, *EXTRA_CFLAGS.get(name, []), str(source), "-o", str(output)]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode == 0:
+            programs[name] = str(output)
+        else:
+            failures[name] = proc.stderr.strip().splitlines()[-1:] or [f"exit code {proc.returncode}"]
+    return {"programs": programs, "failures": failures}
+
+
+class ToolError(Exception):
+    pass
+
+
+def _decode(text: str) -> Any:
+    response = json.loads(text)
+    if response["type"] == "error":
+        raise ToolError(response["content"])
+    return response["content"]
+
+
+class InProcessClient:
+    """Calls the tool handlers of a GDBMCPServer in this process."""
+
+    transport = "in-process"
+
+    def __init__(self, server_options: Dict[str, Any]):
+        from gdb_mcp.server import GDBMCPServer
+        from mcp.types import CallToolRequest
+
+        self.server = GDBMCPServer(**server_options)
+        self._handler = self.server.server.request_handlers[CallToolRequest]
+
+    async def __aenter__(self):
+        await self.server.gdb_manager.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.server.gdb_manager.cleanup()
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Any:
+        from mcp.types import CallToolRequest, CallToolRequestParams
+
+        request = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+        result = await self._handler(request)
+        return _decode(result.root.content[0].text)
+
+    def gdb_pids(self) -> List[int]:
+        manager = self.server.gdb_manager
+        sessions = list(manager.sessions.values()) + list(manager.pool._idle)
+        for queue in manager.pool._templates.values():
+            sessions.extend(queue)
+        return [s.process.pid for s in sessions if s.is_alive]
+
+
+class StdioClient:
+    """Runs the server as a subprocess and talks MCP to it over stdio."""
+
+    transport = "stdio"
+
+    def __init__(self, cli_args: List[str]):
+        self.cli_args = cli_args
+        self._stack = None
+
+    async def __aenter__(self):
+        from contextlib import AsyncExitStack
+        from mcp import ClientSession, StdioServerParameters
+        from mcp.client.stdio import stdio_client
+
+        params = StdioServerParameters(
+            command=sys.executable,
+            args=["-m", "gdb_mcp", *self.cli_args],
+            env={**os.environ, "PYTHONPATH": str(ROOT / "src")},
+        )
+        self._stack = AsyncExitStack()
+        errlog = self._stack.enter_context(open(os.devnull, "w"))
+        start = time.perf_counter()
+        read, write = await self._stack.enter_async_context(stdio_client(params, errlog=errlog))
+        self.session = await self._stack.enter_async_context(ClientSession(read, write))
+        await self.session.initialize()
+        self.startup_seconds = time.perf_counter() - start
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._stack.aclose()
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Any:
+        result = await self.session.call_tool(name, arguments)
+        return _decode(result.content[0].text)
+
+    def gdb_pids(self) -> List[int]:
+        return []
+
+
+async def timed(coro) -> tuple:
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, result
+
+
+async def bench_open(client, binary: str, repeat: int) -> Dict[str, Any]:
+    """Open and close sessions, without and with a binary."""
+    plain, with_binary = [], []
+    for samples, arguments in ((plain, {}), (with_binary, {"binary": binary})):
+        for _ in range(repeat):
+            elapsed, content = await timed(client.call("open", arguments))
+            samples.append(elapsed)
+            await client.call("close", {"id": content["id"]})
+            # Let the closed process be reset and returned to the pool
+            await asyncio.sleep(0.05)
+    return {
+        "plain_ms": percentiles(plain),
+        "with_binary_ms": percentiles(with_binary),
+    }
+
+
+async def bench_commands(client, binary: str, repeat: int) -> Dict[str, Any]:
+    """Latency of each command in COMMANDS on a session with symbols loaded."""
+    session_id = (await client.call("open", {"binary": binary}))["id"]
+    try:
+        results = {}
+        for command in COMMANDS:
+            samples, errors = [], 0
+            for _ in range(repeat):
+                elapsed, content = await timed(client.call("call", {"id": session_id, "command": command}))
+                samples.append(elapsed)
+                result = content["result"]
+                if result is None or result["status"] == "error":
+                    errors += 1
+            results[command] = {**percentiles(samples), "errors": errors}
+        return results
+    finally:
+        await client.call("close", {"id": session_id})
+
+
+async def bench_throughput(client, binary: str, sessions: int, calls: int) -> Dict[str, Any]:
+    """Commands per second with several sessions each issuing calls concurrently."""
+    ids = [(await client.call("open", {"binary": binary}))["id"] for _ in range(sessions)]
+    try:
+        samples = []
+
+        async def worker(session_id: str):
+            for i in range(calls):
+                elapsed, _ = await timed(client.call(
+                    "call", {"id": session_id, "command": f"-data-evaluate-expression {i}"}
+                ))
+                samples.append(elapsed)
+
+        elapsed, _ = await timed(asyncio.gather(*(worker(sid) for sid in ids)))
+        return {
+            "sessions": sessions,
+            "calls": len(samples),
+            "calls_per_second": round(len(samples) / elapsed, 1),
+            "latency_ms": percentiles(samples),
+        }
+    finally:
+        for session_id in ids:
+            await client.call("close", {"id": session_id})
+
+
+def check_crash(entry: Dict[str, Any]) -> Optional[str]:
+    """Return how a reach_crash entry differs from EXPECTED_CRASHES, or None."""
+    expected = EXPECTED_CRASHES.get(entry["program"])
+    if expected is None:
+        return None
+    if not entry["crashed"]:
+        if expected["may_exit"] and entry["reason"] in ("exited-normally", "exited"):
+            return None
+        return f"expected a crash with {' or '.join(expected['signals'])}, got {entry['reason']}"
+    if entry["signal"] not in expected["signals"]:
+        return f"expected {' or '.join(expected['signals'])}, got {entry['signal']}"
+    function = entry.get("source_frame", {}).get("function") or entry["function"]
+    if function not in expected["functions"]:
+        return f"expected the crash in {' or '.join(expected['functions'])}, got {function}"
+    return None
+
+
+async def reach_crash(client, name: str, binary: str, timeout: float) -> Dict[str, Any]:
+    """Time from open to the program's stop (crash) or exit.
+
+    The stop is compared with EXPECTED_CRASHES; an unexpected one is
+    reported with "error" and "matched": false.
+    """
+    start = time.perf_counter()
+    session_id = (await client.call("open", {"binary": binary}))["id"]
+    try:
+        await client.call("call", {"id": session_id, "command": "-exec-run"})
+        cursor, stop = 0, None
+        while stop is None:
+            remaining = timeout - (time.perf_counter() - start)
+            if remaining <= 0:
+                return {"program": name, "error": f"no stop within {timeout} seconds"}
+            page = await client.call("events", {"id": session_id, "cursor": cursor, "timeout": remaining})
+            cursor = page["cursor"]
+            stop = next((e for e in page["events"] if e.get("class") == "stopped"), None)
+        elapsed = time.perf_counter() - start
+
+        results = stop.get("results", {})
+        frame = results.get("frame", {})
+        entry = {
+            "program": name,
+            "seconds": round(elapsed, 4),
+            "crashed": results.get("reason") == "signal-received",
+            "reason": results.get("reason"),
+            "signal": results.get("signal-name"),
+            "exit_code": results.get("exit-code"),
+            "function": frame.get("func"),
+            "line": frame.get("line"),
+        }
+        if results.get("reason") == "signal-received":
+            # The first frame with source is where the documented bug is
+            stack = await client.call("call", {"id": session_id, "command": "-stack-list-frames"})
+            data = (stack["result"] or {}).get("data", {})
+            source = next((f for f in data.get("stack", []) if f.get("file")), None)
+            if source:
+                entry["source_frame"] = {"function": source.get("func"), "line": source.get("line")}
+        mismatch = check_crash(entry)
+        entry["matched"] = mismatch is None
+        if mismatch:
+            entry["error"] = mismatch
+        return entry
+    except ToolError as e:
+        return {"program": name, "error": str(e)}
+    finally:
+        await client.call("close", {"id": session_id})
+
+
+async def sample_rss(client, peak: Dict[str, int], stop: asyncio.Event):
+    """Track the peak combined RSS of the client's GDB processes."""
+    while not stop.is_set():
+        total = sum(process_rss(pid) or 0 for pid in client.gdb_pids())
+        peak["gdb"] = max(peak["gdb"], total)
+        try:
+            await asyncio.wait_for(stop.wait(), 0.1)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_suite(client, programs: Dict[str, str], args) -> Dict[str, Any]:
+    binary = programs.get("1") or next(iter(programs.values()))
+    peak = {"gdb": 0}
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(client, peak, stop))
+    try:
+        results = {
+            "open": await bench_open(client, binary, args.repeat),
+            "commands": await bench_commands(client, binary, args.repeat),
+            "throughput": [
+                await bench_throughput(client, binary, n, args.calls) for n in args.sessions
+            ],
+            "crashes": [
+                await reach_crash(client, name, path, args.crash_timeout)
+                for name, path in sorted(programs.items())
+            ],
+        }
+    finally:
+        stop.set()
+        await sampler
+    if client.transport == "in-process":
+        results["peak_rss_mb"] = {
+            "server": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            "gdb": round(peak["gdb"] / (1024 * 1024), 1),
+        }
+    else:
+        results["startup_seconds"] = round(client.startup_seconds, 4)
+    return results
+
+
+def environment(gdb: str) -> Dict[str, Any]:
+    def output(cmd: List[str]) -> Optional[str]:
+        try:
+            return subprocess.run(
+                cmd, capture_output=True, text=True, cwd=ROOT, stdin=subprocess.DEVNULL, timeout=30
+            ).stdout.strip() or None
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+
+    version = output([gdb, "--version"])
+    return {
+        "commit": output(["git", "rev-parse", "HEAD"]),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "gdb": version.splitlines()[0] if version else None,
+    }
+
+
+async def main_async(args) -> Dict[str, Any]:
+    built = build(Path(args.build_dir))
+    if not built["programs"]:
+        raise RuntimeError(f"No test program could be built: {built['failures']}")
+
+    report = {"environment": environment(args.gdb), "build": built, "results": {}}
+    cli_args = ["--gdb", args.gdb, "--cache-dir", args.cache_dir]
+    options = {"gdb_path": args.gdb, "cache_dir": args.cache_dir}
+    if "in-process" in args.transport:
+        async with InProcessClient(options) as client:
+            report["results"]["in-process"] = await run_suite(client, built["programs"], args)
+    if "stdio" in args.transport:
+        async with StdioClient(cli_args) as client:
+            report["results"]["stdio"] = await run_suite(client, built["programs"], args)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gdb", default="gdb", help="GDB executable")
+    parser.add_argument("--transport", nargs="+", choices=["in-process", "stdio"], default=["in-process", "stdio"])
+    parser.add_argument("--repeat", type=int, default=20, help="Samples per latency measurement")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16], help="Concurrent sessions for throughput")
+    parser.add_argument("--calls", type=int, default=50, help="Calls per session for throughput")
+    parser.add_argument("--crash-timeout", type=float, default=30, help="Seconds to wait for each program to stop")
+    parser.add_argument("--build-dir", default=str(Path("/tmp") / "gdb-mcp-bench" / "build"))
+    parser.add_argument("--cache-dir", default=str(Path("/tmp") / "gdb-mcp-bench" / "cache"))
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    failed = [
+        f"{transport}: program {crash['program']}: {crash['error']}"
+        for transport, results in report["results"].items()
+        for crash in results["crashes"]
+        if "error" in crash
+    ]
+    if failed:
+        print("\n".join(["Unexpected crash results:", *failed]), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # The server logs every command at INFO level
+    logging.disable(logging.INFO)
+    main()
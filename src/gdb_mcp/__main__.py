@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 """Main entry point for the GDB MCP server."""
 
-import asyncio
-from .server import main
+from .cli import main
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
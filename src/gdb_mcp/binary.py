@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Identification of target binaries and the server's on-disk cache."""
+
+import os
+import struct
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+# ELF constants
+PT_NOTE = 4
+NT_GNU_BUILD_ID = 3
+
+
+class BinaryKey(NamedTuple):
+    """Identifies one build of a binary for reuse of loaded symbols."""
+    path: str
+    mtime_ns: int
+    build_id: Optional[str]
+
+
+def default_cache_dir() -> Path:
+    """Return the directory for the server's persistent caches."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "gdb-mcp"
+
+
+def read_build_id(path: str) -> Optional[str]:
+    """Read the GNU build-id note of an ELF file as a hex string.
+
+    Returns None for non-ELF files and binaries without a build-id.
+    """
+    try:
+        with open(path, "rb") as f:
+            ident = f.read(16)
+            if len(ident) < 16 or ident[:4] != b"\x7fELF":
+                return None
+            is64 = ident[4] == 2
+            endian = "<" if ident[5] == 1 else ">"
+
+            if is64:
+                header = f.read(48)
+                e_phoff = struct.unpack_from(endian + "Q", header, 16)[0]
+                e_phentsize, e_phnum = struct.unpack_from(endian + "HH", header, 38)
+            else:
+                header = f.read(36)
+                e_phoff = struct.unpack_from(endian + "I", header, 12)[0]
+                e_phentsize, e_phnum = struct.unpack_from(endian + "HH", header, 26)
+
+            for i in range(e_phnum):
+                f.seek(e_phoff + i * e_phentsize)
+                phdr = f.read(e_phentsize)
+                if is64:
+                    p_type, _, p_offset, _, _, p_filesz = struct.unpack_from(endian + "IIQQQQ", phdr)
+                else:
+                    p_type, p_offset, _, _, p_filesz = struct.unpack_from(endian + "IIIII", phdr)
+                if p_type != PT_NOTE:
+                    continue
+
+                f.seek(p_offset)
+                build_id = _find_build_id(f.read(p_filesz), endian)
+                if build_id is not None:
+                    return build_id
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+def _find_build_id(notes: bytes, endian: str) -> Optional[str]:
+    """Find the GNU build-id in the contents of a PT_NOTE segment."""
+    pos = 0
+    while pos + 12 <= len(notes):
+        namesz, descsz, note_type = struct.unpack_from(endian + "III", notes, pos)
+        pos += 12
+        name = notes[pos:pos + namesz]
+        pos += (namesz + 3) & ~3
+        desc = notes[pos:pos + descsz]
+        pos += (descsz + 3) & ~3
+        if note_type == NT_GNU_BUILD_ID and name.rstrip(b"\0") == b"GNU":
+            return desc.hex()
+    return None
+
+
+def binary_key(path: str) -> BinaryKey:
+    """Build the cache key for a binary from its path, mtime and build-id."""
+    resolved = os.path.realpath(path)
+    try:
+        st = os.stat(resolved)
+    except OSError as e:
+        raise ValueError(f"Binary not found: {path} ({e.strerror})")
+    return BinaryKey(resolved, st.st_mtime_ns, read_build_id(resolved))
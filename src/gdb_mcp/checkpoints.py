@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Checkpoints of a session's inferior using GDB's fork-based checkpoints."""
+
+import logging
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .mi_parser import console_text, result_data
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for gcore to write a snapshot of the inferior
+SNAPSHOT_TIMEOUT = 120
+
+_CHECKPOINT_RE = re.compile(r"checkpoint (\d+): fork returned pid (\d+)")
+
+
+class CheckpointState:
+    """Named checkpoints of a session's inferior.
+
+    A GDB checkpoint is a forked copy of the inferior that is kept stopped.
+    Restarting one makes the fork the live process, so to allow restoring
+    the same point again a fresh checkpoint is taken right after each
+    restore; the name handed to the client stays the same. Checkpoints are
+    only available for native, single-threaded Linux inferiors.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self._next_name = 1
+        # Checkpoint name -> (GDB checkpoint number, pid of the fork)
+        self._checkpoints: Dict[str, Tuple[int, int]] = {}
+        # Snapshot directories owned by this session
+        self._directories: List[Path] = []
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+    async def _checkpoint(self) -> Tuple[int, int]:
+        response = await self.session.send_command("checkpoint")
+        result_data(response, "creating checkpoint")
+        console = console_text(response["lines"])
+        m = _CHECKPOINT_RE.search(console)
+        if not m:
+            raise RuntimeError(f"Failed creating checkpoint: {console.strip() or 'no checkpoint reported'}")
+        return int(m.group(1)), int(m.group(2))
+
+    async def create(self) -> Dict[str, Any]:
+        """Checkpoint the inferior where it is stopped now."""
+        number, pid = await self._checkpoint()
+        name = str(self._next_name)
+        self._next_name += 1
+        self._checkpoints[name] = (number, pid)
+        return {"checkpoint": name, "pid": pid}
+
+    async def restore(self, name: str) -> Dict[str, Any]:
+        """Return the inferior to a checkpoint; it can be restored again later."""
+        if name not in self._checkpoints:
+            raise ValueError(f"Unknown checkpoint: {name}")
+        number, _ = self._checkpoints[name]
+        response = await self.session.send_command(f"restart {number}")
+        result_data(response, f"restoring checkpoint {name}")
+        # The restored fork is now live; keep a pristine copy of it
+        self._checkpoints[name] = await self._checkpoint()
+        return {"checkpoint": name, "output": console_text(response["lines"])}
+
+    async def delete(self, name: str):
+        """Delete a checkpoint and its forked process."""
+        if name not in self._checkpoints:
+            raise ValueError(f"Unknown checkpoint: {name}")
+        number, _ = self._checkpoints.pop(name)
+        await self.session.send_command(f"delete checkpoint {number}")
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [{"checkpoint": name, "pid": pid} for name, (_, pid) in self._checkpoints.items()]
+
+    async def snapshot(self) -> Tuple[Path, Path]:
+        """Write a core file of the inferior and its breakpoints to a new directory.
+
+        Returns the paths of the core file and of the breakpoint script; the
+        caller owns the directory (see adopt).
+        """
+        directory = Path(tempfile.mkdtemp(prefix="gdb-mcp-snapshot-"))
+        core, breakpoints = directory / "core", directory / "breakpoints.gdb"
+        try:
+            result_data(await self.session.send_command(f"gcore {core}", SNAPSHOT_TIMEOUT), "writing core snapshot")
+            result_data(await self.session.send_command(f"save breakpoints {breakpoints}"), "saving breakpoints")
+        except Exception:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        if not breakpoints.exists():
+            # Nothing is written when there are no breakpoints
+            breakpoints.write_text("")
+        return core, breakpoints
+
+    def adopt(self, directory: Path):
+        """Remove directory when this session is reset or closed."""
+        self._directories.append(directory)
+
+    async def clear(self):
+        """Delete all checkpoints and owned snapshot files."""
+        for name in list(self._checkpoints):
+            try:
+                await self.delete(name)
+            except Exception as e:
+                logger.warning(f"Failed to delete checkpoint {name}: {e}")
+        self._checkpoints.clear()
+        self.remove_files()
+
+    def remove_files(self):
+        for directory in self._directories:
+            shutil.rmtree(directory, ignore_errors=True)
+        self._directories.clear()
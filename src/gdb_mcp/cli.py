@@ -1,13 +1,161 @@
 #!/usr/bin/env python3
 """CLI entry point for the GDB MCP server."""
 
+import argparse
 import asyncio
-from .server import main as async_main
+import logging
+import os
+from .server import AUTH_TOKEN_ENV, LOOPBACK_HOSTS, TRANSPORTS, main as async_main
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(prog="gdb-mcp", description="GDB MCP server")
+    parser.add_argument(
+        "--transport", choices=TRANSPORTS, default="stdio",
+        help="stdio serves one client and exits with it; sse and streamable-http run a long-lived "
+             "server that many clients share, keeping sessions across connections (default: stdio)"
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1",
+        help="Address to listen on with an HTTP transport (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000,
+        help="Port to listen on with an HTTP transport (default: 8000)"
+    )
+    parser.add_argument(
+        "--socket", metavar="PATH",
+        help="Listen on this Unix domain socket instead of --host/--port"
+    )
+    parser.add_argument(
+        "--auth-token", metavar="TOKEN", default=os.environ.get(AUTH_TOKEN_ENV),
+        help="Require 'Authorization: Bearer TOKEN' on every HTTP request "
+             f"(default: ${AUTH_TOKEN_ENV}, which keeps it out of the process list)"
+    )
+    parser.add_argument(
+        "--allow-unauthenticated", action="store_true",
+        help="Listen on a non-loopback --host without --auth-token, letting anyone who can "
+             "connect run GDB (and shell commands) as this user"
+    )
+    parser.add_argument(
+        "--pool-min", type=int, default=1,
+        help="Idle GDB processes kept ready for 'open' (default: 1)"
+    )
+    parser.add_argument(
+        "--pool-max", type=int, default=4,
+        help="Maximum idle GDB processes kept for reuse after 'close' (default: 4)"
+    )
+    parser.add_argument(
+        "--templates-per-binary", type=int, default=2,
+        help="Idle symbol-loaded sessions kept per target binary (default: 2)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for persistent caches such as GDB's index cache (default: ~/.cache/gdb-mcp)"
+    )
+    parser.add_argument(
+        "--event-buffer", type=int, default=1000,
+        help="Asynchronous events kept per session for the 'events' tool (default: 1000)"
+    )
+    parser.add_argument(
+        "--output-budget", type=int, default=32768, metavar="CHARS",
+        help="Command output returned in full per call; longer output is summarized and kept "
+             "for 'fetch_output' (0: no limit, default: 32768)"
+    )
+    parser.add_argument(
+        "--journal-dir", metavar="DIR",
+        help="Append a JSONL journal of each session's commands to DIR/<session id>.jsonl "
+             "(re-run them with gdb-mcp-replay)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0,
+        help="Worker processes to spread GDB sessions across; 0 runs everything in one process (default: 0)"
+    )
+    parser.add_argument(
+        "--max-sessions", type=int,
+        help="Maximum number of open sessions (default: unlimited)"
+    )
+    parser.add_argument(
+        "--session-memory", type=int, metavar="MIB",
+        help="Evict sessions whose GDB process uses more than this many MiB of resident memory"
+    )
+    parser.add_argument(
+        "--session-cpu", type=int, metavar="SECONDS",
+        help="CPU time limit of each session's GDB process (RLIMIT_CPU)"
+    )
+    parser.add_argument(
+        "--min-available-memory", type=int, metavar="MIB",
+        help="Hold back 'open' while the host has less than this many MiB available"
+    )
+    parser.add_argument(
+        "--admission-timeout", type=float, default=30,
+        help="Seconds 'open' waits for a free session slot or memory before failing (default: 30)"
+    )
+    parser.add_argument(
+        "--cgroup", metavar="DIR",
+        help="Delegated cgroup v2 directory; each GDB process gets a child cgroup with the memory limit"
+    )
+    parser.add_argument(
+        "--metrics-file", metavar="PATH",
+        help="Write OpenMetrics text to this file every 10 seconds"
+    )
+    parser.add_argument(
+        "--metrics-port", type=int,
+        help="Serve OpenMetrics text at http://127.0.0.1:PORT/metrics"
+    )
+    parser.add_argument(
+        "--gdb", default="gdb",
+        help="GDB executable to run (default: gdb from PATH)"
+    )
+    parser.add_argument(
+        "--startup-profile", action="store_true",
+        help="Log how long loading the MCP SDK, setting up and starting the server took, "
+             "and the time until the first client initialized"
+    )
+    args = parser.parse_args(argv)
+    if args.transport != "stdio" and not args.socket and args.host not in LOOPBACK_HOSTS \
+            and not args.auth_token and not args.allow_unauthenticated:
+        parser.error(f"--host {args.host} is reachable from other machines; set --auth-token "
+                     f"(or ${AUTH_TOKEN_ENV}) or pass --allow-unauthenticated")
+    return args
 
 
 def main():
     """Synchronous wrapper for the async main function."""
-    asyncio.run(async_main())
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO)
+    options = dict(
+        transport=args.transport,
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket,
+        auth_token=args.auth_token,
+        allow_unauthenticated=args.allow_unauthenticated,
+        workers=args.workers,
+        metrics_file=args.metrics_file,
+        metrics_port=args.metrics_port,
+        pool_min_size=args.pool_min,
+        pool_max_size=args.pool_max,
+        templates_per_binary=args.templates_per_binary,
+        cache_dir=args.cache_dir,
+        event_buffer_size=args.event_buffer,
+        output_budget=args.output_budget,
+        journal_dir=args.journal_dir,
+        gdb_path=args.gdb,
+        max_sessions=args.max_sessions,
+        session_memory_mb=args.session_memory,
+        session_cpu_seconds=args.session_cpu,
+        min_available_memory_mb=args.min_available_memory,
+        admission_timeout=args.admission_timeout,
+        cgroup=args.cgroup,
+        startup_profile=args.startup_profile,
+    )
+    try:
+        asyncio.run(async_main(**options))
+    except KeyboardInterrupt:
+        # The normal way to stop a long-lived HTTP server; sessions were closed
+        pass
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Bounded per-session log of asynchronous GDB output."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from .mi_parser import parse_record
+
+
+class EventLog:
+    """Ring buffer of GDB records with increasing sequence numbers.
+
+    Readers keep a cursor (the last sequence number they have seen) and can
+    wait for events past it. When the buffer overflows the oldest events are
+    discarded and readers behind them are told how many they missed.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._next_seq = 1
+        self._waiter: Optional[asyncio.Future] = None
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent event, 0 if none yet."""
+        return self._next_seq - 1
+
+    def append(self, line: str):
+        """Parse and record one line of GDB output."""
+        event = parse_record(line)
+        event["seq"] = self._next_seq
+        event["time"] = time.time()
+        self._next_seq += 1
+        self._events.append(event)
+
+        if self._waiter is not None:
+            if not self._waiter.done():
+                self._waiter.set_result(None)
+            self._waiter = None
+
+    def clear(self):
+        """Discard buffered events and start numbering again from 1.
+
+        Used when the session is recycled for a new client, whose cursors
+        start at 0. Anyone still waiting is woken up.
+        """
+        self._events.clear()
+        self._next_seq = 1
+        if self._waiter is not None:
+            if not self._waiter.done():
+                self._waiter.set_result(None)
+            self._waiter = None
+
+    def read(self, cursor: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """Return up to limit events after cursor."""
+        first_seq = self._events[0]["seq"] if self._events else self._next_seq
+        dropped = max(0, first_seq - cursor - 1)
+        # Sequence numbers are contiguous, so the start index can be computed
+        start = max(0, cursor + 1 - first_seq)
+        events = [self._events[i] for i in range(start, min(len(self._events), start + limit))]
+        return {
+            "events": events,
+            "cursor": events[-1]["seq"] if events else max(cursor, first_seq - 1),
+            "dropped": dropped,
+        }
+
+    async def wait(self, cursor: int, timeout: float) -> bool:
+        """Wait until an event after cursor exists; False on timeout."""
+        if self.last_seq > cursor:
+            return True
+        if timeout <= 0:
+            return False
+        if self._waiter is None:
+            self._waiter = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._waiter), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.last_seq > cursor
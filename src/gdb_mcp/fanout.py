@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Running one command script across many targets in pooled sessions."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .mi_parser import quote
+from .outputs import DEFAULT_OUTPUT_BUDGET, summarize
+from .triage import CORE_LOAD_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# Targets run at once by default
+DEFAULT_PARALLEL = 4
+
+# Default seconds to wait for each script command
+FANOUT_COMMAND_TIMEOUT = 30
+
+
+def _target(entry: Any) -> Dict[str, Any]:
+    """Normalize a target given as a binary path or a dict."""
+    if isinstance(entry, str):
+        entry = {"binary": entry}
+    if not isinstance(entry, dict) or not isinstance(entry.get("binary"), str):
+        raise ValueError(f"Invalid fanout target: {entry!r}")
+    return {**entry, "name": entry.get("name") or entry.get("core") or entry["binary"]}
+
+
+def _command(entry: Any) -> str:
+    """Return the command of a script entry given as a string or a dict."""
+    if isinstance(entry, str):
+        return entry
+    if not isinstance(entry, dict) or not isinstance(entry.get("command"), str):
+        raise ValueError(f"Invalid fanout script entry: {entry!r}")
+    return entry["command"]
+
+
+async def _run_target(
+    manager, target: Dict[str, Any], script: List[Any], stop_on_error: bool, max_output: int
+) -> Dict[str, Any]:
+    """Open a session for one target, run the script and close it again."""
+    start = time.perf_counter()
+    outcome: Dict[str, Any] = {"target": target["name"], "results": []}
+    try:
+        session_id = await manager.create_session(
+            binary=target["binary"], command_timeout=target.get("command_timeout", FANOUT_COMMAND_TIMEOUT)
+        )
+        try:
+            setup = []
+            if target.get("core"):
+                setup.append((f"-target-select core {quote(target['core'])}", CORE_LOAD_TIMEOUT))
+            if target.get("args"):
+                setup.append((f"-exec-arguments {target['args']}", None))
+            for command, timeout in setup:
+                result = (await manager.send_command(session_id, command, timeout))["result"]
+                if result is None or result["status"] == "error":
+                    message = result["message"] if result else "timed out"
+                    raise RuntimeError(f"Failed to prepare target: {message}")
+            # Stored outputs would go away with the session, so the budget is
+            # applied here without a fetch_output handle
+            batch = await manager.run_batch(session_id, script, stop_on_error, 0)
+        finally:
+            await manager.close_session(session_id)
+        for response in batch["results"]:
+            output = response["output"]
+            if max_output and len(output) > max_output:
+                output = summarize(output.split("\n"), max_output)
+            outcome["results"].append({
+                "command": response["command"],
+                "result": response["result"],
+                "output": output,
+                **({"error": response["error"]} if "error" in response else {}),
+            })
+    except Exception as e:
+        logger.error(f"Fanout to {target['name']} failed: {e}")
+        outcome["error"] = str(e)
+    outcome["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return outcome
+
+
+def aggregate(outcomes: List[Dict[str, Any]], commands: List[str]) -> List[Dict[str, Any]]:
+    """Group the targets that got identical responses, command by command.
+
+    Each command lists its distinct responses once ("variants"), most common
+    first, with the targets that produced them.
+    """
+    aggregated = []
+    for index, command in enumerate(commands):
+        variants: Dict[str, Dict[str, Any]] = {}
+        for outcome in outcomes:
+            if index >= len(outcome["results"]):
+                continue
+            response = outcome["results"][index]
+            key = json.dumps([response["result"], response["output"]], sort_keys=True)
+            variant = variants.setdefault(key, {
+                "targets": [],
+                "result": response["result"],
+                "output": response["output"],
+            })
+            variant["targets"].append(outcome["target"])
+        aggregated.append({
+            "command": command,
+            "variants": sorted(variants.values(), key=lambda v: -len(v["targets"])),
+        })
+    return aggregated
+
+
+async def run_fanout(
+    manager,
+    targets: List[Any],
+    script: List[Any],
+    max_parallel: int = DEFAULT_PARALLEL,
+    stop_on_error: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any], int, int], Awaitable[None]]] = None,
+    max_output: int = DEFAULT_OUTPUT_BUDGET,
+) -> Dict[str, Any]:
+    """Run script on every target, a few at a time, and aggregate the results.
+
+    A target is a binary path or a dict with "binary" and optionally "core"
+    (loaded before the script runs), "args" (program arguments), "name" and
+    "command_timeout". Script entries are as for run_batch; each output is
+    cut to its head and tail past max_output characters (0 for no limit),
+    before targets are compared. on_result is
+    awaited with each target's results, the number of targets done and the
+    total, as soon as that target finishes.
+    """
+    start = time.perf_counter()
+    if max_parallel <= 0:
+        raise ValueError("max_parallel must be positive")
+    if not script:
+        raise ValueError("script must contain at least one command")
+    normalized = [_target(t) for t in targets]
+    commands = [_command(entry) for entry in script]
+    semaphore = asyncio.Semaphore(max_parallel)
+    done = 0
+
+    async def run_one(target: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal done
+        async with semaphore:
+            outcome = await _run_target(manager, target, script, stop_on_error, max_output)
+        done += 1
+        if on_result is not None:
+            try:
+                await on_result(outcome, done, len(normalized))
+            except Exception as e:
+                logger.warning(f"Cannot report fanout progress: {e}")
+        return outcome
+
+    outcomes = await asyncio.gather(*(run_one(t) for t in normalized))
+    return {
+        "targets": [
+            {
+                "target": o["target"],
+                "completed": len(o["results"]),
+                **({"error": o["error"]} if "error" in o else {}),
+                "elapsed_ms": o["elapsed_ms"],
+            }
+            for o in outcomes
+        ],
+        "commands": aggregate(outcomes, commands),
+        "failed": sum(1 for o in outcomes if "error" in o),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
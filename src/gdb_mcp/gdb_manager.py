@@ -2,31 +2,235 @@
 """GDB process management for MCP server."""
 
 import asyncio
+import functools
 import logging
+import re
+import shutil
+import time
 import uuid
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+from . import memory, metrics, trace
+from .binary import BinaryKey, binary_key, default_cache_dir
+from .checkpoints import CheckpointState
+from .events import EventLog
+from .journal import JournalWriter, SessionJournal
+from .limits import ResourceLimits, available_memory, describe_exit, process_rss
+from .mi_parser import parse_result_record, quote, split_token
+from .outputs import DEFAULT_OUTPUT_BUDGET, DEFAULT_PAGE_LINES, MAX_STORED_CHARS, OutputStore
+from .pool import LATENCY_WINDOW, GDBProcessPool, percentiles
+from .reader import read_lines
+from .watch import WatchState
 
 logger = logging.getLogger(__name__)
 
 
+# Default seconds to wait for a command's result record before giving up
+COMMAND_TIMEOUT = 5
+
+# Detached commands (see GDBSession.send_command) kept per session
+MAX_DETACHED = 100
+
+# Seconds to wait for a freshly spawned GDB to print its first prompt
+STARTUP_TIMEOUT = 30
+
+# Seconds to wait for symbols of a target binary to load
+SYMBOL_LOAD_TIMEOUT = 600
+
+# Seconds between sweeps for idle sessions and sessions over their limits
+SWEEP_INTERVAL = 5
+
+# Seconds an open waits for a free session slot or host memory by default
+ADMISSION_TIMEOUT = 30
+
+# Closed session IDs whose close reason is remembered for error messages
+MAX_CLOSED_REASONS = 1000
+
+# Characters of output kept per command; the rest is counted but dropped, as
+# no more could be stored for fetch_output anyway
+MAX_COMMAND_OUTPUT = MAX_STORED_CHARS
+
+# Leading characters of MI async records
+ASYNC_RECORD_PREFIXES = ('*', '+', '=')
+
+# Commands that return a used GDB process to a clean state for reuse. Errors
+# are expected (e.g. "kill" without a running inferior) and ignored; only a
+# command that gets no answer at all marks the process as unusable.
+RESET_COMMANDS = [
+    "kill",
+    "-target-detach",
+    "-break-delete",
+    "delete display",
+    "core-file",
+    "-exec-arguments",
+]
+
+# CLI commands (and common abbreviations) whose only lasting effect on GDB is
+# state that reset() undoes: an inferior GDB started, its arguments,
+# breakpoints, displays and the loaded files. Anything else a client runs may
+# change settings, define commands, source scripts, set the environment or
+# working directory, add inferiors and so on, and marks its session as not
+# reusable. So does attaching to an outside process, which reset() would
+# kill (closing the session detaches from it instead), and loading symbols
+# apart from the executable, which a reused template would keep.
+RESETTABLE_COMMANDS = frozenset((
+    "advance", "awatch", "b", "backtrace", "br", "break", "bt", "c",
+    "call", "catch", "clear", "condition", "cont", "continue", "core", "core-file",
+    "delete", "detach", "disable", "disassemble", "display", "down", "echo", "enable",
+    "exec-file", "f", "file", "fin", "finish", "frame", "gcore", "generate-core-file",
+    "help", "i", "ignore", "info", "inspect", "interrupt", "jump", "k", "kill", "l",
+    "list", "n", "next", "nexti", "ni", "output", "p", "print", "printf", "ptype",
+    "pwd", "r", "rbreak", "run", "rwatch", "s", "show", "si", "signal", "start",
+    "starti", "step", "stepi", "tb", "tbreak", "tcatch", "thread",
+    "u", "undisplay", "until", "up", "watch", "where", "whatis", "x",
+))
+
+# The same for MI commands, by prefix
+RESETTABLE_MI_PREFIXES = (
+    "-break-", "-data-", "-exec-", "-file-exec-and-symbols", "-file-exec-file",
+    "-file-list-", "-gdb-show", "-gdb-version", "-list-", "-stack-", "-symbol-",
+    "-target-detach",
+    "-target-select core ", "-thread-", "-var-assign", "-var-delete",
+    "-var-evaluate-expression", "-var-info-", "-var-list-children",
+    "-var-show-", "-var-update",
+)
+
+# "set" commands that only change the inferior or its arguments
+RESETTABLE_SET_COMMANDS = ("set var ", "set variable ", "set args")
+
+# Assignment to a convenience variable (or register), which outlives the inferior
+_CONVENIENCE_ASSIGNMENT_RE = re.compile(
+    r"\$[A-Za-z_]\w*\s*(?:[-+*/%&|^]|<<|>>)?=(?!=)|\$[A-Za-z_]\w*\s*(?:\+\+|--)|(?:\+\+|--)\s*\$[A-Za-z_]"
+)
+
+_CLI_VERB_RE = re.compile(r"[A-Za-z][\w-]*")
+
+# Arguments of enable/disable that only concern breakpoints and displays;
+# others (pretty-printer, frame-filter, unwinder, mem, ...) change GDB itself
+_ENABLE_ARGS_RE = re.compile(r"(?:(?:breakpoints|display|once|count|delete)\b.*|(?:[\d.\s-]|\$\w*)*)")
+
+
+def is_resettable(command: str) -> bool:
+    """Whether reset() undoes everything a client command can change in GDB."""
+    command = command.strip()
+    if _CONVENIENCE_ASSIGNMENT_RE.search(command):
+        return False
+    if command.startswith("-"):
+        return command.startswith(RESETTABLE_MI_PREFIXES)
+    if command.startswith(RESETTABLE_SET_COMMANDS):
+        return True
+    m = _CLI_VERB_RE.match(command)
+    # "thread apply" and "frame apply" run any other command
+    if not m or m.group() not in RESETTABLE_COMMANDS or " apply " in f" {command} ":
+        return False
+    if m.group() in ("enable", "disable"):
+        return bool(_ENABLE_ARGS_RE.fullmatch(command[m.end():].strip()))
+    return True
+
+
+def _batch_entry(entry: Any) -> Tuple[Optional[str], Optional[float], Optional[str]]:
+    """Return the command and timeout of a batch entry, or why it is invalid."""
+    if isinstance(entry, str):
+        return entry, None, None
+    if not isinstance(entry, dict) or not isinstance(entry.get("command"), str):
+        return None, None, f"Invalid batch entry, expected a command string or an object with \"command\": {entry!r}"
+    timeout = entry.get("timeout")
+    if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0):
+        return entry["command"], None, f"Invalid timeout {timeout!r}, expected a positive number of seconds"
+    return entry["command"], timeout, None
+
+
+class _PendingCommand:
+    """A command written to GDB that is still waiting for its result record."""
+    
+    __slots__ = ("token", "command", "lines", "size", "dropped", "future", "sent")
+    
+    def __init__(self, token: int, command: str):
+        self.token = token
+        self.command = command
+        self.lines: List[str] = []
+        # Characters of output so far and lines not kept because of the size
+        self.size = 0
+        self.dropped = 0
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.sent = time.perf_counter()
+        
+    def add(self, line: str):
+        """Keep a line of output, unless the output is over MAX_COMMAND_OUTPUT."""
+        self.size += len(line)
+        if self.size <= MAX_COMMAND_OUTPUT:
+            self.lines.append(line)
+        else:
+            self.dropped += 1
+
+
 class GDBSession:
-    """Represents a single GDB debugging session."""
+    """Represents a single GDB debugging session.
+    
+    Commands are written to GDB prefixed with a numeric MI token and matched
+    back to their callers by the token on the ``NNN^done``/``NNN^error``
+    result record, so several commands may be in flight at once.
+    """
     
-    def __init__(self, session_id: str, timeout: int = 300):
+    def __init__(
+        self,
+        session_id: str,
+        timeout: int = 300,
+        index_cache_dir: Optional[str] = None,
+        event_capacity: int = 1000,
+        gdb_path: str = "gdb",
+        limits: Optional[ResourceLimits] = None,
+    ):
         self.id = session_id
+        self.gdb_path = gdb_path
+        self.limits = limits
+        # Child cgroup of the GDB process when limits use cgroups
+        self.cgroup: Optional[Path] = None
         self.timeout = timeout  # Session idle timeout in seconds
+        self.command_timeout: float = COMMAND_TIMEOUT
         self.created = datetime.now()
         self.last_activity = datetime.now()
         self.process: Optional[asyncio.subprocess.Process] = None
         self.reader_task: Optional[asyncio.Task] = None
         self.timeout_task: Optional[asyncio.Task] = None
-        self.output_queue: asyncio.Queue = asyncio.Queue()
-        self._lock = asyncio.Lock()
+        self._next_token = 1
+        # Commands awaiting a result, in the order they were written to GDB
+        self._pending: Dict[int, _PendingCommand] = {}
+        self._write_lock = asyncio.Lock()
+        # Commands that outlived their deadline, by handle, oldest first
+        self._detached: Dict[str, _PendingCommand] = {}
+        self._ready: Optional[asyncio.Future] = None
+        self.index_cache_dir = index_cache_dir
+        # Binary whose symbols are loaded, if any
+        self.binary_key: Optional[BinaryKey] = None
+        # Async records and output not belonging to any command
+        self.events = EventLog(event_capacity)
+        # Expressions tracked by the watch_state tool
+        self.watch = WatchState(self)
+        # Checkpoints of the inferior and snapshot files owned by the session
+        self.checkpoints = CheckpointState(self)
+        # Full outputs that exceeded the session's output budget
+        self.outputs = OutputStore()
+        # Journal of the client session using the process, when journaling
+        self.journal: Optional[SessionJournal] = None
+        # Whether a client ran a command whose effects reset() can't undo
+        self.dirty = False
+        
+    @property
+    def is_alive(self) -> bool:
+        """Whether the GDB process is running."""
+        return self.process is not None and self.process.returncode is None
+        
+    def exit_reason(self) -> str:
+        """Explain why the GDB process is no longer running."""
+        return describe_exit(self.process.returncode if self.process else None)
         
     async def start(self):
-        """Start the GDB process in MI mode."""
-        cmd = ["gdb", "--interpreter=mi2"]
+        """Start the GDB process in MI mode and wait for its first prompt."""
+        cmd = [self.gdb_path, "--interpreter=mi2"]
             
         logger.info(f"Starting GDB session {self.id} with command: {' '.join(cmd)}")
         
@@ -34,17 +238,39 @@ class GDBSession:
             *cmd,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
         )
+        if self.limits:
+            self.limits.renew(self.process.pid)
+            self.cgroup = self.limits.attach(self.process.pid)
         
         # Start output reader task
+        self._ready = asyncio.get_running_loop().create_future()
         self.reader_task = asyncio.create_task(self._read_output())
         
         # Start timeout monitoring task
         self.timeout_task = asyncio.create_task(self._monitor_timeout())
         
-        # Wait for GDB to initialize
-        await asyncio.sleep(0.1)
+        # Any failure closes the process again, also a cancelled start (e.g.
+        # a pool refill stopped by shutdown), so that no GDB is orphaned
+        try:
+            # GDB is ready to accept commands once it prints its first prompt
+            try:
+                await asyncio.wait_for(asyncio.shield(self._ready), STARTUP_TIMEOUT)
+            except Exception as e:
+                # A timeout has no message of its own
+                raise RuntimeError(f"GDB failed to start: {str(e) or 'no prompt received'}") from e
+                
+            if self.index_cache_dir:
+                # Let GDB persist the DWARF index of loaded binaries. Older GDB
+                # versions only understand "set index-cache on".
+                await self.send_command(f"set index-cache directory {self.index_cache_dir}")
+                response = await self.send_command("set index-cache enabled on")
+                if response["result"] and response["result"]["status"] == "error":
+                    await self.send_command("set index-cache on")
+        except BaseException:
+            await self.close()
+            raise
         
     async def _read_output(self):
         """Read output from GDB process."""
@@ -52,20 +278,76 @@ class GDBSession:
             return
             
         try:
-            while True:
-                line = await self.process.stdout.readline()
-                if not line:
-                    break
-                    
-                decoded = line.decode('utf-8', errors='replace').strip()
-                if decoded:
-                    await self.output_queue.put(decoded)
-                    logger.debug(f"GDB output: {decoded}")
-                    
+            await read_lines(self.process.stdout, self._dispatch_line)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.error(f"Error reading GDB output: {e}")
+        finally:
+            error = RuntimeError("GDB process is not running")
+            if self._ready and not self._ready.done():
+                self._ready.set_exception(error)
+                self._ready.exception()
+            self._fail_pending(error)
+            
+    def _dispatch_line(self, line: str):
+        """Route one line of GDB output to the command it belongs to."""
+        if line == '(gdb)':
+            if self._ready and not self._ready.done():
+                self._ready.set_result(None)
+            return
+            
+        token, record = split_token(line)
+        if record.startswith('^'):
+            if token is not None:
+                pending = self._pending.pop(token, None)
+            else:
+                pending = self._pop_oldest_pending()
+            if pending is None:
+                logger.debug("Unmatched GDB result record: %s", line)
+                return
+            if pending.dropped:
+                pending.lines.append(
+                    f"... [{pending.dropped} more lines of output dropped, over "
+                    f"{MAX_COMMAND_OUTPUT} characters] ..."
+                )
+            metrics.COMMAND_DURATION.observe(time.perf_counter() - pending.sent, metrics.command_verb(pending.command))
+            result = self._parse_mi_result(record)
+            # A parsed record is all in the result; repeating it in the
+            # output would return its payload twice
+            if result["status"] == "unknown":
+                pending.lines.append(line)
+            if self.journal is not None:
+                self.journal.command(pending, result["status"], result.get("message"))
+            if not pending.future.done():
+                pending.future.set_result(result)
+            return
+            
+        # GDB executes commands in order, so any other output belongs to the
+        # oldest command that has not produced its result record yet.
+        pending = next(iter(self._pending.values()), None)
+        if pending is not None:
+            pending.add(line)
+            
+        # Async records (*stopped, =thread-created, ...) are events in their
+        # own right; anything else nobody is waiting for is kept as well.
+        if pending is None or record[:1] in ASYNC_RECORD_PREFIXES:
+            self.events.append(line)
+            
+    def _pop_oldest_pending(self) -> Optional[_PendingCommand]:
+        """Remove and return the oldest command still awaiting a result."""
+        for token in self._pending:
+            return self._pending.pop(token)
+        return None
+        
+    def _fail_pending(self, error: Exception):
+        """Fail every command still waiting for a result."""
+        pending, self._pending = self._pending, {}
+        for command in pending.values():
+            if not command.future.done():
+                command.future.set_exception(error)
+                # Mark the exception as retrieved for abandoned commands
+                command.future.exception()
             
     async def _monitor_timeout(self):
         """Monitor session timeout and close if idle."""
@@ -84,94 +366,164 @@ class GDBSession:
         except Exception as e:
             logger.error(f"Error in timeout monitor: {e}")
     
-    async def send_command(self, command: str) -> Dict[str, Any]:
-        """Send a command to GDB and collect response."""
+    async def send_command(
+        self, command: str, timeout: Optional[float] = None, detach: bool = False
+    ) -> Dict[str, Any]:
+        """Send a command to GDB and collect response.
+        
+        The command is tagged with a fresh MI token and written immediately;
+        it does not wait for earlier commands on this session to finish.
+        If no result arrives within timeout (default: command_timeout), the
+        partial output is returned with a None result. With detach, the
+        command is also kept under a handle so that its complete result can
+        be fetched later with fetch_result. The output is returned as its
+        list of lines ("lines"); OutputStore.limit makes the text of it.
+        """
         if not self.process or self.process.returncode is not None:
             raise RuntimeError("GDB process is not running")
+        if not self.process.stdin:
+            raise RuntimeError("GDB stdin is not available")
             
         # Update last activity time
         self.last_activity = datetime.now()
+        
+        async with self._write_lock:
+            # Register and write under the lock so that the order of
+            # _pending always matches the order GDB sees the commands in
+            token = self._next_token
+            self._next_token += 1
+            pending = _PendingCommand(token, command)
+            self._pending[token] = pending
             
-        async with self._lock:
-            # Clear output queue
-            while not self.output_queue.empty():
-                try:
-                    self.output_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-                    
-            # Send command
-            logger.info(f"Sending command to GDB: {command}")
-            if self.process.stdin:
-                self.process.stdin.write(f"{command}\n".encode())
-                await self.process.stdin.drain()
-            else:
-                raise RuntimeError("GDB stdin is not available")
+            logger.debug("Sending command to GDB: %s", command)
+            data = f"{token}{command}\n".encode()
+            self.process.stdin.write(data)
+            metrics.GDB_INPUT_BYTES.inc(amount=len(data))
+            await self.process.stdin.drain()
             
-            # Collect output
-            output_lines = []
-            result = None
+        result = None
+        try:
+            # Shield the future so a timeout leaves it registered; GDB is
+            # still working on the command and its output must not be
+            # attributed to the next one.
+            result = await asyncio.wait_for(
+                asyncio.shield(pending.future),
+                self.command_timeout if timeout is None else timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out waiting for GDB response to: {command}")
+            metrics.COMMAND_TIMEOUTS.inc(metrics.command_verb(command))
+            if self.journal is not None:
+                self.journal.command(pending, "timeout")
+            if detach:
+                return {
+                    "result": None,
+                    "lines": pending.lines[:],
+                    "pending": self._detach(pending)
+                }
+        except Exception as e:
+            logger.error(f"Error reading GDB response: {e}")
             
-            try:
-                # Wait for response with timeout
-                timeout_task = asyncio.create_task(asyncio.sleep(5))
-                
-                while True:
-                    get_task = asyncio.create_task(self.output_queue.get())
-                    done, pending = await asyncio.wait(
-                        {get_task, timeout_task},
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
-                    
-                    if timeout_task in done:
-                        # Timeout
-                        for task in pending:
-                            task.cancel()
-                        break
-                        
-                    line = await get_task
-                    output_lines.append(line)
-                    
-                    # Check for result record
-                    if line.startswith('^'):
-                        result = self._parse_mi_result(line)
-                        # Continue reading to get (gdb) prompt
-                        
-                    # Check for prompt
-                    if line == '(gdb)':
-                        for task in pending:
-                            task.cancel()
-                        break
-                        
-            except Exception as e:
-                logger.error(f"Error reading GDB response: {e}")
-                
+        # The lines of an unfinished command keep growing, so copy those
+        return {
+            "result": result,
+            "lines": pending.lines if result is not None else pending.lines[:]
+        }
+        
+    def _detach(self, pending: _PendingCommand) -> str:
+        """Keep a timed-out command for fetch_result and return its handle."""
+        handle = str(pending.token)
+        self._detached[handle] = pending
+        while len(self._detached) > MAX_DETACHED:
+            oldest = next(iter(self._detached))
+            logger.warning(f"Discarding unfetched result of: {self._detached.pop(oldest).command}")
+        return handle
+        
+    async def fetch_result(self, handle: str, timeout: float = 0) -> Dict[str, Any]:
+        """Return the result of a detached command, waiting up to timeout.
+        
+        While the command is still running, the response has a None result
+        and the same pending handle.
+        """
+        pending = self._detached.get(handle)
+        if pending is None:
+            raise ValueError(f"Unknown or already fetched result handle: {handle}")
+            
+        self.last_activity = datetime.now()
+        try:
+            result = await asyncio.wait_for(asyncio.shield(pending.future), timeout)
+        except asyncio.TimeoutError:
             return {
-                "result": result,
-                "output": '\n'.join(output_lines)
+                "result": None,
+                "lines": pending.lines[:],
+                "pending": handle
             }
             
-    def _parse_mi_result(self, line: str) -> Dict[str, Any]:
+        del self._detached[handle]
+        return {
+            "result": result,
+            "lines": pending.lines
+        }
+        
+    async def load_binary(self, key: BinaryKey):
+        """Load the executable and symbols of a target binary."""
+        response = await self.send_command(f"-file-exec-and-symbols {quote(key.path)}", SYMBOL_LOAD_TIMEOUT)
+        result = response["result"]
+        if result is None:
+            raise RuntimeError(f"Timed out loading symbols from {key.path}")
+        if result["status"] == "error":
+            raise RuntimeError(f"Failed to load {key.path}: {result['message']}")
+        self.binary_key = key
+        
+    async def reset(self, keep_symbols: bool = False) -> bool:
+        """Return the GDB process to a clean state so it can be reused.
+        
+        With keep_symbols the loaded binary stays loaded, provided it is still
+        the one recorded in binary_key. Returns False if GDB did not answer or
+        the session is dirty, in which case the process should be closed
+        instead of reused.
+        """
+        if not self.is_alive:
+            return False
+        if self.dirty:
+            logger.info(f"Not reusing GDB session {self.id}: a client changed state that can't be reset")
+            return False
+        self.command_timeout = COMMAND_TIMEOUT
+        try:
+            await self.watch.clear()
+            await self.checkpoints.clear()
+            for command in RESET_COMMANDS:
+                response = await self.send_command(command)
+                if response["result"] is None:
+                    return False
+                    
+            if keep_symbols and self.binary_key and await self._loaded_executable() == self.binary_key.path:
+                return True
+            self.binary_key = None
+            response = await self.send_command("-file-exec-and-symbols")
+            if response["result"] is None:
+                return False
+        except Exception as e:
+            logger.warning(f"Failed to reset GDB session {self.id}: {e}")
+            return False
+        finally:
+            self.events.clear()
+            self._detached.clear()
+            self.outputs.clear()
+        return True
+        
+    async def _loaded_executable(self) -> Optional[str]:
+        """Return the path of the executable loaded in the first inferior."""
+        response = await self.send_command("-list-thread-groups")
+        result = response["result"]
+        if not result or result["status"] != "done":
+            return None
+        groups = result["data"].get("groups") or [{}]
+        return groups[0].get("executable")
+        
+    def _parse_mi_result(self, record: str) -> Dict[str, Any]:
         """Parse MI result record."""
-        if line.startswith('^done'):
-            return {"status": "done", "data": line[5:].strip()}
-        elif line.startswith('^running'):
-            return {"status": "running"}
-        elif line.startswith('^connected'):
-            return {"status": "connected"}
-        elif line.startswith('^error'):
-            # Extract error message
-            msg_start = line.find('msg="')
-            if msg_start >= 0:
-                msg_start += 5
-                msg_end = line.find('"', msg_start)
-                if msg_end >= 0:
-                    return {"status": "error", "message": line[msg_start:msg_end]}
-            return {"status": "error", "message": line[6:].strip()}
-        elif line.startswith('^exit'):
-            return {"status": "exit"}
-        else:
-            return {"status": "unknown", "data": line}
+        return parse_result_record(record)
             
     async def close(self):
         """Close the GDB session."""
@@ -205,86 +557,494 @@ class GDBSession:
                     await asyncio.wait_for(self.process.wait(), timeout=2)
                     
             self.process = None
+            
+        if self.limits:
+            self.limits.detach(self.cgroup)
+            self.cgroup = None
+        self.checkpoints.remove_files()
 
 
 class GDBManager:
     """Manages multiple GDB sessions."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        pool_min_size: int = 1,
+        pool_max_size: int = 4,
+        templates_per_binary: int = 2,
+        cache_dir: Optional[str] = None,
+        event_buffer_size: int = 1000,
+        gdb_path: str = "gdb",
+        max_sessions: Optional[int] = None,
+        session_memory_mb: Optional[int] = None,
+        session_cpu_seconds: Optional[int] = None,
+        min_available_memory_mb: Optional[int] = None,
+        admission_timeout: float = ADMISSION_TIMEOUT,
+        cgroup: Optional[str] = None,
+        output_budget: int = DEFAULT_OUTPUT_BUDGET,
+        journal_dir: Optional[str] = None,
+    ):
+        # Session registry. It is only touched from the event loop thread and
+        # never across an await, so lookups, inserts and removals need no
+        # lock; spawning and tearing down GDB happen outside of it entirely.
         self.sessions: Dict[str, GDBSession] = {}
-        self._lock = asyncio.Lock()
+        # Why recently closed sessions were closed, oldest first
+        self._closed: "OrderedDict[str, str]" = OrderedDict()
+        self.max_sessions = max_sessions
+        self.min_available_memory_mb = min_available_memory_mb
+        self.admission_timeout = admission_timeout
+        self.output_budget = output_budget
+        self.limits = ResourceLimits(session_memory_mb, session_cpu_seconds, cgroup)
+        # Opens admitted but not yet registered, and opens waiting for admission
+        self._opening = 0
+        self._waiting = 0
+        # Replaced by a fresh event each time a session slot is freed
+        self._released = asyncio.Event()
         self._cleanup_task: Optional[asyncio.Task] = None
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        index_cache_dir = self.cache_dir / "index-cache"
+        try:
+            index_cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"GDB index cache disabled, cannot create {index_cache_dir}: {e}")
+            index_cache_dir = None
+        self.journal: Optional[JournalWriter] = None
+        if journal_dir:
+            try:
+                self.journal = JournalWriter(Path(journal_dir))
+            except OSError as e:
+                logger.warning(f"Session journals disabled, cannot create {journal_dir}: {e}")
+        self.pool = GDBProcessPool(
+            functools.partial(
+                GDBSession,
+                index_cache_dir=str(index_cache_dir) if index_cache_dir else None,
+                event_capacity=event_buffer_size,
+                gdb_path=gdb_path,
+                limits=self.limits,
+            ),
+            pool_min_size,
+            pool_max_size,
+            template_size=templates_per_binary,
+        )
+        self._open_latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        metrics.SESSIONS.set_function(lambda: len(self.sessions))
+        metrics.PENDING_COMMANDS.set_function(lambda: sum(len(s._pending) for s in self.sessions.values()))
+        metrics.WAITING_OPENS.set_function(lambda: self._waiting)
+        metrics.IDLE_PROCESSES.set_function(self.pool.idle_count)
         
     async def start(self):
-        """Start the GDB manager."""
+        """Start the GDB manager.
+        
+        No GDB process is started yet, so that startup stays fast; the pool
+        is filled in the background after the first open.
+        """
         self._cleanup_task = asyncio.create_task(self._cleanup_timed_out_sessions())
         
     async def _cleanup_timed_out_sessions(self):
-        """Periodically check and clean up timed out sessions."""
+        """Periodically close idle sessions and evict those over their limits."""
         try:
             while True:
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(SWEEP_INTERVAL)
                 
-                async with self._lock:
-                    timed_out = []
-                    for session_id, session in self.sessions.items():
-                        idle_time = (datetime.now() - session.last_activity).total_seconds()
-                        if idle_time > session.timeout:
-                            timed_out.append(session_id)
-                            
-                # Close timed out sessions outside the lock
-                for session_id in timed_out:
+                now = datetime.now()
+                memory_limit = self.limits.memory_bytes
+                for session_id, session in list(self.sessions.items()):
                     try:
-                        logger.info(f"Cleaning up timed out session: {session_id}")
-                        await self.close_session(session_id)
+                        if not session.is_alive:
+                            await self._evict(session_id, session.exit_reason())
+                        elif (now - session.last_activity).total_seconds() > session.timeout:
+                            logger.info(f"Cleaning up timed out session: {session_id}")
+                            self._forget(session_id, f"idle for more than {session.timeout} seconds")
+                            self.pool.release_nowait(session)
+                        elif memory_limit:
+                            rss = process_rss(session.process.pid)
+                            if rss is not None and rss > memory_limit:
+                                await self._evict(
+                                    session_id,
+                                    f"GDB used {rss // (1024 * 1024)} MiB, over the "
+                                    f"{self.limits.memory_mb} MiB session memory limit",
+                                )
                     except Exception as e:
                         logger.error(f"Error cleaning up session {session_id}: {e}")
                         
         except asyncio.CancelledError:
             pass
+            
+    def _forget(self, session_id: str, reason: str):
+        """Unregister a session, remembering why it was closed."""
+        session = self.sessions.pop(session_id, None)
+        if session is not None and session.journal is not None:
+            session.journal.close(reason)
+            session.journal = None
+        self._closed[session_id] = reason
+        while len(self._closed) > MAX_CLOSED_REASONS:
+            self._closed.popitem(last=False)
+        self._released.set()
+        self._released = asyncio.Event()
+        
+    async def _evict(self, session_id: str, reason: str):
+        """Close a session whose GDB process must not be reused."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return
+        logger.warning(f"Evicting session {session_id}: {reason}")
+        self._forget(session_id, reason)
+        await session.close()
+        
+    def _admission_blocker(self) -> Optional[str]:
+        """Return why a new session can't be opened now, or None."""
+        if self.max_sessions and len(self.sessions) + self._opening >= self.max_sessions:
+            return f"{self.max_sessions} sessions are already open (server limit)"
+        if self.min_available_memory_mb:
+            available = available_memory()
+            if available is not None and available < self.min_available_memory_mb * 1024 * 1024:
+                return (
+                    f"host memory is low ({available // (1024 * 1024)} MiB available, "
+                    f"{self.min_available_memory_mb} MiB required)"
+                )
+        return None
+        
+    async def _admit(self):
+        """Wait until a session may be opened, up to admission_timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.admission_timeout
+        self._waiting += 1
+        try:
+            while True:
+                blocker = self._admission_blocker()
+                if blocker is None:
+                    return
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise RuntimeError(f"Cannot open a session: {blocker}")
+                # Memory may free up without any session closing, so poll too
+                try:
+                    await asyncio.wait_for(self._released.wait(), min(remaining, 1))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiting -= 1
         
-    async def create_session(self, timeout: int = 300) -> str:
-        """Create a new GDB session."""
-        session_id = str(uuid.uuid4())
+    async def create_session(
+        self,
+        timeout: int = 300,
+        binary: Optional[str] = None,
+        command_timeout: float = COMMAND_TIMEOUT,
+        output_budget: Optional[int] = None,
+    ) -> str:
+        """Create a new GDB session from a pooled GDB process.
         
-        async with self._lock:
-            session = GDBSession(session_id, timeout)
-            await session.start()
-            self.sessions[session_id] = session
+        If binary is given, the session starts with its symbols loaded,
+        reusing an idle session that already has them when possible.
+        output_budget (default: the server's) caps the output returned per
+        command; see OutputStore.
+        While the session limit is reached or host memory is low, the open
+        waits up to admission_timeout seconds and then fails.
+        """
+        start = time.perf_counter()
+        key = binary_key(binary) if binary else None
+        
+        await self._admit()
+        self._opening += 1
+        try:
+            # Spawning may take a while on a pool miss; other sessions are unaffected
+            session = await self.pool.acquire(key)
+            if key is not None and session.binary_key != key:
+                try:
+                    await session.load_binary(key)
+                except BaseException:
+                    # Also on cancellation, or the process would belong to no one
+                    self.pool.release_nowait(session)
+                    raise
+            self.limits.renew(session.process.pid)
+            
+            # Recycled processes get a fresh ID so stale IDs can't reach them
+            session.id = str(uuid.uuid4())
+            session.timeout = timeout
+            session.command_timeout = command_timeout
+            session.outputs.budget = self.output_budget if output_budget is None else output_budget
+            session.created = session.last_activity = datetime.now()
             
-        logger.info(f"Created GDB session: {session_id}")
-        return session_id
-        
-    async def send_command(self, session_id: str, command: str) -> Dict[str, Any]:
-        """Send command to a specific session."""
-        async with self._lock:
-            session = self.sessions.get(session_id)
-            if not session:
-                raise ValueError(f"Session not found: {session_id}")
+            self.sessions[session.id] = session
+            if self.journal is not None:
+                session.journal = self.journal.open(
+                    session.id, binary=key.path if key else None, command_timeout=command_timeout
+                )
+        finally:
+            self._opening -= 1
+            
+        self._open_latencies.append(time.perf_counter() - start)
+        logger.info(f"Created GDB session: {session.id}")
+        return session.id
+        
+    def _get_session(self, session_id: str) -> GDBSession:
+        """Look up a session by ID."""
+        session = self.sessions.get(session_id)
+        if not session:
+            if session_id in self._closed:
+                raise ValueError(f"Session {session_id} was closed: {self._closed[session_id]}")
+            raise ValueError(f"Session not found: {session_id}")
+        if not session.is_alive:
+            reason = session.exit_reason()
+            self._forget(session_id, reason)
+            self.pool.release_nowait(session)
+            raise ValueError(f"Session {session_id} was closed: {reason}")
+        return session
+            
+    async def send_command(
+        self,
+        session_id: str,
+        command: str,
+        timeout: Optional[float] = None,
+        detach: bool = False,
+        max_output: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Send command to a specific session.
+        
+        Output longer than max_output (default: the session's output budget,
+        0 for no limit) is summarized and stored for fetch_output.
+        """
+        session = self._get_session(session_id)
+        session.dirty = session.dirty or not is_resettable(command)
+        response = await session.send_command(command, timeout, detach)
+        return session.outputs.limit(response, command, max_output)
+        
+    async def fetch_result(
+        self, session_id: str, handle: str, timeout: float = 0, max_output: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Fetch the result of a command that was detached on timeout."""
+        session = self._get_session(session_id)
+        pending = session._detached.get(handle)
+        response = await session.fetch_result(handle, timeout)
+        return session.outputs.limit(response, pending.command, max_output)
+        
+    async def fetch_output(
+        self,
+        session_id: str,
+        handle: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_LINES,
+        grep: Optional[str] = None,
+        ignore_case: bool = False,
+    ) -> Dict[str, Any]:
+        """Page or search through an output that exceeded the output budget."""
+        session = self._get_session(session_id)
+        session.last_activity = datetime.now()
+        return session.outputs.fetch(handle, offset, limit, grep, ignore_case)
+        
+    async def run_batch(
+        self,
+        session_id: str,
+        commands: List[Any],
+        stop_on_error: bool = False,
+        max_output: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run a list of commands on a session and collect all results.
+        
+        Each entry is a command string or a dict with "command" and an
+        optional "timeout". Without stop_on_error the commands are pipelined;
+        with it they run one at a time and the batch stops at the first error
+        or timeout. max_output applies to each command as for send_command.
+        An invalid entry is not sent; its result is None and "error" says
+        what is wrong with it (with stop_on_error, the batch stops there).
+        """
+        session = self._get_session(session_id)
+        entries = [_batch_entry(entry) for entry in commands]
                 
-        return await session.send_command(command)
+        async def run(command: Optional[str], timeout: Optional[float], error: Optional[str]) -> Dict[str, Any]:
+            if error is not None:
+                return {"result": None, "output": "", "error": error, "command": command, "elapsed_ms": 0.0}
+            start = time.perf_counter()
+            session.dirty = session.dirty or not is_resettable(command)
+            response = session.outputs.limit(await session.send_command(command, timeout), command, max_output)
+            response["command"] = command
+            response["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            return response
+            
+        start = time.perf_counter()
+        if stop_on_error:
+            results = []
+            for entry in entries:
+                response = await run(*entry)
+                results.append(response)
+                result = response["result"]
+                if result is None or result["status"] == "error":
+                    break
+        else:
+            results = list(await asyncio.gather(*(run(*entry) for entry in entries)))
+            
+        return {
+            "results": results,
+            "completed": len(results),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        
+    async def read_memory(self, session_id: str, address: str, length: int, **options) -> Dict[str, Any]:
+        """Read a page of target memory from a session as base64."""
+        session = self._get_session(session_id)
+        return await memory.read_memory(session, address, length, **options)
+        
+    async def find_memory(self, session_id: str, address: str, length: int, **options) -> Dict[str, Any]:
+        """Search target memory of a session for a byte pattern."""
+        session = self._get_session(session_id)
+        return await memory.find_memory(session, address, length, **options)
+        
+    async def watch_state(
+        self,
+        session_id: str,
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None,
+        clear: bool = False,
+    ) -> Dict[str, Any]:
+        """Update a session's watched expressions and return what changed.
+        
+        Values of newly added expressions are always reported; previously
+        added ones only when they changed since the last call.
+        """
+        session = self._get_session(session_id)
+        if clear:
+            await session.watch.clear()
+        if remove:
+            await session.watch.remove(remove)
+        changed = await session.watch.update()
+        added = await session.watch.add(add or [])
+        return {
+            "changed": changed + added["values"],
+            "errors": added["errors"],
+            "watching": len(session.watch),
+        }
+        
+    async def trace_until(self, session_id: str, breakpoints: List[Any], **options) -> Dict[str, Any]:
+        """Run a session's program through breakpoint hits, collecting values (see trace.trace_until)."""
+        session = self._get_session(session_id)
+        return await trace.trace_until(session, breakpoints, **options)
+        
+    async def checkpoint(self, session_id: str, delete: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Checkpoint a session's inferior where it is stopped.
+
+        With delete, the named checkpoints are deleted instead of a new one
+        being taken. The session's remaining checkpoints are returned.
+        """
+        session = self._get_session(session_id)
+        for name in delete or []:
+            await session.checkpoints.delete(name)
+        created = None if delete else await session.checkpoints.create()
+        return {"created": created, "checkpoints": session.checkpoints.list()}
+        
+    async def restore_checkpoint(self, session_id: str, checkpoint: str) -> Dict[str, Any]:
+        """Return a session's inferior to one of its checkpoints."""
+        session = self._get_session(session_id)
+        return await session.checkpoints.restore(checkpoint)
+        
+    async def clone_session(self, session_id: str, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Open a new session holding a snapshot of a session's stopped inferior.
+        
+        GDB's checkpoints are forks of one GDB process and can't move to
+        another, so the clone loads a core file of the inferior written with
+        gcore, together with the source session's breakpoints. The clone can
+        inspect the stop (memory, frames, variables) independently, but not
+        resume execution.
+        """
+        session = self._get_session(session_id)
+        executable = session.binary_key.path if session.binary_key else await session._loaded_executable()
+        if not executable:
+            raise ValueError(f"Session {session_id} has no program loaded")
+        core, breakpoints = await session.checkpoints.snapshot()
+        try:
+            clone_id = await self.create_session(
+                timeout or session.timeout, executable, session.command_timeout,
+                output_budget=session.outputs.budget,
+            )
+        except BaseException:
+            shutil.rmtree(core.parent, ignore_errors=True)
+            raise
+        clone = self.sessions[clone_id]
+        clone.checkpoints.adopt(core.parent)
+        try:
+            for command, what in [
+                (f"-target-select core {quote(str(core))}", "loading the snapshot"),
+                (f"source {breakpoints}", "restoring breakpoints"),
+            ]:
+                result = (await clone.send_command(command, SYMBOL_LOAD_TIMEOUT))["result"]
+                if result is None or result["status"] == "error":
+                    message = result["message"] if result else "timed out"
+                    raise RuntimeError(f"Failed {what} in the clone: {message}")
+        except BaseException:
+            await self.close_session(clone_id)
+            raise
+        logger.info(f"Cloned GDB session {session_id} into {clone_id}")
+        return {"id": clone_id, "core": str(core)}
+        
+    async def get_events(
+        self, session_id: str, cursor: int = 0, timeout: float = 0, limit: int = 100
+    ) -> Dict[str, Any]:
+        """Return a session's events after cursor, waiting up to timeout for one."""
+        session = self._get_session(session_id)
+        session.last_activity = datetime.now()
+        await session.events.wait(cursor, timeout)
+        return session.events.read(cursor, limit)
         
     async def close_session(self, session_id: str):
         """Close a specific session."""
-        async with self._lock:
-            session = self.sessions.pop(session_id, None)
-            if not session:
-                raise ValueError(f"Session not found: {session_id}")
-                
-        await session.close()
+        session = self._get_session(session_id)
+        self._forget(session_id, "closed by the client")
+        
+        # The process is reset and returned to the pool in the background
+        self.pool.release_nowait(session)
         logger.info(f"Closed GDB session: {session_id}")
         
+    async def attach_session(self, session_id: str) -> Dict[str, Any]:
+        """Describe a session so that a new client can pick up where another left off.
+        
+        Also counts as activity, restarting the session's idle timeout.
+        """
+        session = self._get_session(session_id)
+        session.last_activity = datetime.now()
+        return {
+            **self._describe(session),
+            "command_timeout": session.command_timeout,
+            "output_budget": session.outputs.budget,
+            "event_cursor": session.events.last_seq,
+            "pending": list(session._detached),
+            "checkpoints": session.checkpoints.list(),
+            "watching": len(session.watch),
+        }
+        
+    async def describe_session(self, session_id: str) -> Dict[str, Any]:
+        """Describe a session as list_sessions does, without counting as activity."""
+        return self._describe(self._get_session(session_id))
+        
+    def _describe(self, session: GDBSession) -> Dict[str, Any]:
+        return {
+            "id": session.id,
+            "binary": session.binary_key.path if session.binary_key else None,
+            "created": session.created.isoformat(),
+            "last_activity": session.last_activity.isoformat(),
+            "timeout": session.timeout,
+        }
+        
     async def list_sessions(self) -> list:
         """List all active sessions."""
-        async with self._lock:
-            return [
-                {
-                    "id": session.id,
-                    "created": session.created.isoformat()
-                }
-                for session in self.sessions.values()
-            ]
+        return [self._describe(session) for session in self.sessions.values()]
             
+    def metrics_snapshot(self) -> metrics.Snapshot:
+        """Return the metrics of this process (see metrics.render)."""
+        return metrics.REGISTRY.snapshot()
+        
+    def stats(self) -> Dict[str, Any]:
+        """Return session counts, limits, pool statistics and open latencies."""
+        return {
+            "sessions": len(self.sessions),
+            "waiting_opens": self._waiting,
+            "open_latency_ms": percentiles(self._open_latencies),
+            "limits": {
+                "max_sessions": self.max_sessions,
+                "min_available_memory_mb": self.min_available_memory_mb,
+                **self.limits.to_dict(),
+            },
+            "pool": self.pool.stats(),
+        }
+        
     async def cleanup(self):
         """Clean up all sessions."""
         # Cancel cleanup task
@@ -295,11 +1055,17 @@ class GDBManager:
             except asyncio.CancelledError:
                 pass
                 
-        async with self._lock:
-            session_ids = list(self.sessions.keys())
-            
-        for session_id in session_ids:
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        
+        for session in sessions:
+            if session.journal is not None:
+                session.journal.close("server shut down")
             try:
-                await self.close_session(session_id)
+                await session.close()
             except Exception as e:
-                logger.error(f"Error closing session {session_id}: {e}")
\ No newline at end of file
+                logger.error(f"Error closing session {session.id}: {e}")
+                
+        await self.pool.close()
+        if self.journal is not None:
+            await asyncio.to_thread(self.journal.close)
\ No newline at end of file
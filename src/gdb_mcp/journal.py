@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Append-only JSONL journals of the commands run in each session."""
+
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the writer to drain the queue on shutdown
+WRITER_STOP_TIMEOUT = 10
+
+
+class SessionJournal:
+    """The journal of one session; see JournalWriter for the file format."""
+
+    __slots__ = ("path", "_put")
+
+    def __init__(self, path: Path, put):
+        self.path = path
+        self._put = put
+
+    def command(self, pending, status: str, message: Optional[str] = None):
+        """Record a command once it has a result (or timed out).
+
+        Called on the event loop for every command, so this only queues the
+        raw values. The output size is taken here, since the loop may still
+        add lines (of a timed-out command) while the writer formats it.
+        """
+        self._put((self.path, (
+            time.time(), time.perf_counter() - pending.sent, pending.token, pending.command,
+            status, message, len(pending.lines) + pending.dropped, pending.size,
+        )))
+
+    def event(self, kind: str, **fields: Any):
+        self._put((self.path, {"t": round(time.time(), 6), "event": kind, **fields}))
+
+    def close(self, reason: str):
+        self.event("close", reason=reason)
+
+
+class JournalWriter:
+    """Writes the journals of all sessions of a manager from one thread.
+
+    Each session gets ``<directory>/<session id>.jsonl``: an ``open`` record,
+    one record per command, and a ``close`` record. A command record holds
+    the wall-clock time the command was sent (``t``), its MI token, the
+    command, its latency, result status (``done``, ``running``, ``error``
+    with ``message``, ``timeout``, ...) and the number of output lines and
+    characters. Records are written in the order results arrive; the token
+    gives the order the commands were sent in.
+
+    Recording only appends to a queue, so the event loop never waits for
+    the disk; the thread encodes and writes whatever has queued up and
+    flushes after each batch.
+    """
+
+    def __init__(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="gdb-mcp-journal", daemon=True)
+        self._thread.start()
+
+    def open(self, session_id: str, **fields: Any) -> SessionJournal:
+        """Start the journal of a session with an open record."""
+        journal = SessionJournal(self.directory / f"{session_id}.jsonl", self._queue.put)
+        journal.event("open", session=session_id, **fields)
+        return journal
+
+    def close(self):
+        """Write everything queued so far and stop the thread."""
+        self._queue.put(None)
+        self._thread.join(WRITER_STOP_TIMEOUT)
+
+    @staticmethod
+    def _format(record: Any) -> str:
+        """Encode a record as one JSON line."""
+        if isinstance(record, dict):
+            return json.dumps(record, separators=(",", ":")) + "\n"
+        now, latency, token, command, status, message, lines, chars = record
+        # Written by hand: this runs for every command and json.dumps of a
+        # dict costs several times more
+        extra = f',"message":{json.dumps(message)}' if message is not None else ""
+        return (
+            f'{{"t":{now - latency:.6f},"token":{token},"command":{json.dumps(command)},'
+            f'"latency_ms":{latency * 1000:.3f},"status":{json.dumps(status)},'
+            f'"lines":{lines},"chars":{chars}{extra}}}\n'
+        )
+
+    def _run(self):
+        files: Dict[Path, IO[str]] = {}
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Lines per journal, and the journals closed by this batch
+            chunks: Dict[Path, List[str]] = {}
+            closed = set()
+            for item in batch:
+                if item is None:
+                    stopping = True
+                    continue
+                path, record = item
+                try:
+                    chunks.setdefault(path, []).append(self._format(record))
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Cannot encode journal record of {path}: {e}")
+                if isinstance(record, dict) and record.get("event") == "close":
+                    closed.add(path)
+            for path, lines in chunks.items():
+                try:
+                    f = files.get(path)
+                    if f is None:
+                        f = files[path] = open(path, "a", encoding="utf-8")
+                    f.write("".join(lines))
+                    f.flush()
+                except OSError as e:
+                    logger.warning(f"Cannot write journal {path}: {e}")
+                if path in closed and path in files:
+                    files.pop(path).close()
+        for f in files.values():
+            f.close()
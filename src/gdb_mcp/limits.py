@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Resource limits of GDB processes and host memory checks for admission."""
+
+import logging
+import os
+import resource
+import signal
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_MIB = 1024 * 1024
+
+
+def available_memory() -> Optional[int]:
+    """Return the host's MemAvailable in bytes, or None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def process_rss(pid: int) -> Optional[int]:
+    """Return the resident set size of a process in bytes, or None if unknown."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def process_cpu_time(pid: int) -> Optional[float]:
+    """Return the user plus system CPU seconds used by a process."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # Fields after the parenthesized command name; utime and stime
+            # are fields 14 and 15 of the whole line
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def describe_exit(returncode: Optional[int]) -> str:
+    """Explain why a GDB process exited, for messages to the client."""
+    if returncode is None:
+        return "GDB is not running"
+    if returncode == -signal.SIGXCPU:
+        return "GDB exceeded its CPU time limit"
+    if returncode == -signal.SIGKILL:
+        return "GDB was killed (SIGKILL), e.g. by the memory limit or the OOM killer"
+    if returncode < 0:
+        try:
+            return f"GDB was killed by {signal.Signals(-returncode).name}"
+        except ValueError:
+            return f"GDB was killed by signal {-returncode}"
+    return f"GDB exited with code {returncode}"
+
+
+class ResourceLimits:
+    """Limits applied to every GDB process of the server.
+
+    ``memory_mb`` caps the resident memory of a GDB process. The manager
+    enforces it by checking RSS periodically and evicting sessions above
+    it. If ``cgroup`` names a delegated cgroup v2 directory, every GDB process
+    and its inferiors are also placed in their own child cgroup whose
+    ``memory.max`` lets the kernel enforce the cap. ``cpu_seconds`` caps the
+    CPU time of each session with RLIMIT_CPU, renewed whenever a pooled
+    process is handed to a new session.
+    """
+
+    def __init__(
+        self,
+        memory_mb: Optional[int] = None,
+        cpu_seconds: Optional[int] = None,
+        cgroup: Optional[str] = None,
+    ):
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        self.cgroup = Path(cgroup) if cgroup else None
+        if self.cgroup and memory_mb:
+            try:
+                (self.cgroup / "cgroup.subtree_control").write_text("+memory")
+            except OSError as e:
+                logger.warning(f"Cannot enable the memory controller in {self.cgroup}: {e}")
+
+    @property
+    def memory_bytes(self) -> Optional[int]:
+        return self.memory_mb * _MIB if self.memory_mb else None
+
+    def renew(self, pid: int):
+        """Give a new or reused GDB process a full CPU time budget.
+
+        The limit is set from outside with prlimit rather than in a
+        preexec_fn, which is unsafe with other threads running and keeps
+        the subprocess module from using vfork. Only the soft limit is set,
+        so that it can be raised again for reuse.
+        """
+        if not self.cpu_seconds:
+            return
+        used = process_cpu_time(pid) or 0
+        try:
+            resource.prlimit(pid, resource.RLIMIT_CPU, (int(used) + self.cpu_seconds, resource.RLIM_INFINITY))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot renew the CPU limit of GDB process {pid}: {e}")
+
+    def attach(self, pid: int) -> Optional[Path]:
+        """Move a GDB process into its own child cgroup; returns its path."""
+        if not self.cgroup:
+            return None
+        path = self.cgroup / f"gdb-{pid}"
+        try:
+            path.mkdir(exist_ok=True)
+            if self.memory_mb:
+                (path / "memory.max").write_text(str(self.memory_bytes))
+            (path / "cgroup.procs").write_text(str(pid))
+        except OSError as e:
+            logger.warning(f"Cannot place GDB process {pid} in cgroup {path}: {e}")
+            return None
+        return path
+
+    def detach(self, path: Optional[Path]):
+        """Remove a child cgroup, killing inferiors left in it."""
+        if path is None:
+            return
+        try:
+            kill = path / "cgroup.kill"
+            if kill.exists():
+                kill.write_text("1")
+            path.rmdir()
+        except OSError as e:
+            logger.warning(f"Cannot remove cgroup {path}: {e}")
+
+    def to_dict(self):
+        return {
+            "session_memory_mb": self.memory_mb,
+            "session_cpu_seconds": self.cpu_seconds,
+            "cgroup": str(self.cgroup) if self.cgroup else None,
+        }
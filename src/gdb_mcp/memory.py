@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Bulk target memory reads and searches."""
+
+import asyncio
+import base64
+import re
+from typing import Any, Dict, List, Optional
+
+from .mi_parser import parse_record, quote, result_data
+
+# Bytes requested per -data-read-memory-bytes command. Each byte becomes two
+# hex digits on a single MI line; lines have no size limit, but smaller
+# chunks let GDB start answering while later ones are still being read.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Bytes returned by one read_memory call; larger ranges are paginated
+DEFAULT_PAGE_SIZE = 1024 * 1024
+
+# Seconds to wait for one chunk or search
+MEMORY_TIMEOUT = 30
+
+_ADDRESS_RE = re.compile(r'^(0x[0-9a-fA-F]+)')
+
+
+async def evaluate_address(session, address: str) -> int:
+    """Evaluate an address expression to an integer."""
+    data = result_data(
+        await session.send_command(f"-data-evaluate-expression {quote(f'(unsigned long long)({address})')}"),
+        f"evaluating address {address}",
+    )
+    try:
+        return int(data["value"].split()[0], 0)
+    except (KeyError, ValueError):
+        raise RuntimeError(f"Address expression did not evaluate to a number: {address}")
+
+
+async def read_memory(
+    session,
+    address: str,
+    length: int,
+    offset: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Read target memory as base64, one page at a time.
+
+    Reads length bytes starting at address + offset, but at most page_size
+    bytes per call; ``next_offset`` tells the caller where to continue.
+    Chunks of a page are requested from GDB in parallel. Bytes that could not
+    be read are returned as zeros and listed in ``unreadable``.
+    """
+    if length < 0 or offset < 0 or page_size <= 0 or chunk_size <= 0:
+        raise ValueError("length and offset must be non-negative, page_size and chunk_size positive")
+
+    base = await evaluate_address(session, address)
+    start = base + min(offset, length)
+    size = min(page_size, length - min(offset, length))
+
+    async def read_chunk(chunk_start: int, chunk_len: int) -> List[Dict[str, Any]]:
+        response = await session.send_command(
+            f"-data-read-memory-bytes 0x{chunk_start:x} {chunk_len}", MEMORY_TIMEOUT
+        )
+        result = response["result"]
+        if result is None:
+            raise RuntimeError(f"Timed out reading memory at 0x{chunk_start:x}")
+        if result["status"] == "error":
+            return []
+        return result["data"].get("memory", [])
+
+    chunks = [(pos, min(chunk_size, start + size - pos)) for pos in range(start, start + size, chunk_size)]
+    blocks = await asyncio.gather(*(read_chunk(pos, n) for pos, n in chunks))
+
+    data = bytearray(size)
+    covered = []
+    for block in (b for chunk_blocks in blocks for b in chunk_blocks):
+        begin = int(block["begin"], 16)
+        contents = bytes.fromhex(block["contents"])
+        data[begin - start:begin - start + len(contents)] = contents
+        covered.append((begin, begin + len(contents)))
+
+    unreadable = []
+    pos = start
+    for begin, end in sorted(covered):
+        if begin > pos:
+            unreadable.append({"begin": f"0x{pos:x}", "end": f"0x{begin:x}"})
+        pos = max(pos, end)
+    if pos < start + size:
+        unreadable.append({"begin": f"0x{pos:x}", "end": f"0x{start + size:x}"})
+    if size and not covered:
+        raise RuntimeError(f"Cannot access memory at 0x{start:x}")
+
+    end_offset = offset + size
+    return {
+        "address": f"0x{start:x}",
+        "offset": offset,
+        "length": size,
+        "encoding": "base64",
+        "data": base64.b64encode(data).decode("ascii"),
+        "unreadable": unreadable,
+        "next_offset": end_offset if end_offset < length else None,
+    }
+
+
+async def find_memory(
+    session,
+    address: str,
+    length: int,
+    pattern: Optional[str] = None,
+    text: Optional[str] = None,
+    max_count: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Search target memory with GDB's find command.
+
+    The pattern is either hex bytes (``pattern``, e.g. "deadbeef") or a
+    string (``text``); only the matching addresses are returned.
+    """
+    if (pattern is None) == (text is None):
+        raise ValueError("Exactly one of pattern or text is required")
+    if text is not None:
+        needle = text.encode("utf-8")
+    else:
+        try:
+            needle = bytes.fromhex(pattern)
+        except ValueError:
+            raise ValueError(f"Invalid hex pattern: {pattern}")
+    if not needle:
+        raise ValueError("Search pattern is empty")
+    if length <= 0:
+        raise ValueError("length must be positive")
+
+    start = await evaluate_address(session, address)
+    flags = f"/b{max_count}" if max_count else "/b"
+    values = ", ".join(f"0x{b:02x}" for b in needle)
+    response = await session.send_command(
+        f"find {flags} 0x{start:x}, +{length}, {values}", MEMORY_TIMEOUT
+    )
+    result_data(response, "searching memory")
+
+    matches = []
+    for line in response["lines"]:
+        record = parse_record(line)
+        if record["type"] == "console":
+            m = _ADDRESS_RE.match(record["payload"])
+            if m:
+                matches.append(m.group(1))
+    return {"address": f"0x{start:x}", "length": length, "matches": matches}
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Process-wide counters, gauges and histograms in OpenMetrics format."""
+
+import asyncio
+import bisect
+import logging
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Label sets kept per metric; further ones are folded into "other"
+MAX_SERIES = 200
+
+# Default latency buckets in seconds, from 100 µs to 10 minutes
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600,
+)
+
+# Seconds between writes of the metrics file
+FILE_INTERVAL = 10
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+Snapshot = List[Tuple[str, str, str, Tuple[str, ...], Dict[Tuple[str, ...], Any]]]
+
+
+class _Metric:
+    """Base of all metric types: a name, help text and values per label set."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Tuple[str, ...]) -> Tuple[str, ...]:
+        if labels in self._values or len(self._values) < MAX_SERIES:
+            return labels
+        return ("other",) * len(labels)
+
+    def samples(self) -> Dict[Tuple[str, ...], Any]:
+        return dict(self._values)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Current value, either set directly or read from a function."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, *labels: str):
+        self._values[self._key(labels)] = value
+
+    def set_function(self, function: Optional[Callable[[], float]]):
+        """Read the (unlabelled) value from function whenever rendered."""
+        self._function = function
+
+    def samples(self) -> Dict[Tuple[str, ...], Any]:
+        if self._function is not None:
+            try:
+                return {(): self._function()}
+            except Exception as e:
+                logger.warning(f"Cannot read gauge {self.name}: {e}")
+                return {}
+        return dict(self._values)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str):
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            # Per-bucket (not cumulative) counts, then sum and count
+            state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        state[0][bisect.bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def samples(self) -> Dict[Tuple[str, ...], Any]:
+        return {key: (list(counts), total, count) for key, (counts, total, count) in self._values.items()}
+
+
+class Registry:
+    """Collection of the metrics of one process."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> Any:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames))
+
+    def snapshot(self) -> Snapshot:
+        """Return the current values as plain (picklable) data."""
+        result = []
+        for m in self._metrics.values():
+            samples = m.samples()
+            if m.type == "histogram":
+                samples = {"buckets": m.buckets, "values": samples}
+            result.append((m.name, m.type, m.documentation, m.labelnames, samples))
+        return result
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: Dict[str, str], le: Optional[str] = None) -> str:
+    pairs = [f'{k}="{_escape(str(v))}"' for k, v in extra.items()]
+    pairs += [f'{k}="{_escape(str(v))}"' for k, v in zip(names, values)]
+    if le is not None:
+        pairs.append(f'le="{le}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(snapshots: List[Tuple[Dict[str, str], Snapshot]]) -> str:
+    """Render snapshots as OpenMetrics text.
+
+    Each snapshot comes with constant labels (e.g. the worker it came from);
+    families of the same name are merged under one header.
+    """
+    families: Dict[str, List[Any]] = {}
+    for extra, snapshot in snapshots:
+        for name, kind, documentation, labelnames, samples in snapshot:
+            family = families.setdefault(name, [kind, documentation, labelnames, []])
+            family[3].append((extra, samples))
+
+    lines = []
+    for name, (kind, documentation, labelnames, sources) in families.items():
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {_escape(documentation)}")
+        for extra, samples in sources:
+            if kind == "counter":
+                for values, value in samples.items():
+                    lines.append(f"{name}_total{_labels(labelnames, values, extra)} {_number(value)}")
+            elif kind == "gauge":
+                for values, value in samples.items():
+                    lines.append(f"{name}{_labels(labelnames, values, extra)} {_number(value)}")
+            else:
+                bounds = [_number(b) for b in samples["buckets"]] + ["+Inf"]
+                for values, (counts, total, count) in samples["values"].items():
+                    cumulative = 0
+                    for bound, n in zip(bounds, counts):
+                        cumulative += n
+                        lines.append(f"{name}_bucket{_labels(labelnames, values, extra, bound)} {cumulative}")
+                    lines.append(f"{name}_sum{_labels(labelnames, values, extra)} {_number(total)}")
+                    lines.append(f"{name}_count{_labels(labelnames, values, extra)} {count}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def command_verb(command: str) -> str:
+    """Return the first word of a GDB command, used as a metric label."""
+    parts = command.split(None, 1)
+    return parts[0] if parts else ""
+
+
+async def write_periodically(render_text: Callable[[], Awaitable[str]], path: str, interval: float = FILE_INTERVAL):
+    """Rewrite a metrics file every interval seconds (for node_exporter's textfile collector)."""
+    target = Path(path)
+    temp = target.with_name(f".{target.name}.tmp")
+    try:
+        while True:
+            try:
+                temp.write_text(await render_text())
+                os.replace(temp, target)
+            except OSError as e:
+                logger.warning(f"Cannot write metrics file {target}: {e}")
+            await asyncio.sleep(interval)
+    except asyncio.CancelledError:
+        pass
+
+
+async def serve_http(render_text: Callable[[], Awaitable[str]], port: int, host: str = "127.0.0.1") -> asyncio.AbstractServer:
+    """Serve the metrics at http://host:port/metrics."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await reader.readline()
+            # Skip the request headers
+            while (await reader.readline()).strip():
+                pass
+            parts = request.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                body = (await render_text()).encode()
+                head = f"HTTP/1.1 200 OK\r\nContent-Type: {CONTENT_TYPE}\r\n"
+            else:
+                body = b"Not found\n"
+                head = "HTTP/1.1 404 Not Found\r\nContent-Type: text/plain\r\n"
+            writer.write(f"{head}Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return server
+
+
+REGISTRY = Registry()
+
+TOOL_DURATION = REGISTRY.histogram(
+    "gdb_mcp_tool_duration_seconds", "Time to handle a tool call, including JSON encoding", ("tool",)
+)
+TOOL_ERRORS = REGISTRY.counter("gdb_mcp_tool_errors", "Tool calls that returned an error", ("tool",))
+RESPONSE_BYTES = REGISTRY.counter("gdb_mcp_response_bytes", "Bytes of tool responses sent to clients", ("tool",))
+COMMAND_DURATION = REGISTRY.histogram(
+    "gdb_mcp_command_duration_seconds", "Time from writing a command to GDB to its result record", ("verb",)
+)
+COMMAND_TIMEOUTS = REGISTRY.counter("gdb_mcp_command_timeouts", "Commands without a result within their timeout", ("verb",))
+TRUNCATED_OUTPUTS = REGISTRY.counter(
+    "gdb_mcp_truncated_outputs", "Command outputs over the output budget, summarized and stored", ("verb",)
+)
+GDB_INPUT_BYTES = REGISTRY.counter("gdb_mcp_gdb_input_bytes", "Bytes of commands written to GDB")
+GDB_OUTPUT_BYTES = REGISTRY.counter("gdb_mcp_gdb_output_bytes", "Bytes of output read from GDB")
+GDB_OUTPUT_LINES = REGISTRY.counter("gdb_mcp_gdb_output_lines", "Lines of output read from GDB")
+SPAWN_DURATION = REGISTRY.histogram("gdb_mcp_spawn_duration_seconds", "Time to start GDB up to its first prompt")
+SESSIONS = REGISTRY.gauge("gdb_mcp_sessions", "Open sessions")
+PENDING_COMMANDS = REGISTRY.gauge("gdb_mcp_pending_commands", "Commands written to GDB and awaiting a result")
+WAITING_OPENS = REGISTRY.gauge("gdb_mcp_waiting_opens", "Opens waiting for admission")
+IDLE_PROCESSES = REGISTRY.gauge("gdb_mcp_idle_processes", "Idle GDB processes in the pool, including templates")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Parser for GDB/MI output records."""
+
+import codecs
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Record type by leading character, see "GDB/MI Output Syntax"
+RECORD_TYPES = {
+    '^': "result",
+    '*': "exec",
+    '+': "status",
+    '=': "notify",
+    '~': "console",
+    '@': "target",
+    '&': "log",
+}
+
+STREAM_TYPES = frozenset(("console", "target", "log"))
+
+# One lexical token of a result list: a c-string, a "variable=" or punctuation
+_TOKEN_RE = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"|([A-Za-z_][\w-]*)=|([{}\[\]])')
+
+# GDB's \e (escape) and escaped backslashes, which must not be mistaken for it
+_ESCAPE_E_RE = re.compile(r'\\\\|\\e')
+
+
+def unescape(s: str) -> str:
+    """Decode the body of an MI c-string (without the surrounding quotes)."""
+    if '\\' not in s:
+        return s
+    if '\\e' in s:
+        # Python has no \e escape
+        s = _ESCAPE_E_RE.sub(lambda m: '\\x1b' if m.group() == '\\e' else m.group(), s)
+    # GDB escapes non-printable bytes as octal, so decode to bytes first and
+    # then to text to reassemble multi-byte UTF-8 sequences.
+    raw = codecs.escape_decode(s.encode('utf-8'))[0]
+    return raw.decode('utf-8', errors='replace')
+
+
+def parse_c_string(s: str) -> str:
+    """Parse a quoted MI c-string."""
+    if len(s) >= 2 and s[0] == '"' and s[-1] == '"':
+        return unescape(s[1:-1])
+    return s
+
+
+def quote(s: str) -> str:
+    """Quote a string as an MI c-string command argument."""
+    return '"' + s.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _add(container: Any, key: Optional[str], value: Any, repeated: Dict[int, set]):
+    """Add a value to a tuple (dict) or list being built."""
+    if isinstance(container, list):
+        container.append(value)
+    elif key not in container:
+        container[key] = value
+    else:
+        # A tuple may repeat a key (e.g. several "bkpt" locations); collect
+        # the values into a list rather than keeping only the last one.
+        keys = repeated.setdefault(id(container), set())
+        if key in keys:
+            container[key].append(value)
+        else:
+            keys.add(key)
+            container[key] = [container[key], value]
+
+
+def parse_results(body: str) -> Dict[str, Any]:
+    """Parse a comma separated MI result list into a dict.
+
+    Tuples become dicts, lists become lists and c-strings are unescaped.
+    Result lists such as ``stack=[frame={...},frame={...}]`` become a list of
+    their values since the repeated name carries no information.
+    """
+    root: Dict[str, Any] = {}
+    stack: List[Any] = [root]
+    # Last key used in each open container, for GDB's unnamed continuation
+    # values such as the extra locations in "bkpt={...},{...}"
+    last_keys: List[Optional[str]] = [None]
+    repeated: Dict[int, set] = {}
+    key = None
+
+    for m in _TOKEN_RE.finditer(body):
+        string, name, punct = m.groups()
+        if name is not None:
+            key = name
+            continue
+        if key is None:
+            key = last_keys[-1]
+        else:
+            last_keys[-1] = key
+
+        if string is not None:
+            _add(stack[-1], key, unescape(string), repeated)
+        elif punct == '{' or punct == '[':
+            value = {} if punct == '{' else []
+            _add(stack[-1], key, value, repeated)
+            stack.append(value)
+            last_keys.append(None)
+        elif len(stack) > 1:
+            stack.pop()
+            last_keys.pop()
+        key = None
+
+    return root
+
+
+def parse_record(line: str) -> Dict[str, Any]:
+    """Parse one line of GDB/MI output into a record dict.
+
+    Returns a dict with a ``type`` key (``result``, ``exec``, ``status``,
+    ``notify``, ``console``, ``target``, ``log``, ``prompt`` or ``unknown``).
+    Result and async records carry ``token``, ``class`` and ``results``;
+    stream records carry ``payload``.
+    """
+    if line == '(gdb)' or line == '(gdb) ':
+        return {"type": "prompt"}
+
+    token, record = split_token(line)
+    record_type = RECORD_TYPES.get(record[:1])
+    if record_type is None:
+        return {"type": "unknown", "payload": line}
+
+    if record_type in STREAM_TYPES:
+        return {"type": record_type, "payload": parse_c_string(record[1:])}
+
+    comma = record.find(',')
+    if comma < 0:
+        return {"type": record_type, "token": token, "class": record[1:], "results": {}}
+    return {
+        "type": record_type,
+        "token": token,
+        "class": record[1:comma],
+        "results": parse_results(record[comma + 1:]),
+    }
+
+
+def parse_result_record(record: str) -> Dict[str, Any]:
+    """Parse a result record (without token) into the ``call`` result format."""
+    comma = record.find(',')
+    if comma < 0:
+        result_class, results = record[1:], {}
+    else:
+        result_class, results = record[1:comma], parse_results(record[comma + 1:])
+
+    if result_class == "error":
+        error = {"status": "error", "message": results.get("msg", "")}
+        if "code" in results:
+            error["code"] = results["code"]
+        return error
+    if result_class in ("done", "running", "connected", "exit"):
+        if results or result_class == "done":
+            return {"status": result_class, "data": results}
+        return {"status": result_class}
+    return {"status": "unknown", "data": record}
+
+
+def split_token(line: str) -> Tuple[Optional[int], str]:
+    """Split the numeric MI token off the front of an output record."""
+    i = 0
+    while i < len(line) and line[i].isdigit():
+        i += 1
+    if i == 0:
+        return None, line
+    return int(line[:i]), line[i:]
+
+
+def result_data(response: Dict[str, Any], what: str) -> Dict[str, Any]:
+    """Return the data of a command's successful result or raise with GDB's message.
+
+    response is as returned by GDBSession.send_command; what describes the
+    command for the error ("Timed out <what>" or "Failed <what>: <message>").
+    """
+    result = response["result"]
+    if result is None:
+        raise RuntimeError(f"Timed out {what}")
+    if result["status"] == "error":
+        raise RuntimeError(f"Failed {what}: {result['message']}")
+    return result.get("data", {})
+
+
+def console_text(lines: Iterable[str]) -> str:
+    """Join the console stream records among a command's output lines."""
+    parts = []
+    for line in lines:
+        record = parse_record(line)
+        if record["type"] == "console":
+            parts.append(record["payload"])
+    return "".join(parts)
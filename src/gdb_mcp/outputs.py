@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Per-session storage of command output that exceeded the output budget."""
+
+import itertools
+import json
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import metrics
+
+# Characters of command output returned in full by default
+DEFAULT_OUTPUT_BUDGET = 32 * 1024
+
+# Stored outputs kept per session, and their total size in characters
+MAX_STORED_OUTPUTS = 32
+MAX_STORED_CHARS = 64 * 1024 * 1024
+
+# Lines returned by fetch_output per page by default
+DEFAULT_PAGE_LINES = 200
+
+
+class _StoredOutput:
+    __slots__ = ("command", "lines", "size")
+
+    def __init__(self, command: str, lines: List[str], size: int):
+        self.command = command
+        self.lines = lines
+        self.size = size
+
+
+def _cut(line: str, limit: int) -> str:
+    """Shorten a single line to limit characters."""
+    return line if len(line) <= limit else line[:limit] + f"... [{len(line) - limit} more characters]"
+
+
+def summarize(lines: List[str], budget: int, note: str = "") -> str:
+    """Join the first and last lines that fit in half of budget each.
+
+    The omitted middle is replaced by one line saying how much is missing,
+    followed by note.
+    """
+    half = budget // 2
+
+    def fit(candidates: Iterable[str]) -> List[str]:
+        # Whole lines only, except that a single line longer than half is cut
+        taken, used = [], 0
+        for line in candidates:
+            if used + len(line) > half:
+                if not taken:
+                    taken.append(_cut(line, half))
+                break
+            taken.append(line)
+            used += len(line) + 1
+        return taken
+
+    head = fit(lines)
+    tail = fit(reversed(lines[len(head):]))
+    tail.reverse()
+    omitted = len(lines) - len(head) - len(tail)
+    marker = f"... [{omitted} lines omitted{'; ' + note if note else ''}] ..."
+    return '\n'.join(head + [marker] + tail)
+
+
+def _size(value: Any) -> int:
+    """Length of value encoded as compact JSON."""
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def shrink(value: Any, budget: int, path: str = "", cut: Optional[Dict[str, int]] = None) -> Tuple[Any, int]:
+    """Cut parsed result data down to about budget characters of JSON.
+
+    Lists keep their leading items and dicts their leading entries that fit;
+    the first item of a list is shortened itself if even it doesn't fit, and
+    long strings are cut. Returns the shortened value and its size; the full
+    length of every list or dict that lost entries is added to cut by its
+    path (e.g. ``symbols.debug[0].symbols``).
+    """
+    size = _size(value)
+    if size <= budget:
+        return value, size
+    if isinstance(value, list):
+        kept: List[Any] = []
+        used = 2
+        for item in value:
+            item_size = _size(item) + 1
+            if used + item_size > budget:
+                if not kept and isinstance(item, (dict, list)):
+                    item, item_size = shrink(item, budget - used, f"{path}[0]", cut)
+                    kept.append(item)
+                    used += item_size
+                break
+            kept.append(item)
+            used += item_size
+        if cut is not None and len(kept) < len(value):
+            cut[path] = len(value)
+        return kept, used
+    if isinstance(value, dict):
+        entries: Dict[str, Any] = {}
+        used = 2
+        for key, item in value.items():
+            # Quotes, colon and comma around the key
+            overhead = len(key) + 4
+            if used + overhead >= budget:
+                if cut is not None:
+                    cut[path] = len(value)
+                break
+            item, item_size = shrink(item, budget - used - overhead, f"{path}.{key}" if path else key, cut)
+            entries[key] = item
+            used += item_size + overhead
+        return entries, used
+    if isinstance(value, str):
+        text = _cut(value, max(budget - 2, 0))
+        return text, len(text) + 2
+    return value, size
+
+
+class OutputStore:
+    """Outputs too large to return at once, kept for paging and searching.
+
+    A response is budgeted as a whole: its output text and the parsed data
+    of its result. When they exceed the budget together, the output is
+    replaced by its first and last lines and the data by its leading
+    entries (see shrink), each with a handle; the full output and the data
+    (as indented JSON lines) stay here until they are evicted by newer ones
+    or the session is reset.
+    """
+
+    def __init__(self, budget: int = DEFAULT_OUTPUT_BUDGET):
+        self.budget = budget
+        self._outputs: "OrderedDict[str, _StoredOutput]" = OrderedDict()
+        self._size = 0
+        self._handles = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+    def limit(self, response: Dict[str, Any], command: str, budget: Optional[int] = None) -> Dict[str, Any]:
+        """Turn a session response into the one returned to the client.
+
+        The command's output lines ("lines") become the "output" text;
+        output and result data over budget are summarized and stored.
+        budget defaults to the session's; 0 disables the limit.
+        """
+        budget = self.budget if budget is None else budget
+        limited = {key: value for key, value in response.items() if key != "lines"}
+        lines: List[str] = response["lines"]
+        if not budget:
+            limited["output"] = '\n'.join(lines)
+            return limited
+
+        output_size = sum(map(len, lines)) + max(len(lines) - 1, 0)
+        result = response["result"]
+        data = result.get("data") if result else None
+        data_size = _size(data) if data else 0
+        if output_size + data_size <= budget:
+            limited["output"] = '\n'.join(lines)
+            return limited
+
+        # Whichever part is small keeps all of it, the rest goes to the other
+        if data_size <= budget // 2:
+            output_budget = budget - data_size
+        elif output_size <= budget // 2:
+            output_budget = output_size
+        else:
+            output_budget = budget // 2
+        data_budget = budget - output_budget
+        metrics.TRUNCATED_OUTPUTS.inc(metrics.command_verb(command))
+
+        if output_size > output_budget:
+            handle = self._store(command, lines, output_size)
+            note = f"fetch_output with handle {handle} for all {len(lines)} lines"
+            limited["output"] = summarize(lines, output_budget, note)
+            limited["truncated"] = {"handle": handle, "lines": len(lines), "chars": output_size}
+        else:
+            limited["output"] = '\n'.join(lines)
+
+        if data_size > data_budget:
+            data_lines = json.dumps(data, indent=1).split('\n')
+            handle = self._store(command, data_lines, data_size)
+            cut: Dict[str, int] = {}
+            limited["result"] = {**result, "data": shrink(data, data_budget, cut=cut)[0]}
+            limited["truncated_data"] = {
+                "handle": handle,
+                "lines": len(data_lines),
+                "chars": data_size,
+                "items": cut,
+            }
+        return limited
+
+    def _store(self, command: str, lines: List[str], size: int) -> str:
+        handle = f"out-{next(self._handles)}"
+        self._outputs[handle] = _StoredOutput(command, lines, size)
+        self._size += size
+        while len(self._outputs) > MAX_STORED_OUTPUTS or (self._size > MAX_STORED_CHARS and len(self._outputs) > 1):
+            _, evicted = self._outputs.popitem(last=False)
+            self._size -= evicted.size
+        return handle
+
+    def fetch(
+        self,
+        handle: str,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_LINES,
+        grep: Optional[str] = None,
+        ignore_case: bool = False,
+    ) -> Dict[str, Any]:
+        """Return a page of a stored output's lines, or of those matching grep.
+
+        offset is the line number to continue from; next_offset is None once
+        the end is reached. A page never exceeds the budget by much: lines
+        longer than it are shortened, and a page stops once it is used up.
+        """
+        stored = self._outputs.get(handle)
+        if stored is None:
+            raise ValueError(f"Unknown or expired output handle: {handle}")
+        if offset < 0 or limit <= 0:
+            raise ValueError("offset must not be negative and limit must be positive")
+        try:
+            pattern = re.compile(grep, re.IGNORECASE if ignore_case else 0) if grep else None
+        except re.error as e:
+            raise ValueError(f"Invalid grep pattern: {e}")
+
+        budget = self.budget or DEFAULT_OUTPUT_BUDGET
+        lines, used, i = [], 0, offset
+        while i < len(stored.lines) and len(lines) < limit and used < budget:
+            line = stored.lines[i]
+            i += 1
+            if pattern is not None and not pattern.search(line):
+                continue
+            text = _cut(line, budget)
+            lines.append({"line": i - 1, "text": text})
+            used += len(text) + 1
+        return {
+            "command": stored.command,
+            "lines": lines,
+            "total_lines": len(stored.lines),
+            "next_offset": i if i < len(stored.lines) else None,
+        }
+
+    def clear(self):
+        self._outputs.clear()
+        self._size = 0
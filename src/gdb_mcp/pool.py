@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Pool of pre-started GDB processes."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Number of recent acquire latencies kept for percentile reporting
+LATENCY_WINDOW = 1000
+
+
+def percentiles(samples: Iterable[float], points: Iterable[int] = (50, 90, 99)) -> Dict[str, float]:
+    """Return nearest-rank percentiles of the samples in milliseconds."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    return {
+        f"p{p}": round(ordered[min(len(ordered) - 1, len(ordered) * p // 100)] * 1000, 3)
+        for p in points
+    }
+
+
+class GDBProcessPool:
+    """Keeps idle, already-initialised GDB processes ready to hand out.
+
+    ``min_size`` idle processes are maintained by a background refill task;
+    released processes are reset and kept up to ``max_size`` idle ones.
+
+    Released processes that still have a binary's symbols loaded are kept
+    separately as templates, keyed by the session's ``binary_key``: up to
+    ``template_size`` per binary for the ``template_binaries`` most recently
+    used binaries.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[str], Any],
+        min_size: int = 1,
+        max_size: int = 4,
+        template_size: int = 2,
+        template_binaries: int = 8,
+    ):
+        if min_size < 0 or max_size < min_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size")
+        self._session_factory = session_factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.template_size = template_size
+        self.template_binaries = template_binaries
+        self._idle: Deque[Any] = deque()
+        # Symbol-loaded idle sessions per binary, least recently used first
+        self._templates: "OrderedDict[Any, Deque[Any]]" = OrderedDict()
+        self.template_hits = 0
+        self.template_misses = 0
+        self._spawning = 0
+        self._refill_task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    async def start(self):
+        """Start filling the pool in the background."""
+        self._schedule_refill()
+
+    def _schedule_refill(self):
+        """Start the refill task unless one is already running."""
+        if self._closed or self.min_size == 0:
+            return
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self):
+        """Spawn processes until min_size are idle or being started."""
+        try:
+            while not self._closed and len(self._idle) + self._spawning < self.min_size:
+                self._spawning += 1
+                try:
+                    session = await self._spawn()
+                except Exception as e:
+                    logger.error(f"Failed to pre-start GDB process: {e}")
+                    # Don't spin if GDB can't be started at all
+                    break
+                finally:
+                    self._spawning -= 1
+                if self._closed:
+                    await session.close()
+                    break
+                self._idle.append(session)
+        except asyncio.CancelledError:
+            pass
+
+    async def _spawn(self):
+        """Start a new GDB process."""
+        start = time.perf_counter()
+        session = self._session_factory(str(uuid.uuid4()))
+        await session.start()
+        metrics.SPAWN_DURATION.observe(time.perf_counter() - start)
+        return session
+
+    async def acquire(self, key: Any = None):
+        """Take a ready GDB process, starting one if none is idle.
+
+        If key is given and a template for it is idle, that session is
+        returned with the binary's symbols already loaded.
+        """
+        start = time.perf_counter()
+        if key is not None:
+            session = await self._take_alive(self._templates.get(key))
+            if session is not None:
+                self._templates.move_to_end(key)
+                self.template_hits += 1
+                self._latencies.append(time.perf_counter() - start)
+                return session
+            self.template_misses += 1
+
+        session = await self._take_alive(self._idle)
+        if session is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            session = await self._spawn()
+
+        self._latencies.append(time.perf_counter() - start)
+        self._schedule_refill()
+        return session
+
+    async def _take_alive(self, idle: Optional[Deque[Any]]):
+        """Pop the first idle session whose process is still running."""
+        while idle:
+            candidate = idle.popleft()
+            if candidate.is_alive:
+                return candidate
+            await candidate.close()
+        return None
+
+    async def release(self, session):
+        """Reset a session's process and keep it for reuse, or close it."""
+        key = session.binary_key
+        keep_symbols = (
+            key is not None and self.template_size > 0
+            and len(self._templates.get(key, ())) < self.template_size
+        )
+        if self._closed or (not keep_symbols and len(self._idle) >= self.max_size):
+            await session.close()
+            return
+        # Reset once; if the binary could not be kept it is reused as a plain process
+        if not await session.reset(keep_symbols=keep_symbols):
+            await session.close()
+            return
+        if keep_symbols and session.binary_key == key:
+            await self._add_template(key, session)
+            return
+        # Re-check since the pool may have changed while resetting
+        if self._closed or len(self._idle) >= self.max_size:
+            await session.close()
+            return
+        self.recycled += 1
+        self._idle.append(session)
+
+    async def _add_template(self, key: Any, session):
+        """Keep a symbol-loaded session for reuse, evicting old binaries."""
+        templates = self._templates.setdefault(key, deque())
+        self._templates.move_to_end(key)
+        if self._closed or len(templates) >= self.template_size:
+            await session.close()
+            return
+        self.recycled += 1
+        templates.append(session)
+
+        while len(self._templates) > self.template_binaries:
+            _, evicted = self._templates.popitem(last=False)
+            while evicted:
+                await evicted.popleft().close()
+
+    def release_nowait(self, session):
+        """Release a session in the background."""
+        task = asyncio.create_task(self.release(session))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def idle_count(self) -> int:
+        """Return the number of idle processes, including templates."""
+        return len(self._idle) + sum(len(q) for q in self._templates.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool occupancy, hit rate and acquire latency percentiles."""
+        total = self.hits + self.misses
+        return {
+            "idle": len(self._idle),
+            "spawning": self._spawning,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else None,
+            "recycled": self.recycled,
+            "acquire_latency_ms": percentiles(self._latencies),
+            "template_hits": self.template_hits,
+            "template_misses": self.template_misses,
+            "templates": [
+                {"binary": key.path, "build_id": key.build_id, "idle": len(idle)}
+                for key, idle in self._templates.items()
+            ],
+        }
+
+    async def close(self):
+        """Close all idle processes and stop refilling."""
+        self._closed = True
+        tasks: List[asyncio.Task] = list(self._background)
+        if self._refill_task:
+            self._refill_task.cancel()
+            tasks.append(self._refill_task)
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"Error stopping pool task: {e}")
+
+        while self._idle:
+            await self._idle.popleft().close()
+        for idle in self._templates.values():
+            while idle:
+                await idle.popleft().close()
+        self._templates.clear()
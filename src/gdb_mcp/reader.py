@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Splitting of GDB's output stream into lines, without a line length limit."""
+
+import asyncio
+import logging
+from typing import Callable
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Bytes requested from the pipe per read
+CHUNK_SIZE = 256 * 1024
+
+
+async def read_lines(
+    stream: asyncio.StreamReader,
+    on_line: Callable[[str], None],
+    chunk_size: int = CHUNK_SIZE,
+):
+    """Call on_line with every non-blank line of stream until EOF.
+
+    Output is read in chunks into one bytearray that is scanned for newlines
+    from where the previous scan stopped, so a line may be of any size and is
+    never searched twice. Each complete line is decoded as soon as it is
+    found, straight from a memoryview of the buffer (no intermediate bytes
+    copy), and passed on with surrounding whitespace removed. Only the
+    current chunk and a partial line are buffered here; what on_line keeps
+    of the lines is up to it.
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(chunk_size)
+        if not chunk:
+            break
+        metrics.GDB_OUTPUT_BYTES.inc(amount=len(chunk))
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Everything before scan is a partial line without a newline
+        scan = len(buffer)
+        buffer += chunk
+        start = lines = 0
+        view = memoryview(buffer)
+        try:
+            end = buffer.find(b"\n", scan)
+            while end >= 0:
+                line = str(view[start:end], "utf-8", "replace").strip()
+                if line:
+                    if debug:
+                        logger.debug("GDB output: %s", line)
+                    on_line(line)
+                    lines += 1
+                start = end + 1
+                end = buffer.find(b"\n", start)
+        finally:
+            # The buffer can't be resized while a view of it exists
+            view.release()
+        if start:
+            del buffer[:start]
+        metrics.GDB_OUTPUT_LINES.inc(amount=lines)
+
+    # A final line without a trailing newline
+    line = buffer.decode("utf-8", "replace").strip()
+    if line:
+        on_line(line)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""In-memory index of the GDB command reference document."""
+
+import logging
+import re
+from importlib.resources.abc import Traversable
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote, unquote
+
+logger = logging.getLogger(__name__)
+
+# Top-level sections served as resources, keyed by their "## " heading
+CLI_SECTION = "CLI Commands"
+MI_SECTION = "MI Commands"
+MAPPING_SECTION = "Command Correspondence"
+
+_CODE_RE = re.compile(r"`([^`]*)`")
+
+
+def _cells(line: str) -> List[str]:
+    """Split a markdown table row into its cell texts.
+
+    Pipes inside code spans (e.g. `[ -a | -r ]`) don't separate cells.
+    """
+    cells, current, in_code = [], [], False
+    for ch in line.strip().strip("|"):
+        if ch == "`":
+            in_code = not in_code
+        elif ch == "|" and not in_code:
+            cells.append("".join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    cells.append("".join(current).strip())
+    return cells
+
+
+def _code(cell: str) -> Optional[str]:
+    """Return the first code span of a table cell, None for "-" or empty."""
+    m = _CODE_RE.search(cell)
+    return m.group(1) if m else None
+
+
+class CommandReference:
+    """Parsed view of the command reference markdown.
+
+    The file is parsed on first use and again only when its mtime changes
+    (never, for a packaged file without one, e.g. inside a zip).
+    Top-level sections are kept as text, and every row of the CLI and MI
+    command tables becomes an individually addressable command entry.
+    """
+
+    def __init__(self, path: Traversable):
+        self.path = path
+        self._mtime: Optional[int] = None
+        self.content = ""
+        self.sections: Dict[str, str] = {}
+        self.commands: Dict[str, Dict[str, Dict[str, Any]]] = {"cli": {}, "mi": {}}
+        self._aliases: Dict[str, str] = {}
+
+    def _ensure_loaded(self):
+        """Parse the file if it has not been parsed or has changed."""
+        try:
+            mtime = self.path.stat().st_mtime_ns if hasattr(self.path, "stat") else 0
+        except OSError:
+            raise ValueError(f"Commands file not found: {self.path}")
+        if not mtime and not self.path.is_file():
+            raise ValueError(f"Commands file not found: {self.path}")
+        if mtime != self._mtime:
+            self._parse(self.path.read_text(encoding="utf-8"))
+            self._mtime = mtime
+            logger.debug(f"Indexed command reference: {len(self.commands['cli'])} CLI, {len(self.commands['mi'])} MI commands")
+
+    def _parse(self, content: str):
+        """Build the section and command indexes from the markdown text."""
+        sections: Dict[str, List[str]] = {}
+        commands: Dict[str, Dict[str, Dict[str, Any]]] = {"cli": {}, "mi": {}}
+        aliases: Dict[str, str] = {}
+        mapping: Dict[str, str] = {}
+        section = subsection = None
+
+        for line in content.split("\n"):
+            stripped = line.strip()
+            if stripped.startswith("## "):
+                section = stripped[3:]
+                subsection = None
+            elif stripped.startswith("### "):
+                subsection = stripped[4:]
+            if section is not None:
+                sections.setdefault(section, []).append(line)
+
+            if not stripped.startswith("|") or stripped.startswith("|--"):
+                continue
+            cells = _cells(stripped)
+            name = _code(cells[0])
+            if name is None:
+                # Header row
+                continue
+
+            if section == CLI_SECTION and len(cells) >= 4:
+                abbreviation = _code(cells[1])
+                commands["cli"][name] = {
+                    "name": name,
+                    "category": subsection,
+                    "abbreviation": abbreviation,
+                    "description": cells[2],
+                    "usage": _code(cells[3]),
+                }
+                if abbreviation:
+                    aliases[abbreviation] = name
+            elif section == MI_SECTION and len(cells) >= 4:
+                commands["mi"][name] = {
+                    "name": name,
+                    "category": subsection,
+                    "description": cells[1],
+                    "parameters": _code(cells[2]),
+                    "example": _code(cells[3]),
+                }
+            elif section == MAPPING_SECTION and len(cells) >= 2 and _code(cells[1]):
+                mapping[name] = _code(cells[1])
+
+        for cli_name, mi_command in mapping.items():
+            mi_name = mi_command.split()[0]
+            if cli_name in commands["cli"]:
+                commands["cli"][cli_name]["mi_equivalent"] = mi_command
+            if mi_name in commands["mi"]:
+                commands["mi"][mi_name].setdefault("cli_equivalent", cli_name)
+
+        self.content = content
+        self.sections = {title: "\n".join(lines) for title, lines in sections.items()}
+        self.commands = commands
+        self._aliases = aliases
+
+    def full_text(self) -> str:
+        """Return the whole reference document."""
+        self._ensure_loaded()
+        return self.content
+
+    def section(self, title: str, end_title: Optional[str] = None) -> str:
+        """Return a top-level section by its heading text.
+
+        With end_title, the following sections up to (not including) that
+        one are returned as well.
+        """
+        self._ensure_loaded()
+        if title not in self.sections:
+            return f"Section '## {title}' not found"
+        titles = list(self.sections)
+        start = titles.index(title)
+        end = start + 1
+        if end_title in self.sections and titles.index(end_title) > start:
+            end = titles.index(end_title)
+        return "\n".join(self.sections[t] for t in titles[start:end])
+
+    def command(self, kind: str, name: str) -> Dict[str, Any]:
+        """Look up a CLI or MI command by name (or CLI abbreviation)."""
+        self._ensure_loaded()
+        name = unquote(name)
+        commands = self.commands[kind]
+        if kind == "cli":
+            name = name if name in commands else self._aliases.get(name, name)
+        elif not name.startswith("-"):
+            name = "-" + name
+        if name not in commands:
+            raise ValueError(f"Unknown {kind.upper()} command: {name}")
+        return commands[name]
+
+    def render_command(self, kind: str, name: str) -> str:
+        """Render one command entry as a short markdown document."""
+        entry = self.command(kind, name)
+        lines = [f"# `{entry['name']}` ({kind.upper()})", ""]
+        fields = [
+            ("category", "Category"),
+            ("abbreviation", "Abbreviation"),
+            ("description", "Description"),
+            ("usage", "Usage"),
+            ("parameters", "Parameters"),
+            ("example", "Example"),
+            ("mi_equivalent", "MI equivalent"),
+            ("cli_equivalent", "CLI equivalent"),
+        ]
+        for key, label in fields:
+            value = entry.get(key)
+            if not value:
+                continue
+            if key in ("category", "description"):
+                lines.append(f"- **{label}**: {value}")
+            else:
+                lines.append(f"- **{label}**: `{value}`")
+        return "\n".join(lines) + "\n"
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Rank commands by keyword match against name and description."""
+        self._ensure_loaded()
+        terms = [t for t in query.lower().split() if t]
+        if not terms:
+            return []
+
+        scored = []
+        for k in ([kind] if kind else ["cli", "mi"]):
+            for name, entry in self.commands[k].items():
+                lname = name.lower()
+                text = " ".join(
+                    str(entry.get(f) or "") for f in ("category", "description", "usage", "parameters", "example")
+                ).lower()
+                score = 0
+                for term in terms:
+                    if term == lname or term == lname.lstrip("-") or term == entry.get("abbreviation"):
+                        score += 10
+                    elif term in lname:
+                        score += 5
+                    if term in text:
+                        score += 1
+                if score:
+                    scored.append((score, k, name, entry))
+
+        scored.sort(key=lambda item: (-item[0], item[2]))
+        return [
+            {
+                "kind": k,
+                "name": name,
+                "description": entry["description"],
+                "uri": f"gdb://commands/{k}/{quote(name)}",
+                "score": score,
+            }
+            for score, k, name, entry in scored[:limit]
+        ]
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Re-run session journals against fresh GDB sessions.
+
+Reads journals written with ``gdb-mcp --journal-dir`` (see journal.py),
+opens a new session with the same binary for each, and sends the recorded
+commands again in the order they were originally sent. After a command that
+resumed the program it waits for the program to stop, as the client would
+have. Reports the result statuses that differ from the recorded ones and
+the recorded and replayed latencies as JSON, so a journal doubles as a
+reproduction of what an agent did and as a regression benchmark.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .gdb_manager import COMMAND_TIMEOUT, GDBManager
+from .pool import percentiles
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the program to stop after a command resumed it
+STOP_TIMEOUT = 30
+
+
+def read_journal(path: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Return a journal's open record and its commands in the order they were sent.
+
+    A command that timed out and later completed has two records; the last
+    one is kept.
+    """
+    opened: Dict[str, Any] = {}
+    commands: Dict[int, Dict[str, Any]] = {}
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # The last line may be cut short if the server was killed
+                logger.warning(f"Skipping malformed record on line {number} of {path}")
+                continue
+            if record.get("event") == "open":
+                opened = record
+            elif "token" in record:
+                commands[record["token"]] = record
+    return opened, [commands[token] for token in sorted(commands)]
+
+
+async def _wait_for_stop(manager: GDBManager, session_id: str, cursor: int, timeout: float) -> int:
+    """Wait until the program stops (or timeout); returns the new event cursor."""
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return cursor
+        page = await manager.get_events(session_id, cursor, remaining, 1000)
+        cursor = page["cursor"]
+        if any(e["type"] == "exec" and e.get("class") == "stopped" for e in page["events"]):
+            return cursor
+
+
+async def replay(
+    manager: GDBManager,
+    path: Path,
+    binary: Optional[str] = None,
+    pace: bool = False,
+    stop_timeout: float = STOP_TIMEOUT,
+) -> Dict[str, Any]:
+    """Replay one journal in a new session of manager.
+
+    binary overrides the journal's binary. With pace, the original gaps
+    between commands are kept instead of sending each command as soon as
+    the previous one finished.
+    """
+    start = time.perf_counter()
+    opened, commands = read_journal(path)
+    binary = binary or opened.get("binary")
+    command_timeout = opened.get("command_timeout", COMMAND_TIMEOUT)
+    session_id = await manager.create_session(binary=binary, command_timeout=command_timeout)
+    mismatches = []
+    recorded, replayed = [], []
+    try:
+        cursor = 0
+        first_sent = time.perf_counter()
+        for record in commands:
+            if pace:
+                delay = record["t"] - commands[0]["t"] - (time.perf_counter() - first_sent)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            # A command that eventually completed gets as long as it took then,
+            # even if the client had stopped waiting for it in between
+            timeout = None
+            if record["status"] != "timeout":
+                timeout = max(command_timeout, 2 * record["latency_ms"] / 1000)
+            sent = time.perf_counter()
+            response = await manager.send_command(session_id, record["command"], timeout, False, 0)
+            replayed.append(time.perf_counter() - sent)
+            recorded.append(record["latency_ms"] / 1000)
+            result = response["result"]
+            status = result["status"] if result else "timeout"
+            if status != record["status"]:
+                mismatches.append({
+                    "token": record["token"],
+                    "command": record["command"],
+                    "recorded": record["status"],
+                    "replayed": status,
+                    **({"message": result["message"]} if result and "message" in result else {}),
+                })
+            if status == "running":
+                cursor = await _wait_for_stop(manager, session_id, cursor, stop_timeout)
+    finally:
+        await manager.close_session(session_id)
+    return {
+        "journal": str(path),
+        "binary": binary,
+        "commands": len(commands),
+        "mismatches": mismatches,
+        "latency_ms": {"recorded": percentiles(recorded), "replayed": percentiles(replayed)},
+        "recorded_total_ms": round(sum(recorded) * 1000, 3),
+        "replayed_total_ms": round(sum(replayed) * 1000, 3),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+async def _replay_all(args) -> List[Dict[str, Any]]:
+    manager = GDBManager(pool_min_size=0, gdb_path=args.gdb, cache_dir=args.cache_dir)
+    await manager.start()
+    try:
+        results = []
+        for path in args.journal:
+            for _ in range(args.repeat):
+                try:
+                    results.append(await replay(manager, Path(path), args.binary, args.pace, args.stop_timeout))
+                except Exception as e:
+                    logger.error(f"Replay of {path} failed: {e}")
+                    results.append({"journal": path, "error": str(e)})
+        return results
+    finally:
+        await manager.cleanup()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="gdb-mcp-replay", description=__doc__.splitlines()[0])
+    parser.add_argument("journal", nargs="+", help="Journal files (<journal-dir>/<session id>.jsonl)")
+    parser.add_argument("--binary", help="Program to load instead of the one in the journal")
+    parser.add_argument("--gdb", default="gdb", help="GDB executable to run (default: gdb from PATH)")
+    parser.add_argument("--cache-dir", help="Directory for persistent caches (default: ~/.cache/gdb-mcp)")
+    parser.add_argument(
+        "--pace", action="store_true",
+        help="Keep the recorded gaps between commands instead of replaying as fast as possible"
+    )
+    parser.add_argument(
+        "--stop-timeout", type=float, default=STOP_TIMEOUT,
+        help=f"Seconds to wait for the program to stop after it was resumed (default: {STOP_TIMEOUT})"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Times to replay each journal (default: 1)")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 if any result status differs")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    results = asyncio.run(_replay_all(args))
+    report = json.dumps({"results": results}, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    else:
+        print(report)
+    if any("error" in r for r in results) or (args.strict and any(r["mismatches"] for r in results)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
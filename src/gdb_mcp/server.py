@@ -2,40 +2,165 @@
 """GDB MCP Server - Provides GDB commands reference as resources."""
 
 import asyncio
+import hmac
 import json
 import logging
+import os
+import socket
+import stat
+import time
+from importlib import resources
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 
-from mcp.server import Server, NotificationOptions
-from mcp.server.models import InitializationOptions
-from mcp.types import (
-    Resource,
-    TextResourceContents,
-    Tool,
-)
-from pydantic import AnyUrl
+from . import fanout, memory, metrics, outputs, symbols, trace, triage
+from .binary import default_cache_dir
+from .gdb_manager import COMMAND_TIMEOUT, GDBManager
+from .workers import WorkerPoolManager
+from .reference import CLI_SECTION, MAPPING_SECTION, MI_SECTION, CommandReference
 
-from .gdb_manager import GDBManager
+if TYPE_CHECKING:
+    from mcp.server.models import InitializationOptions
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Path to the GDB commands reference file
-COMMANDS_FILE = Path(__file__).parent.parent.parent / "resources" / "gdb_commands.md"
+# Transports the server can be run with; all but stdio serve HTTP
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+# Hosts only reachable from this machine, where HTTP may go without a token
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+# Environment variable holding the bearer token HTTP clients must send
+AUTH_TOKEN_ENV = "GDB_MCP_AUTH_TOKEN"
+
+# The GDB commands reference, shipped inside the package
+COMMANDS_FILE = resources.files(__package__) / "resources" / "gdb_commands.md"
+
+
+class _TokenAuth:
+    """ASGI middleware rejecting HTTP requests without the bearer token."""
+    
+    def __init__(self, app, token: str):
+        self.app = app
+        self.expected = f"Bearer {token}".encode()
+        
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            given = dict(scope["headers"]).get(b"authorization", b"")
+            if not hmac.compare_digest(given, self.expected):
+                await send({
+                    "type": "http.response.start",
+                    "status": 401,
+                    "headers": [(b"content-type", b"text/plain"), (b"www-authenticate", b"Bearer")],
+                })
+                await send({"type": "http.response.body", "body": b"Unauthorized\n"})
+                return
+        await self.app(scope, receive, send)
+
+
+def _bind_unix_socket(path: str) -> socket.socket:
+    """Bind a Unix socket only the server's user can connect to."""
+    if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            # Left behind by a server that didn't shut down cleanly
+            os.unlink(path)
+        else:
+            raise RuntimeError(f"Another server is listening on {path}")
+        finally:
+            probe.close()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # No moment in which others could connect, then make sure of the mode
+    umask = os.umask(0o177)
+    try:
+        sock.bind(path)
+    finally:
+        os.umask(umask)
+    os.chmod(path, 0o600)
+    return sock
 
 
 class GDBMCPServer:
     """MCP Server that provides GDB debugger resources and tools."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        workers: int = 0,
+        metrics_file: Optional[str] = None,
+        metrics_port: Optional[int] = None,
+        transport: str = "stdio",
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        socket_path: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        allow_unauthenticated: bool = False,
+        startup_profile: bool = False,
+        **manager_options,
+    ):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport: {transport}")
+        if transport != "stdio" and not socket_path and host not in LOOPBACK_HOSTS \
+                and not auth_token and not allow_unauthenticated:
+            raise ValueError(
+                f"Refusing to serve GDB on {host} without authentication; set an auth token "
+                f"or allow unauthenticated access explicitly"
+            )
+        # Phase -> milliseconds, logged once a client has initialized
+        self.startup: Optional[Dict[str, float]] = {} if startup_profile else None
+        self._started = time.perf_counter()
+        # The MCP SDK and pydantic dominate startup, so they are only loaded
+        # here, not when the module is imported (e.g. for --help)
+        from mcp.server import Server
+        
         self.server = Server("gdb-mcp")
-        self.gdb_manager = GDBManager()
+        mark = self._record_startup("import_mcp", self._started)
+        self.metrics_file = metrics_file
+        self.metrics_port = metrics_port
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.auth_token = auth_token
+        if workers:
+            # Sessions live in worker processes; this one only serves MCP
+            self.gdb_manager = WorkerPoolManager(workers, **manager_options)
+        else:
+            self.gdb_manager = GDBManager(**manager_options)
+        cache_dir = Path(manager_options.get("cache_dir") or default_cache_dir())
+        self.triage = triage.CoreTriage(self.gdb_manager, cache_dir / "triage")
+        self.symbols = symbols.SymbolIndex(self.gdb_manager, cache_dir / "symbols")
+        self.reference = CommandReference(COMMANDS_FILE)
         self._setup_handlers()
+        self._record_startup("setup", mark)
+        
+    def _record_startup(self, phase: str, since: float) -> float:
+        """Record how long a startup phase took if profiling; returns now."""
+        now = time.perf_counter()
+        if self.startup is not None:
+            self.startup[phase] = round((now - since) * 1000, 1)
+        return now
+        
+    async def metrics_text(self) -> str:
+        """Render the metrics of this process and of any workers."""
+        snapshots = [({}, metrics.REGISTRY.snapshot())]
+        if isinstance(self.gdb_manager, WorkerPoolManager):
+            snapshots += await self.gdb_manager.worker_metrics()
+        return metrics.render(snapshots)
         
     def _setup_handlers(self):
         """Set up the MCP server handlers."""
+        from mcp.types import InitializedNotification, Resource, ResourceTemplate, Tool
+        from pydantic import AnyUrl
+        
+        async def handle_initialized(notification: InitializedNotification):
+            if self.startup is not None and "initialized" not in self.startup:
+                self._record_startup("initialized", self._started)
+                phases = ", ".join(f"{phase} {ms} ms" for phase, ms in self.startup.items())
+                logger.info(f"Startup profile: {phases}")
+                
+        self.server.notification_handlers[InitializedNotification] = handle_initialized
         
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
@@ -65,46 +190,117 @@ class GDBMCPServer:
                     description="Correspondence between CLI and MI commands",
                     mimeType="text/markdown",
                 ),
+                Resource(
+                    uri=AnyUrl("gdb://metrics"),
+                    name="Server Metrics",
+                    description="Tool and GDB command latency histograms, byte counters, timeouts and "
+                                "session gauges in OpenMetrics text format",
+                    mimeType="text/plain",
+                ),
+                Resource(
+                    uri=AnyUrl("gdb://stats"),
+                    name="Server Statistics",
+                    description="Session count, GDB process pool hit rate and open latency percentiles",
+                    mimeType="application/json",
+                ),
             ]
         
         @self.server.read_resource()
         async def handle_read_resource(uri: AnyUrl) -> str:
             """Read a specific resource."""
             
-            # Load the commands file
-            if not COMMANDS_FILE.exists():
-                raise ValueError(f"Commands file not found: {COMMANDS_FILE}")
-                
-            content = COMMANDS_FILE.read_text(encoding="utf-8")
-            
             # Convert URI to string for comparison
             uri_str = str(uri)
             
-            # Parse the content based on the requested URI
+            if uri_str == "gdb://metrics":
+                return await self.metrics_text()
+            
+            if uri_str == "gdb://stats":
+                stats = self.gdb_manager.stats()
+                if asyncio.iscoroutine(stats):
+                    stats = await stats
+                return json.dumps({
+                    **stats,
+                    "core_triage": self.triage.stats(),
+                    "symbol_index": self.symbols.stats(),
+                })
+            
+            # Serve the reference from the parsed index
             if uri_str == "gdb://commands/reference":
                 # Return the full reference
-                return content
+                return self.reference.full_text()
             
             elif uri_str == "gdb://commands/cli":
                 # Extract CLI commands section
-                return self._extract_section(content, "## CLI Commands", "## MI Commands")
+                return self.reference.section(CLI_SECTION, MI_SECTION)
             
             elif uri_str == "gdb://commands/mi":
                 # Extract MI commands section
-                return self._extract_section(content, "## MI Commands", "## Command Correspondence")
+                return self.reference.section(MI_SECTION, MAPPING_SECTION)
             
             elif uri_str == "gdb://commands/mapping":
                 # Extract command mapping section
-                return self._extract_section(content, "## Command Correspondence", "## Notes")
+                return self.reference.section(MAPPING_SECTION, "Notes")
+            
+            elif uri_str.startswith("gdb://commands/cli/"):
+                # Single CLI command entry
+                return self.reference.render_command("cli", uri_str[len("gdb://commands/cli/"):])
+            
+            elif uri_str.startswith("gdb://commands/mi/"):
+                # Single MI command entry
+                return self.reference.render_command("mi", uri_str[len("gdb://commands/mi/"):])
             
             else:
                 raise ValueError(f"Unknown resource URI: {uri_str}")
         
+        @self.server.list_resource_templates()
+        async def handle_list_resource_templates() -> List[ResourceTemplate]:
+            """List parameterized resources."""
+            return [
+                ResourceTemplate(
+                    uriTemplate="gdb://commands/cli/{name}",
+                    name="GDB CLI Command",
+                    description="Reference entry for one CLI command, by name or abbreviation (e.g. break, bt, info%20frame)",
+                    mimeType="text/markdown",
+                ),
+                ResourceTemplate(
+                    uriTemplate="gdb://commands/mi/{name}",
+                    name="GDB MI Command",
+                    description="Reference entry for one MI command (e.g. -break-insert)",
+                    mimeType="text/markdown",
+                ),
+            ]
+        
         # Tool handlers
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List available tools."""
             return [
+                Tool(
+                    name="search_docs",
+                    description="Search the GDB command reference by keyword and return matching CLI/MI commands "
+                                "with the URI of each command's reference entry",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "query": {
+                                "type": "string",
+                                "description": "Keywords, e.g. \"watchpoint\" or \"list frames\""
+                            },
+                            "kind": {
+                                "type": "string",
+                                "enum": ["cli", "mi"],
+                                "description": "Only search CLI or MI commands"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of matches",
+                                "default": 10
+                            }
+                        },
+                        "required": ["query"]
+                    }
+                ),
                 Tool(
                     name="open",
                     description="Start a new GDB debugging session",
@@ -115,6 +311,21 @@ class GDBMCPServer:
                                 "type": "integer",
                                 "description": "Session timeout in seconds",
                                 "default": 300
+                            },
+                            "binary": {
+                                "type": "string",
+                                "description": "Target executable to load; sessions for the same build reuse already-loaded symbols"
+                            },
+                            "command_timeout": {
+                                "type": "number",
+                                "description": "Default seconds to wait for each command's result in this session",
+                                "default": 5
+                            },
+                            "output_budget": {
+                                "type": "integer",
+                                "description": "Characters of output returned per command; longer output is "
+                                               "summarized (head and tail) and kept for fetch_output. 0 for no limit "
+                                               "(default: the server's --output-budget)"
                             }
                         }
                     }
@@ -132,11 +343,399 @@ class GDBMCPServer:
                             "command": {
                                 "type": "string",
                                 "description": "GDB command to execute"
+                            },
+                            "timeout": {
+                                "type": "number",
+                                "description": "Seconds to wait for the result (default: the session's command_timeout)"
+                            },
+                            "detach": {
+                                "type": "boolean",
+                                "description": "If the timeout passes, keep collecting in the background and return "
+                                               "a pending handle to fetch the complete result with the 'result' tool",
+                                "default": False
+                            },
+                            "max_output": {
+                                "type": "integer",
+                                "description": "Output budget for this call, overriding the session's (0 for no limit)"
                             }
                         },
                         "required": ["id", "command"]
                     }
                 ),
+                Tool(
+                    name="result",
+                    description="Fetch the complete result of a command that returned a pending handle",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "handle": {
+                                "type": "string",
+                                "description": "The pending handle returned by call"
+                            },
+                            "timeout": {
+                                "type": "number",
+                                "description": "Seconds to wait if the command is still running",
+                                "default": 0
+                            },
+                            "max_output": {
+                                "type": "integer",
+                                "description": "Output budget for this call, overriding the session's (0 for no limit)"
+                            }
+                        },
+                        "required": ["id", "handle"]
+                    }
+                ),
+                Tool(
+                    name="fetch_output",
+                    description="Page or grep through the full output of a command whose response was truncated "
+                                "to the output budget",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "handle": {
+                                "type": "string",
+                                "description": "The truncated.handle returned with the command's response"
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Line to start from (next_offset of the previous page)",
+                                "default": 0
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of lines to return",
+                                "default": outputs.DEFAULT_PAGE_LINES
+                            },
+                            "grep": {
+                                "type": "string",
+                                "description": "Regular expression; only matching lines are returned"
+                            },
+                            "ignore_case": {
+                                "type": "boolean",
+                                "description": "Match grep case-insensitively",
+                                "default": False
+                            }
+                        },
+                        "required": ["id", "handle"]
+                    }
+                ),
+                Tool(
+                    name="batch",
+                    description="Send several commands to a GDB session in one request and return all results",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "commands": {
+                                "type": "array",
+                                "description": "Commands to execute in order",
+                                "items": {
+                                    "oneOf": [
+                                        {"type": "string"},
+                                        {
+                                            "type": "object",
+                                            "properties": {
+                                                "command": {"type": "string"},
+                                                "timeout": {
+                                                    "type": "number",
+                                                    "description": "Seconds to wait for this command's result"
+                                                }
+                                            },
+                                            "required": ["command"]
+                                        }
+                                    ]
+                                }
+                            },
+                            "stop_on_error": {
+                                "type": "boolean",
+                                "description": "Run commands one at a time and stop at the first error or timeout",
+                                "default": False
+                            },
+                            "max_output": {
+                                "type": "integer",
+                                "description": "Output budget for each command, overriding the session's (0 for no limit)"
+                            }
+                        },
+                        "required": ["id", "commands"]
+                    }
+                ),
+                Tool(
+                    name="read_memory",
+                    description="Read target memory as base64, in pages of at most page_size bytes",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "address": {
+                                "type": "string",
+                                "description": "Start address expression, e.g. \"0x601040\" or \"&buffer\""
+                            },
+                            "length": {
+                                "type": "integer",
+                                "description": "Total number of bytes to read"
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Offset from address to continue reading at (next_offset of the previous page)",
+                                "default": 0
+                            },
+                            "page_size": {
+                                "type": "integer",
+                                "description": "Maximum bytes returned by this call",
+                                "default": memory.DEFAULT_PAGE_SIZE
+                            }
+                        },
+                        "required": ["id", "address", "length"]
+                    }
+                ),
+                Tool(
+                    name="find_memory",
+                    description="Search target memory for a byte pattern or string inside GDB and return only the matching addresses",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "address": {
+                                "type": "string",
+                                "description": "Start address expression"
+                            },
+                            "length": {
+                                "type": "integer",
+                                "description": "Number of bytes to search"
+                            },
+                            "pattern": {
+                                "type": "string",
+                                "description": "Bytes to find as hex, e.g. \"deadbeef\""
+                            },
+                            "text": {
+                                "type": "string",
+                                "description": "String to find (alternative to pattern)"
+                            },
+                            "max_count": {
+                                "type": "integer",
+                                "description": "Stop after this many matches"
+                            }
+                        },
+                        "required": ["id", "address", "length"]
+                    }
+                ),
+                Tool(
+                    name="watch_state",
+                    description="Track expressions and registers (e.g. \"i\", \"histogram[index]\", \"$rip\") "
+                                "and return only the ones that changed since the previous call",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "add": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Expressions to start watching; their current values are returned"
+                            },
+                            "remove": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Expressions to stop watching"
+                            },
+                            "clear": {
+                                "type": "boolean",
+                                "description": "Stop watching all expressions first",
+                                "default": False
+                            }
+                        },
+                        "required": ["id"]
+                    }
+                ),
+                Tool(
+                    name="trace_until",
+                    description="Set breakpoints/watchpoints with conditions and run the program server-side, "
+                                "collecting expressions at every hit, until a condition holds, a hit limit, a "
+                                "timeout or another stop (crash, exit). Returns one table of the collected "
+                                "values and hit counts instead of one continue/print round-trip per hit",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "breakpoints": {
+                                "type": "array",
+                                "items": {
+                                    "oneOf": [
+                                        {"type": "string"},
+                                        {
+                                            "type": "object",
+                                            "properties": {
+                                                "location": {
+                                                    "type": "string",
+                                                    "description": "Breakpoint location, e.g. \"3.c:13\""
+                                                },
+                                                "watch": {
+                                                    "type": "string",
+                                                    "description": "Expression to watch instead of a location"
+                                                },
+                                                "kind": {
+                                                    "type": "string",
+                                                    "enum": list(trace.WATCH_KINDS),
+                                                    "default": "write"
+                                                },
+                                                "condition": {
+                                                    "type": "string",
+                                                    "description": "Only stop when this expression is true"
+                                                },
+                                                "collect": {
+                                                    "type": "array",
+                                                    "items": {"type": "string"},
+                                                    "description": "Expressions collected at this breakpoint only"
+                                                }
+                                            }
+                                        }
+                                    ]
+                                },
+                                "description": "Locations, or breakpoint/watchpoint descriptions"
+                            },
+                            "collect": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Expressions collected at every hit"
+                            },
+                            "until": {
+                                "type": "string",
+                                "description": "Stop tracing at the first hit where this expression is true"
+                            },
+                            "max_hits": {
+                                "type": "integer",
+                                "description": "Stop tracing after this many hits",
+                                "default": trace.DEFAULT_MAX_HITS
+                            },
+                            "timeout": {
+                                "type": "number",
+                                "description": "Seconds the program may run in total before it is interrupted",
+                                "default": trace.DEFAULT_TRACE_TIMEOUT
+                            },
+                            "max_rows": {
+                                "type": "integer",
+                                "description": "Most recent hits whose values are returned",
+                                "default": trace.DEFAULT_MAX_ROWS
+                            },
+                            "keep": {
+                                "type": "boolean",
+                                "description": "Keep the breakpoints afterwards instead of deleting them",
+                                "default": False
+                            }
+                        },
+                        "required": ["id", "breakpoints"]
+                    }
+                ),
+                Tool(
+                    name="checkpoint",
+                    description="Checkpoint the stopped program (a forked copy kept by GDB) so it can be "
+                                "restored later without re-running it; or delete checkpoints",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "delete": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Checkpoints to delete instead of taking a new one"
+                            }
+                        },
+                        "required": ["id"]
+                    }
+                ),
+                Tool(
+                    name="restore",
+                    description="Return the program to a checkpoint; the same checkpoint can be restored again",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "checkpoint": {
+                                "type": "string",
+                                "description": "Checkpoint returned by the checkpoint tool"
+                            }
+                        },
+                        "required": ["id", "checkpoint"]
+                    }
+                ),
+                Tool(
+                    name="clone",
+                    description="Open a new session holding a snapshot (core file) of this session's stopped "
+                                "program and its breakpoints, to inspect the stop independently. The clone "
+                                "can't resume execution",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID to clone"
+                            },
+                            "timeout": {
+                                "type": "integer",
+                                "description": "Idle timeout of the clone in seconds (default: that of the source)"
+                            }
+                        },
+                        "required": ["id"]
+                    }
+                ),
+                Tool(
+                    name="events",
+                    description="Read asynchronous GDB events (*stopped, =thread-created, console output "
+                                "between calls, ...) after a cursor, optionally waiting for new ones",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            },
+                            "cursor": {
+                                "type": "integer",
+                                "description": "Sequence number of the last event already seen",
+                                "default": 0
+                            },
+                            "timeout": {
+                                "type": "number",
+                                "description": "Seconds to wait for a new event if there is none after the cursor",
+                                "default": 0
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of events to return",
+                                "default": 100
+                            }
+                        },
+                        "required": ["id"]
+                    }
+                ),
                 Tool(
                     name="close",
                     description="Close a GDB session",
@@ -151,9 +750,192 @@ class GDBMCPServer:
                         "required": ["id"]
                     }
                 ),
+                Tool(
+                    name="analyze_core",
+                    description="Summarize a crash from a core file: signal, faulting frame, backtraces of all "
+                                "threads, registers and locals of the top frames. Results are cached by core "
+                                "file hash; with directory, all matching cores in it are analyzed concurrently",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "binary": {
+                                "type": "string",
+                                "description": "Path to the program that produced the core"
+                            },
+                            "core": {
+                                "type": "string",
+                                "description": "Path to the core file"
+                            },
+                            "directory": {
+                                "type": "string",
+                                "description": "Directory of core files to analyze instead of a single core"
+                            },
+                            "pattern": {
+                                "type": "string",
+                                "description": "Glob pattern of core files in directory",
+                                "default": "core*"
+                            },
+                            "frames": {
+                                "type": "integer",
+                                "description": "Top frames of the crashing thread whose locals are reported",
+                                "default": triage.DEFAULT_FRAMES
+                            },
+                            "max_parallel": {
+                                "type": "integer",
+                                "description": "Cores analyzed at once in directory mode",
+                                "default": triage.DEFAULT_PARALLEL
+                            },
+                            "refresh": {
+                                "type": "boolean",
+                                "description": "Ignore cached summaries",
+                                "default": False
+                            }
+                        },
+                        "required": ["binary"]
+                    }
+                ),
+                Tool(
+                    name="symbols",
+                    description="Find functions, variables, types and source files of a binary by name prefix, "
+                                "regex or fuzzy match. Each kind is listed from GDB once per build and cached "
+                                "by build-id, so repeated searches and further pages don't run GDB",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "binary": {
+                                "type": "string",
+                                "description": "Path to the program"
+                            },
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID whose binary to search instead of binary"
+                            },
+                            "query": {
+                                "type": "string",
+                                "description": "Name prefix, regex or fuzzy pattern; an empty prefix lists everything",
+                                "default": ""
+                            },
+                            "match": {
+                                "type": "string",
+                                "enum": list(symbols.MATCH_MODES),
+                                "description": "How query is matched against names; fuzzy matches "
+                                               "the characters in order, best matches first",
+                                "default": "prefix"
+                            },
+                            "kinds": {
+                                "type": "array",
+                                "items": {"type": "string", "enum": list(symbols.KINDS)},
+                                "description": "Kinds of entries to search (default: all)"
+                            },
+                            "ignore_case": {
+                                "type": "boolean",
+                                "description": "Match prefix and regex case-insensitively (fuzzy always is)",
+                                "default": False
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Index of the first match to return, e.g. a previous next_offset",
+                                "default": 0
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of matches to return",
+                                "default": symbols.DEFAULT_LIMIT
+                            },
+                            "refresh": {
+                                "type": "boolean",
+                                "description": "List the symbols from GDB again",
+                                "default": False
+                            }
+                        }
+                    }
+                ),
+                Tool(
+                    name="fanout",
+                    description="Run the same command script against many binaries or cores at once, in "
+                                "parallel pooled sessions. Identical responses are grouped across targets; "
+                                "each target's results are also sent as a progress notification when it "
+                                "finishes",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "targets": {
+                                "type": "array",
+                                "items": {
+                                    "oneOf": [
+                                        {"type": "string"},
+                                        {
+                                            "type": "object",
+                                            "properties": {
+                                                "binary": {"type": "string"},
+                                                "core": {"type": "string"},
+                                                "args": {"type": "string"},
+                                                "name": {"type": "string"},
+                                                "command_timeout": {"type": "number"}
+                                            },
+                                            "required": ["binary"]
+                                        }
+                                    ]
+                                },
+                                "description": "Binary paths, or objects with a binary and optionally a core "
+                                               "file to load, program arguments and a display name"
+                            },
+                            "script": {
+                                "type": "array",
+                                "items": {
+                                    "oneOf": [
+                                        {"type": "string"},
+                                        {
+                                            "type": "object",
+                                            "properties": {
+                                                "command": {"type": "string"},
+                                                "timeout": {"type": "number"}
+                                            },
+                                            "required": ["command"]
+                                        }
+                                    ]
+                                },
+                                "description": "Commands run in order on every target"
+                            },
+                            "max_parallel": {
+                                "type": "integer",
+                                "description": "Targets run at once",
+                                "default": fanout.DEFAULT_PARALLEL
+                            },
+                            "stop_on_error": {
+                                "type": "boolean",
+                                "description": "Stop a target's script at its first error",
+                                "default": False
+                            },
+                            "max_output": {
+                                "type": "integer",
+                                "description": "Characters of output kept per command and target; longer "
+                                               "output is cut to its head and tail (0 for no limit)",
+                                "default": outputs.DEFAULT_OUTPUT_BUDGET
+                            }
+                        },
+                        "required": ["targets", "script"]
+                    }
+                ),
+                Tool(
+                    name="attach",
+                    description="Resume using a session opened earlier, possibly by another client: returns its "
+                                "binary, event cursor, pending result handles, checkpoints and settings, and "
+                                "restarts its idle timeout",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "description": "Session ID"
+                            }
+                        },
+                        "required": ["id"]
+                    }
+                ),
                 Tool(
                     name="list_sessions",
-                    description="List all active GDB sessions",
+                    description="List all active GDB sessions, including those opened by other clients",
                     inputSchema={
                         "type": "object",
                         "properties": {}
@@ -163,11 +945,40 @@ class GDBMCPServer:
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
-            """Handle tool calls."""
+            """Handle tool calls, recording their latency and response size."""
+            start = time.perf_counter()
+            response = await call_tool(name, arguments)
+            text = response[0]["text"]
+            metrics.TOOL_DURATION.observe(time.perf_counter() - start, name)
+            metrics.RESPONSE_BYTES.inc(name, amount=len(text))
+            if text.startswith('{"type": "error"'):
+                metrics.TOOL_ERRORS.inc(name)
+            return response
+        
+        async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+            """Run a tool and encode its result or error."""
             try:
-                if name == "open":
+                if name == "search_docs":
+                    matches = self.reference.search(
+                        arguments["query"],
+                        arguments.get("kind"),
+                        arguments.get("limit", 10),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": {"matches": matches}
+                        })
+                    }]
+                
+                elif name == "open":
                     timeout = arguments.get("timeout", 300)
-                    session_id = await self.gdb_manager.create_session(timeout)
+                    binary = arguments.get("binary")
+                    command_timeout = arguments.get("command_timeout", COMMAND_TIMEOUT)
+                    session_id = await self.gdb_manager.create_session(
+                        timeout, binary, command_timeout, arguments.get("output_budget")
+                    )
                     return [{
                         "type": "text",
                         "text": json.dumps({
@@ -179,7 +990,251 @@ class GDBMCPServer:
                 elif name == "call":
                     session_id = arguments["id"]
                     command = arguments["command"]
-                    result = await self.gdb_manager.send_command(session_id, command)
+                    result = await self.gdb_manager.send_command(
+                        session_id,
+                        command,
+                        arguments.get("timeout"),
+                        arguments.get("detach", False),
+                        arguments.get("max_output"),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "result":
+                    result = await self.gdb_manager.fetch_result(
+                        arguments["id"],
+                        arguments["handle"],
+                        arguments.get("timeout", 0),
+                        arguments.get("max_output"),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "fetch_output":
+                    result = await self.gdb_manager.fetch_output(
+                        arguments["id"],
+                        arguments["handle"],
+                        offset=arguments.get("offset", 0),
+                        limit=arguments.get("limit", outputs.DEFAULT_PAGE_LINES),
+                        grep=arguments.get("grep"),
+                        ignore_case=arguments.get("ignore_case", False),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "batch":
+                    session_id = arguments["id"]
+                    result = await self.gdb_manager.run_batch(
+                        session_id,
+                        arguments["commands"],
+                        arguments.get("stop_on_error", False),
+                        arguments.get("max_output"),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "read_memory":
+                    result = await self.gdb_manager.read_memory(
+                        arguments["id"],
+                        arguments["address"],
+                        arguments["length"],
+                        offset=arguments.get("offset", 0),
+                        page_size=arguments.get("page_size", memory.DEFAULT_PAGE_SIZE),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "find_memory":
+                    result = await self.gdb_manager.find_memory(
+                        arguments["id"],
+                        arguments["address"],
+                        arguments["length"],
+                        pattern=arguments.get("pattern"),
+                        text=arguments.get("text"),
+                        max_count=arguments.get("max_count"),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "watch_state":
+                    result = await self.gdb_manager.watch_state(
+                        arguments["id"],
+                        add=arguments.get("add"),
+                        remove=arguments.get("remove"),
+                        clear=arguments.get("clear", False),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "trace_until":
+                    result = await self.gdb_manager.trace_until(
+                        arguments["id"],
+                        arguments["breakpoints"],
+                        collect=arguments.get("collect"),
+                        until=arguments.get("until"),
+                        max_hits=arguments.get("max_hits", trace.DEFAULT_MAX_HITS),
+                        timeout=arguments.get("timeout", trace.DEFAULT_TRACE_TIMEOUT),
+                        max_rows=arguments.get("max_rows", trace.DEFAULT_MAX_ROWS),
+                        keep=arguments.get("keep", False),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "checkpoint":
+                    result = await self.gdb_manager.checkpoint(arguments["id"], arguments.get("delete"))
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "restore":
+                    result = await self.gdb_manager.restore_checkpoint(arguments["id"], arguments["checkpoint"])
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "clone":
+                    result = await self.gdb_manager.clone_session(arguments["id"], arguments.get("timeout"))
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "events":
+                    session_id = arguments["id"]
+                    events = await self.gdb_manager.get_events(
+                        session_id,
+                        arguments.get("cursor", 0),
+                        arguments.get("timeout", 0),
+                        arguments.get("limit", 100),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": events
+                        })
+                    }]
+                
+                elif name == "analyze_core":
+                    frames = arguments.get("frames", triage.DEFAULT_FRAMES)
+                    refresh = arguments.get("refresh", False)
+                    if arguments.get("directory"):
+                        result = await self.triage.analyze_directory(
+                            arguments["binary"],
+                            arguments["directory"],
+                            arguments.get("pattern", "core*"),
+                            frames,
+                            arguments.get("max_parallel", triage.DEFAULT_PARALLEL),
+                            refresh,
+                        )
+                    elif arguments.get("core"):
+                        result = await self.triage.analyze(arguments["binary"], arguments["core"], frames, refresh)
+                    else:
+                        raise ValueError("Either core or directory is required")
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "symbols":
+                    binary = arguments.get("binary")
+                    if not binary and arguments.get("id"):
+                        binary = (await self.gdb_manager.describe_session(arguments["id"]))["binary"]
+                        if not binary:
+                            raise ValueError("The session was opened without a binary; pass binary")
+                    if not binary:
+                        raise ValueError("Either binary or id is required")
+                    result = await self.symbols.search(
+                        binary,
+                        arguments.get("query", ""),
+                        arguments.get("kinds"),
+                        arguments.get("match", "prefix"),
+                        arguments.get("ignore_case", False),
+                        arguments.get("offset", 0),
+                        arguments.get("limit", symbols.DEFAULT_LIMIT),
+                        arguments.get("refresh", False),
+                    )
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
+                elif name == "fanout":
+                    context = self.server.request_context
+                    progress_token = context.meta.progressToken if context.meta else None
+                    
+                    async def report(outcome: Dict[str, Any], done: int, total: int):
+                        if progress_token is not None:
+                            await context.session.send_progress_notification(
+                                progress_token, done, total, json.dumps(outcome), context.request_id
+                            )
+                            
+                    result = await fanout.run_fanout(
+                        self.gdb_manager,
+                        arguments["targets"],
+                        arguments["script"],
+                        arguments.get("max_parallel", fanout.DEFAULT_PARALLEL),
+                        arguments.get("stop_on_error", False),
+                        report,
+                        arguments.get("max_output", outputs.DEFAULT_OUTPUT_BUDGET),
+                    )
                     return [{
                         "type": "text",
                         "text": json.dumps({
@@ -199,6 +1254,16 @@ class GDBMCPServer:
                         })
                     }]
                 
+                elif name == "attach":
+                    result = await self.gdb_manager.attach_session(arguments["id"])
+                    return [{
+                        "type": "text",
+                        "text": json.dumps({
+                            "type": "ok",
+                            "content": result
+                        })
+                    }]
+                
                 elif name == "list_sessions":
                     sessions = await self.gdb_manager.list_sessions()
                     return [{
@@ -228,64 +1293,133 @@ class GDBMCPServer:
                     })
                 }]
     
-    def _extract_section(self, content: str, start_marker: str, end_marker: Optional[str] = None) -> str:
-        """Extract a section from the markdown content."""
-        lines = content.split('\n')
-        start_idx = None
-        end_idx = None
-        
-        for i, line in enumerate(lines):
-            if line.strip() == start_marker:
-                start_idx = i
-            elif end_marker and line.strip() == end_marker and start_idx is not None:
-                end_idx = i
-                break
+    def _init_options(self) -> "InitializationOptions":
+        from mcp.server import NotificationOptions
+        from mcp.server.models import InitializationOptions
         
-        if start_idx is None:
-            return f"Section '{start_marker}' not found"
+        return InitializationOptions(
+            server_name="gdb-mcp",
+            server_version="0.1.0",
+            capabilities=self.server.get_capabilities(
+                notification_options=NotificationOptions(),
+                experimental_capabilities={},
+            )
+        )
         
-        if end_idx is None:
-            # Return from start to end of file
-            return '\n'.join(lines[start_idx:])
-        else:
-            return '\n'.join(lines[start_idx:end_idx])
-    
     async def run(self):
         """Run the MCP server."""
+        # Start the GDB manager; GDB itself is started by the first open
+        started = time.perf_counter()
+        await self.gdb_manager.start()
+        self._record_startup("manager", started)
+        
+        # Optional metrics exporters
+        metrics_writer = metrics_server = None
+        if self.metrics_file:
+            metrics_writer = asyncio.create_task(
+                metrics.write_periodically(self.metrics_text, self.metrics_file)
+            )
+        if self.metrics_port:
+            metrics_server = await metrics.serve_http(self.metrics_text, self.metrics_port)
+            
+        try:
+            if self.transport == "stdio":
+                await self._run_stdio()
+            else:
+                await self._run_http()
+        finally:
+            if metrics_writer:
+                metrics_writer.cancel()
+            if metrics_server:
+                metrics_server.close()
+            # Clean up all GDB sessions on shutdown
+            await self.gdb_manager.cleanup()
+            
+    async def _run_stdio(self):
+        """Serve a single client over stdin/stdout."""
         from mcp.server.stdio import stdio_server
         
         async with stdio_server() as (read_stream, write_stream):
             logger.info("GDB MCP Server starting...")
+            await self.server.run(read_stream, write_stream, self._init_options())
             
-            # Run the server with initialization options
-            init_options = InitializationOptions(
-                server_name="gdb-mcp",
-                server_version="0.1.0",
-                capabilities=self.server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                )
-            )
+    async def _run_http(self):
+        """Serve any number of clients over HTTP until interrupted.
+        
+        GDB sessions belong to the server, not to the client connection that
+        opened them, so they stay open (up to their idle timeout) when a
+        client disconnects and can be used again by ID from any client.
+        """
+        import uvicorn
+        from starlette.applications import Starlette
+        from starlette.requests import Request
+        from starlette.responses import Response
+        from starlette.routing import Mount, Route
+        
+        if self.transport == "sse":
+            from mcp.server.sse import SseServerTransport
             
-            # Start the GDB manager
-            await self.gdb_manager.start()
+            sse = SseServerTransport("/messages/")
             
-            try:
-                await self.server.run(
-                    read_stream,
-                    write_stream,
-                    init_options
+            async def handle_sse(request: Request) -> Response:
+                async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+                    await self.server.run(read_stream, write_stream, self._init_options())
+                return Response()
+                
+            app = Starlette(routes=[
+                Route("/sse", endpoint=handle_sse, methods=["GET"]),
+                Mount("/messages/", app=sse.handle_post_message),
+            ])
+            session_manager = None
+            endpoint = "/sse"
+        else:
+            from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+            
+            session_manager = StreamableHTTPSessionManager(self.server)
+            
+            class StreamableHTTPApp:
+                # A class instance, so Starlette routes raw ASGI calls to it
+                async def __call__(self, scope, receive, send):
+                    await session_manager.handle_request(scope, receive, send)
+                    
+            app = Starlette(routes=[Route("/mcp", endpoint=StreamableHTTPApp())])
+            endpoint = "/mcp"
+            
+        if self.auth_token:
+            app = _TokenAuth(app, self.auth_token)
+        config = uvicorn.Config(app, host=self.host, port=self.port, log_level="info")
+        # uvicorn would make a socket it binds itself world-writable
+        sockets = [_bind_unix_socket(self.socket_path)] if self.socket_path else None
+        if self.socket_path:
+            logger.info(f"GDB MCP Server listening on unix:{self.socket_path} ({self.transport}, {endpoint})")
+        else:
+            if self.host not in LOOPBACK_HOSTS and not self.auth_token:
+                logger.warning(
+                    f"Listening on {self.host} without authentication: anyone who can connect "
+                    f"can run GDB commands on this host"
                 )
-            finally:
-                # Clean up all GDB sessions on shutdown
-                await self.gdb_manager.cleanup()
+            logger.info(f"GDB MCP Server listening on http://{self.host}:{self.port}{endpoint} ({self.transport})")
+        server = uvicorn.Server(config)
+        try:
+            if session_manager is None:
+                await server.serve(sockets)
+            else:
+                async with session_manager.run():
+                    await server.serve(sockets)
+        finally:
+            if self.socket_path:
+                try:
+                    os.unlink(self.socket_path)
+                except OSError:
+                    pass
 
 
-async def main():
+async def main(**options):
     """Main entry point."""
-    server = GDBMCPServer()
+    server = GDBMCPServer(**options)
     await server.run()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
\ No newline at end of file
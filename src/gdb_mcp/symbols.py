@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Searchable index of a binary's symbols and source files, cached by build-id."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .binary import binary_key
+from .mi_parser import result_data
+
+logger = logging.getLogger(__name__)
+
+# MI command listing each kind of entry; non-debugging symbols are included
+# so that stripped code can be found by name too
+KINDS = {
+    "function": "-symbol-info-functions --include-nondebug",
+    "variable": "-symbol-info-variables --include-nondebug",
+    "type": "-symbol-info-types",
+    "source": "-file-list-exec-source-files",
+}
+
+MATCH_MODES = ("prefix", "regex", "fuzzy")
+
+# Seconds to wait for GDB to list the symbols of one kind
+INDEX_TIMEOUT = 300
+
+# Matches returned per page by default
+DEFAULT_LIMIT = 50
+
+# Symbol tables (one binary, one kind) kept in memory; all are also on disk
+MEMORY_CACHE_SIZE = 16
+
+# Match lists of recent queries kept for paging through them
+QUERY_CACHE_SIZE = 32
+
+# An entry: name, file, line, type (or declaration), address
+Entry = Tuple[str, Optional[str], Optional[int], Optional[str], Optional[str]]
+
+
+def _line(value: Optional[str]) -> Optional[int]:
+    return int(value) if value and value.isdigit() else None
+
+
+def parse_entries(kind: str, data: Dict[str, Any]) -> List[Entry]:
+    """Turn the result of a KINDS command into index entries."""
+    entries: List[Entry] = []
+    if kind == "source":
+        for f in data.get("files", []):
+            entries.append((f["file"], f.get("fullname"), None, None, None))
+        return entries
+    symbols = data.get("symbols", {})
+    for group in symbols.get("debug", []):
+        filename = group.get("fullname") or group.get("filename")
+        for s in group.get("symbols", []):
+            entries.append((s["name"], filename, _line(s.get("line")), s.get("type"), None))
+    for s in symbols.get("nondebug", []):
+        entries.append((s["name"], None, None, None, s.get("address")))
+    return entries
+
+
+def _fuzzy_score(query: str, name: str) -> Tuple[int, ...]:
+    """Rank a name containing query's characters in order; lower is better.
+
+    Names containing query as a whole come first, then those where the
+    matched characters are closest together, nearest the start and in the
+    shortest name.
+    """
+    index = name.find(query)
+    if index >= 0:
+        return (0, 0, index, len(name))
+    gaps, position, first = 0, -1, None
+    for ch in query:
+        found = name.find(ch, position + 1)
+        if first is None:
+            first = found
+        elif found > position + 1:
+            gaps += found - position - 1
+        position = found
+    return (1, gaps, first or 0, len(name))
+
+
+class SymbolTable:
+    """The entries of one kind of one binary, sorted for prefix search."""
+
+    def __init__(self, kind: str, entries: List[Entry]):
+        self.kind = kind
+        self.entries = sorted(entries, key=lambda e: (e[0].casefold(), e[0], e[1] or ""))
+        self.keys = [e[0].casefold() for e in self.entries]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def match(self, query: str, mode: str, ignore_case: bool) -> List[Tuple[Any, Entry]]:
+        """Return (sort key, entry) of all entries matching query."""
+        if mode == "prefix":
+            folded = query.casefold()
+            matches = []
+            for i in range(bisect_left(self.keys, folded), len(self.keys)):
+                if not self.keys[i].startswith(folded):
+                    break
+                entry = self.entries[i]
+                if ignore_case or entry[0].startswith(query):
+                    matches.append(((self.keys[i], entry[0]), entry))
+            return matches
+        if mode == "regex":
+            try:
+                pattern = re.compile(query, re.IGNORECASE if ignore_case else 0)
+            except re.error as e:
+                raise ValueError(f"Invalid regex: {e}")
+            return [((key, e[0]), e) for key, e in zip(self.keys, self.entries) if pattern.search(e[0])]
+        # Fuzzy: the query's characters in order, found by the regex engine
+        # first so that only candidates are scored; always case-insensitive
+        folded = query.casefold()
+        pattern = re.compile(".*?".join(re.escape(ch) for ch in folded), re.IGNORECASE)
+        return [
+            (_fuzzy_score(folded, key) + (key,), e)
+            for key, e in zip(self.keys, self.entries)
+            if pattern.search(e[0])
+        ]
+
+
+class SymbolIndex:
+    """Symbols of binaries, listed once per build and then searched locally.
+
+    Each kind of entry (functions, variables, types, source files) is listed
+    with one MI command in a pooled session of the binary when it is first
+    queried, so only the kinds actually used are ever built. Tables are
+    cached by the binary's build-id (its path and mtime without one), in
+    memory and as JSON files under cache_dir; later queries, also after a
+    restart, don't touch GDB at all.
+    """
+
+    def __init__(self, manager, cache_dir: Optional[Path] = None):
+        self.manager = manager
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Symbol index disk cache disabled, cannot create {cache_dir}: {e}")
+                self.cache_dir = None
+        self._tables: "OrderedDict[str, SymbolTable]" = OrderedDict()
+        self._queries: "OrderedDict[Tuple[Any, ...], List[Tuple[str, Entry]]]" = OrderedDict()
+        # Table key -> task listing it, so concurrent queries build it once
+        self._building: Dict[str, "asyncio.Future[Dict[str, SymbolTable]]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _table_get(self, key: str) -> Optional[SymbolTable]:
+        table = self._tables.get(key)
+        if table is None and self.cache_dir is not None:
+            try:
+                stored = json.loads((self.cache_dir / f"{key}.json").read_text())
+                table = SymbolTable(stored["kind"], [tuple(e) for e in stored["entries"]])
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+        if table is not None:
+            self._table_put(key, table, persist=False)
+        return table
+
+    def _table_put(self, key: str, table: SymbolTable, persist: bool = True):
+        self._tables[key] = table
+        self._tables.move_to_end(key)
+        while len(self._tables) > MEMORY_CACHE_SIZE:
+            self._tables.popitem(last=False)
+        if persist and self.cache_dir is not None:
+            try:
+                (self.cache_dir / f"{key}.json").write_text(
+                    json.dumps({"kind": table.kind, "entries": table.entries})
+                )
+            except OSError as e:
+                logger.warning(f"Cannot write symbol index cache entry {key}: {e}")
+
+    async def _build(self, binary: str, keys: Dict[str, str]) -> Dict[str, SymbolTable]:
+        """List the given kinds in one session of the binary; keys maps kind to table key."""
+        session_id = await self.manager.create_session(binary=binary, command_timeout=INDEX_TIMEOUT)
+        try:
+            tables = {}
+            for kind, key in keys.items():
+                start = time.perf_counter()
+                # The whole listing is needed here, however large
+                response = await self.manager.send_command(session_id, KINDS[kind], INDEX_TIMEOUT, False, 0)
+                table = SymbolTable(kind, parse_entries(kind, result_data(response, f"listing {kind} symbols")))
+                self._table_put(key, table)
+                tables[kind] = table
+                logger.info(
+                    f"Indexed {len(table)} {kind} entries of {binary} in {(time.perf_counter() - start) * 1000:.0f} ms"
+                )
+            return tables
+        finally:
+            await self.manager.close_session(session_id)
+
+    async def _tables_for(self, identity: str, binary: str, kinds: List[str], refresh: bool) -> Tuple[List[SymbolTable], bool]:
+        """Return the binary's tables of kinds and whether all of them were cached."""
+        keys = {kind: f"{identity}-{kind}" for kind in kinds}
+
+        tables: Dict[str, SymbolTable] = {}
+        if not refresh:
+            for kind, key in keys.items():
+                table = self._table_get(key)
+                if table is not None:
+                    tables[kind] = table
+        missing = {
+            kind: key for kind, key in keys.items()
+            if kind not in tables and key not in self._building
+        }
+        if missing:
+            task = asyncio.ensure_future(self._build(binary, missing))
+            for key in missing.values():
+                self._building[key] = task
+            task.add_done_callback(lambda _: [self._building.pop(k, None) for k in missing.values()])
+        cached = len(tables) == len(kinds)
+        pending = {kind: self._building[key] for kind, key in keys.items() if kind not in tables}
+        for kind, task in pending.items():
+            tables[kind] = (await asyncio.shield(task))[kind]
+        if cached:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return [tables[kind] for kind in kinds], cached
+
+    async def search(
+        self,
+        binary: str,
+        query: str = "",
+        kinds: Optional[List[str]] = None,
+        match: str = "prefix",
+        ignore_case: bool = False,
+        offset: int = 0,
+        limit: int = DEFAULT_LIMIT,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Return a page of the binary's entries of kinds whose name matches query.
+
+        Prefix and regex matches are sorted by name, fuzzy ones best first
+        (see _fuzzy_score). An empty prefix lists every entry.
+        """
+        start = time.perf_counter()
+        kinds = list(kinds or KINDS)
+        for kind in kinds:
+            if kind not in KINDS:
+                raise ValueError(f"Unknown symbol kind: {kind}")
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode: {match}")
+        if match == "fuzzy" and not query:
+            raise ValueError("A fuzzy search needs a query")
+        if offset < 0 or limit <= 0:
+            raise ValueError("offset must not be negative and limit must be positive")
+
+        key_of_binary = binary_key(binary)
+        identity = key_of_binary.build_id or hashlib.sha256(
+            f"{key_of_binary.path}:{key_of_binary.mtime_ns}".encode()
+        ).hexdigest()[:16]
+        if refresh:
+            for stale in [k for k in self._queries if k[0] == identity]:
+                del self._queries[stale]
+        tables, cached = await self._tables_for(identity, key_of_binary.path, kinds, refresh)
+
+        query_key = (identity, tuple(kinds), query, match, ignore_case)
+        matches = self._queries.get(query_key)
+        if matches is None:
+            scored = [
+                (sort_key, table.kind, entry)
+                for table in tables
+                for sort_key, entry in table.match(query, match, ignore_case)
+            ]
+            scored.sort(key=lambda item: (item[0], item[1]))
+            matches = [(kind, entry) for _, kind, entry in scored]
+        self._queries[query_key] = matches
+        self._queries.move_to_end(query_key)
+        while len(self._queries) > QUERY_CACHE_SIZE:
+            self._queries.popitem(last=False)
+
+        page = []
+        for kind, (name, filename, line, type_, address) in matches[offset:offset + limit]:
+            item: Dict[str, Any] = {"kind": kind, "name": name}
+            if filename:
+                item["file"] = filename
+            if line is not None:
+                item["line"] = line
+            if type_:
+                item["type"] = type_
+            if address:
+                item["address"] = address
+            page.append(item)
+        end = offset + len(page)
+        return {
+            "binary": key_of_binary.path,
+            "build_id": key_of_binary.build_id,
+            "symbols": page,
+            "total": len(matches),
+            "next_offset": end if end < len(matches) else None,
+            "indexed": {table.kind: len(table) for table in tables},
+            "cached": cached,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "tables": len(self._tables)}
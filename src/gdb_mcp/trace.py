@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Server-side tracing: run to a stop condition, collecting values at every hit."""
+
+import asyncio
+import logging
+import signal
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .mi_parser import quote, result_data
+
+logger = logging.getLogger(__name__)
+
+# Breakpoint hits after which tracing stops by default
+DEFAULT_MAX_HITS = 1000
+
+# Seconds the traced program may run in total by default
+DEFAULT_TRACE_TIMEOUT = 60
+
+# Hits whose collected values are returned by default (the most recent ones)
+DEFAULT_MAX_ROWS = 200
+
+# Seconds to wait for the program to stop after interrupting it
+INTERRUPT_TIMEOUT = 5
+
+# -break-watch option per watchpoint kind
+WATCH_KINDS = {"write": "", "read": "-r ", "access": "-a "}
+
+# Result names of watchpoints in -break-watch results and *stopped records
+_WATCHPOINT_KEYS = ("wpt", "hw-rwpt", "hw-awpt")
+
+
+def _stopped_number(stop: Dict[str, Any]) -> Optional[str]:
+    """Return the breakpoint or watchpoint number a *stopped record is for."""
+    if "bkptno" in stop:
+        return stop["bkptno"]
+    for key in _WATCHPOINT_KEYS:
+        if isinstance(stop.get(key), dict):
+            return stop[key].get("number")
+    return None
+
+
+class _Tracer:
+    """State of one trace_until call on a session."""
+
+    def __init__(self, session):
+        self.session = session
+        # Breakpoint number -> description, in insertion order
+        self.traced: Dict[str, Dict[str, Any]] = {}
+
+    async def insert(self, spec: Any, collect: List[str]):
+        """Insert one breakpoint or watchpoint described by spec."""
+        if isinstance(spec, str):
+            spec = {"location": spec}
+        if not isinstance(spec, dict):
+            raise ValueError(f"Invalid trace breakpoint: {spec!r}")
+        condition = spec.get("condition")
+        send = self.session.send_command
+        if spec.get("watch"):
+            kind = spec.get("kind", "write")
+            if kind not in WATCH_KINDS:
+                raise ValueError(f"Unknown watchpoint kind: {kind}")
+            data = result_data(
+                await send(f"-break-watch {WATCH_KINDS[kind]}{quote(spec['watch'])}"),
+                f"setting watchpoint on {spec['watch']}",
+            )
+            number = next(data[k]["number"] for k in _WATCHPOINT_KEYS if k in data)
+            entry = {"number": number, "watch": spec["watch"], "kind": kind}
+            # Registered at once so it is deleted again if the condition fails
+            self.traced[number] = entry
+            if condition:
+                result_data(await send(f"-break-condition {number} {condition}"), f"setting condition {condition}")
+        elif spec.get("location"):
+            option = f"-c {quote(condition)} " if condition else ""
+            data = result_data(
+                await send(f"-break-insert {option}{quote(spec['location'])}"),
+                f"setting breakpoint at {spec['location']}",
+            )
+            bkpt = data["bkpt"]
+            number = (bkpt[0] if isinstance(bkpt, list) else bkpt)["number"]
+            entry = {"number": number, "location": spec["location"]}
+            self.traced[number] = entry
+        else:
+            raise ValueError(f"Trace breakpoint needs a location or watch expression: {spec!r}")
+        if condition:
+            entry["condition"] = condition
+        entry["collect"] = collect + [e for e in spec.get("collect", []) if e not in collect]
+        entry["hits"] = 0
+
+    async def wait_for_stop(self, cursor: int, timeout: float) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Return the first *stopped record after cursor, or None on timeout."""
+        events = self.session.events
+        deadline = time.monotonic() + timeout
+        while True:
+            page = events.read(cursor, 1000)
+            for event in page["events"]:
+                cursor = event["seq"]
+                if event["type"] == "exec" and event.get("class") == "stopped":
+                    return event["results"], cursor
+            cursor = page["cursor"]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.session.is_alive:
+                return None, cursor
+            await events.wait(cursor, remaining)
+            # Waiting for the program counts as activity of the session
+            self.session.last_activity = datetime.now()
+
+    async def evaluate(self, expressions: List[str]) -> Dict[str, Any]:
+        """Evaluate expressions in the current frame, pipelined."""
+        responses = await asyncio.gather(*(
+            self.session.send_command(f"-data-evaluate-expression {quote(e)}") for e in expressions
+        ))
+        values = {}
+        for expr, response in zip(expressions, responses):
+            result = response["result"]
+            if result is None:
+                values[expr] = {"error": "timed out"}
+            elif result["status"] == "error":
+                values[expr] = {"error": result["message"]}
+            else:
+                values[expr] = result["data"].get("value")
+        return values
+
+    async def remove(self):
+        for number in self.traced:
+            try:
+                await self.session.send_command(f"-break-delete {number}")
+            except Exception as e:
+                logger.warning(f"Failed to delete traced breakpoint {number}: {e}")
+
+
+async def trace_until(
+    session,
+    breakpoints: List[Any],
+    collect: Optional[List[str]] = None,
+    until: Optional[str] = None,
+    max_hits: int = DEFAULT_MAX_HITS,
+    timeout: float = DEFAULT_TRACE_TIMEOUT,
+    max_rows: int = DEFAULT_MAX_ROWS,
+    keep: bool = False,
+) -> Dict[str, Any]:
+    """Run a session's program through breakpoint hits without client round-trips.
+
+    Each entry of breakpoints is a location string or a dict with either
+    "location" or "watch" (plus "kind": write, read or access), and
+    optionally "condition" and "collect" (expressions for that breakpoint
+    only). Conditions are attached to the breakpoints, so GDB (or the target,
+    where it evaluates conditions itself) skips non-matching hits without
+    stopping. At every matching hit the collect expressions are evaluated,
+    then until if given, and the program is continued. Tracing ends when
+    until is true, after max_hits hits, after timeout seconds, or when the
+    program stops for any other reason (exit, signal, another breakpoint).
+    The program is started if it is not running yet. Unless keep is set, the
+    breakpoints are deleted again afterwards.
+    """
+    start = time.perf_counter()
+    if not breakpoints:
+        raise ValueError("At least one breakpoint or watchpoint is required")
+    if max_hits <= 0 or max_rows <= 0:
+        raise ValueError("max_hits and max_rows must be positive")
+    collect = list(collect or [])
+    tracer = _Tracer(session)
+    rows: deque = deque(maxlen=max_rows)
+    total = 0
+    reason = None
+    stop: Optional[Dict[str, Any]] = None
+    deadline = time.monotonic() + timeout
+    try:
+        for spec in breakpoints:
+            await tracer.insert(spec, collect)
+        command = "-exec-continue"
+        while reason is None:
+            cursor = session.events.last_seq
+            response = await session.send_command(command)
+            result = response["result"]
+            if command == "-exec-continue" and result and result["status"] == "error" \
+                    and "not being run" in result["message"]:
+                command = "-exec-run"
+                continue
+            result_data(response, f"resuming the program with {command}")
+            command = "-exec-continue"
+
+            stop, cursor = await tracer.wait_for_stop(cursor, deadline - time.monotonic())
+            if stop is None:
+                reason = "timeout"
+                if session.is_alive:
+                    # Without mi-async GDB reads no commands while the program
+                    # runs, so -exec-interrupt would just be queued; SIGINT
+                    # interrupts the program like Ctrl-C does
+                    session.process.send_signal(signal.SIGINT)
+                    stop, cursor = await tracer.wait_for_stop(cursor, INTERRUPT_TIMEOUT)
+                break
+
+            entry = tracer.traced.get(_stopped_number(stop))
+            if entry is None:
+                reason = stop.get("reason", "stopped")
+                break
+            entry["hits"] += 1
+            total += 1
+            frame = stop.get("frame", {})
+            row = {
+                "hit": total,
+                "breakpoint": entry["number"],
+                "frame": {k: frame[k] for k in ("func", "file", "line") if k in frame},
+                "values": await tracer.evaluate(entry["collect"]),
+            }
+            if "value" in stop:
+                # Old and new value of a watched expression
+                row["watch"] = stop["value"]
+            rows.append(row)
+
+            if until:
+                # GDB prints values in the program's terms (e.g. 0 '\000' for
+                # a char), so have it reduce the condition to 0 or 1
+                test = f"!!({until})"
+                if (await tracer.evaluate([test]))[test] == "1":
+                    reason = "until"
+            if reason is None and total >= max_hits:
+                reason = "max_hits"
+    finally:
+        # A program that didn't stop even when interrupted keeps GDB from
+        # reading commands, so deleting the breakpoints would only time out
+        if not keep and not (reason == "timeout" and stop is None):
+            await tracer.remove()
+
+    return {
+        "reason": reason,
+        "stop": stop,
+        "hits": total,
+        "breakpoints": list(tracer.traced.values()),
+        "rows": list(rows),
+        "dropped_rows": total - len(rows),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
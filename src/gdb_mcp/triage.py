@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Structured crash summaries of core files, cached by core file hash."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import signal
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .binary import binary_key
+from .mi_parser import console_text, quote, result_data
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for GDB to load a core file
+CORE_LOAD_TIMEOUT = 120
+
+# Seconds to wait for any other triage command
+TRIAGE_COMMAND_TIMEOUT = 30
+
+# Frames of the crashing thread whose locals are reported by default
+DEFAULT_FRAMES = 3
+
+# Cores analyzed at once by analyze_directory by default
+DEFAULT_PARALLEL = 4
+
+# Summaries kept in memory; all of them are also kept on disk
+MEMORY_CACHE_SIZE = 256
+
+_SIGNAL_RE = re.compile(r"Program terminated with signal (\w+), ([^.\n]+)")
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CoreTriage:
+    """Analyzes core files in pooled sessions and caches the summaries.
+
+    Sessions are opened with the binary so that symbol-loaded template
+    sessions of the pool are reused across cores of the same program; the
+    core is detached again when the session is closed and reset. Summaries
+    are cached by the SHA-256 of the core file together with the binary's
+    identity, in memory and as JSON files under cache_dir.
+    """
+
+    def __init__(self, manager, cache_dir: Optional[Path] = None):
+        self.manager = manager
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Core triage disk cache disabled, cannot create {cache_dir}: {e}")
+                self.cache_dir = None
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        summary = self._cache.get(key)
+        if summary is None and self.cache_dir is not None:
+            try:
+                summary = json.loads((self.cache_dir / f"{key}.json").read_text())
+            except (OSError, ValueError):
+                return None
+        if summary is not None:
+            self._cache_put(key, summary, persist=False)
+        return summary
+
+    def _cache_put(self, key: str, summary: Dict[str, Any], persist: bool = True):
+        self._cache[key] = summary
+        self._cache.move_to_end(key)
+        while len(self._cache) > MEMORY_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        if persist and self.cache_dir is not None:
+            try:
+                (self.cache_dir / f"{key}.json").write_text(json.dumps(summary))
+            except OSError as e:
+                logger.warning(f"Cannot write core triage cache entry {key}: {e}")
+
+    async def analyze(
+        self,
+        binary: str,
+        core: str,
+        frames: int = DEFAULT_FRAMES,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Return the crash summary of one core file."""
+        start = time.perf_counter()
+        core_path = Path(core).expanduser().resolve()
+        if not core_path.is_file():
+            raise ValueError(f"Core file not found: {core}")
+        key_of_binary = binary_key(binary)
+        core_hash = await asyncio.to_thread(file_digest, core_path)
+        identity = key_of_binary.build_id or f"{key_of_binary.path}:{key_of_binary.mtime_ns}"
+        key = f"{core_hash}-{hashlib.sha256(identity.encode()).hexdigest()[:16]}-{frames}"
+
+        if not refresh:
+            cached = self._cache_get(key)
+            if cached is not None:
+                self.hits += 1
+                return {**cached, "cached": True, "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)}
+        self.misses += 1
+
+        session_id = await self.manager.create_session(binary=binary, command_timeout=TRIAGE_COMMAND_TIMEOUT)
+        try:
+            summary = await self._summarize(session_id, str(core_path), frames)
+        finally:
+            await self.manager.close_session(session_id)
+        summary = {
+            "binary": key_of_binary.path,
+            "core": str(core_path),
+            "core_sha256": core_hash,
+            **summary,
+        }
+        self._cache_put(key, summary)
+        return {**summary, "cached": False, "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)}
+
+    async def _summarize(self, session_id: str, core: str, frames: int) -> Dict[str, Any]:
+        """Load the core into a session and collect the crash summary."""
+        def send(session_id: str, command: str, timeout: Optional[float] = None):
+            # The whole result is needed, whatever the output budget
+            return self.manager.send_command(session_id, command, timeout, False, 0)
+
+        response = await send(session_id, f"-target-select core {quote(core)}", CORE_LOAD_TIMEOUT)
+        result_data(response, f"loading core file {core}")
+
+        crash_signal = None
+        m = _SIGNAL_RE.search(console_text(response["output"].split("\n")))
+        if m:
+            crash_signal = {"name": m.group(1), "description": m.group(2)}
+        else:
+            value = (await send(session_id, "-data-evaluate-expression $_siginfo.si_signo"))["result"]
+            if value and value["status"] == "done":
+                try:
+                    signo = signal.Signals(int(value["data"]["value"]))
+                    crash_signal = {"name": signo.name, "description": signal.strsignal(signo)}
+                except (KeyError, ValueError):
+                    pass
+
+        info = result_data(await send(session_id, "-thread-info"), "listing threads")
+        crashing = info.get("current-thread-id")
+
+        async def backtrace(thread: Dict[str, Any]) -> Dict[str, Any]:
+            data = result_data(
+                await send(session_id, f"-stack-list-frames --thread {thread['id']}"),
+                f"listing frames of thread {thread['id']}",
+            )
+            return {
+                "id": thread["id"],
+                "target_id": thread.get("target-id"),
+                "name": thread.get("name"),
+                "frames": data.get("stack", []),
+            }
+
+        threads = await asyncio.gather(*(backtrace(t) for t in info.get("threads", [])))
+        crash_frames = next((t["frames"] for t in threads if t["id"] == crashing), [])
+
+        registers = {}
+        if crashing is not None:
+            names = result_data(await send(session_id, "-data-list-register-names"), "listing registers")
+            values = result_data(
+                await send(session_id, f"-data-list-register-values --thread {crashing} --frame 0 --skip-unavailable x"),
+                "reading registers",
+            )
+            register_names = names.get("register-names", [])
+            for entry in values.get("register-values", []):
+                number = int(entry["number"])
+                value = entry.get("value", "")
+                # Vector registers are nested structures; keep scalar ones
+                if number < len(register_names) and register_names[number] and not value.startswith("{"):
+                    registers[register_names[number]] = value
+
+        async def frame_locals(frame: Dict[str, Any]) -> Dict[str, Any]:
+            response = await send(
+                session_id,
+                f"-stack-list-variables --thread {crashing} --frame {frame['level']} --simple-values",
+            )
+            result = response["result"]
+            variables = result["data"].get("variables", []) if result and result["status"] == "done" else []
+            return {"level": frame["level"], "func": frame.get("func"), "variables": variables}
+
+        local_frames = []
+        if crashing is not None:
+            local_frames = await asyncio.gather(*(frame_locals(f) for f in crash_frames[:frames]))
+
+        return {
+            "signal": crash_signal,
+            "crashing_thread": crashing,
+            "faulting_frame": crash_frames[0] if crash_frames else None,
+            # First frame with source information, usually the program's own code
+            "source_frame": next((f for f in crash_frames if f.get("file")), None),
+            "threads": threads,
+            "registers": registers,
+            "locals": local_frames,
+        }
+
+    async def analyze_directory(
+        self,
+        binary: str,
+        directory: str,
+        pattern: str = "core*",
+        frames: int = DEFAULT_FRAMES,
+        max_parallel: int = DEFAULT_PARALLEL,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Analyze every core file in a directory, a few at a time."""
+        start = time.perf_counter()
+        root = Path(directory).expanduser()
+        if not root.is_dir():
+            raise ValueError(f"Directory not found: {directory}")
+        if max_parallel <= 0:
+            raise ValueError("max_parallel must be positive")
+        cores = sorted(p for p in root.glob(pattern) if p.is_file())
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def analyze_one(core: Path) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.analyze(binary, str(core), frames, refresh)
+                except Exception as e:
+                    logger.error(f"Core triage of {core} failed: {e}")
+                    return {"core": str(core), "error": str(e)}
+
+        results: List[Dict[str, Any]] = await asyncio.gather(*(analyze_one(c) for c in cores))
+        return {
+            "results": results,
+            "count": len(results),
+            "failed": sum(1 for r in results if "error" in r),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self._cache)}
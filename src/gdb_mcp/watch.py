@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Change tracking of watched expressions using MI variable objects."""
+
+from typing import Any, Dict, Iterable, List
+
+from .mi_parser import quote
+
+
+class WatchState:
+    """Set of expressions whose changes are reported between stops.
+
+    Each expression is a floating MI variable object (``-var-create - @``),
+    so it is re-evaluated in whatever frame is selected when updated, and a
+    single ``-var-update`` returns only the values that changed.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        # Expression -> variable object name, and the reverse
+        self._vars: Dict[str, str] = {}
+        self._exprs: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._vars)
+
+    async def add(self, expressions: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Create variable objects; returns initial values and errors."""
+        values, errors = [], []
+        for expr in expressions:
+            if expr in self._vars:
+                continue
+            response = await self.session.send_command(f"-var-create - @ {quote(expr)}")
+            result = response["result"]
+            if result is None or result["status"] != "done":
+                message = result["message"] if result else "timed out"
+                errors.append({"expression": expr, "error": message})
+                continue
+            data = result["data"]
+            self._vars[expr] = data["name"]
+            self._exprs[data["name"]] = expr
+            values.append({"expression": expr, "value": data.get("value"), "type": data.get("type")})
+        return {"values": values, "errors": errors}
+
+    async def remove(self, expressions: Iterable[str]):
+        """Delete the variable objects of the given expressions."""
+        for expr in expressions:
+            name = self._vars.pop(expr, None)
+            if name is not None:
+                self._exprs.pop(name, None)
+                await self.session.send_command(f"-var-delete {name}")
+
+    async def clear(self):
+        """Delete all variable objects."""
+        await self.remove(list(self._vars))
+
+    async def update(self) -> List[Dict[str, Any]]:
+        """Return the expressions whose value or scope changed."""
+        if not self._vars:
+            return []
+        response = await self.session.send_command("-var-update --all-values *")
+        result = response["result"]
+        if result is None or result["status"] != "done":
+            message = result["message"] if result else "timed out"
+            raise RuntimeError(f"Failed to update watched expressions: {message}")
+
+        changes = []
+        for change in result["data"].get("changelist", []):
+            expr = self._exprs.get(change.get("name"))
+            if expr is None:
+                # A child of a watched variable object
+                continue
+            in_scope = change.get("in_scope", "true")
+            entry = {"expression": expr, "value": change.get("value") if in_scope == "true" else None}
+            if in_scope != "true":
+                entry["in_scope"] = in_scope
+            if change.get("type_changed") == "true":
+                entry["type"] = change.get("new_type")
+            changes.append(entry)
+        return changes
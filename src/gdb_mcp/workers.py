@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""Worker processes that each own a share of the GDB sessions."""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import pickle
+import signal
+import socket
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import metrics
+from .gdb_manager import COMMAND_TIMEOUT, GDBManager
+
+logger = logging.getLogger(__name__)
+
+# Length prefix of every message exchanged with a worker
+_HEADER = struct.Struct("!I")
+
+# GDBManager methods a worker will run on behalf of the front process
+WORKER_METHODS = frozenset({
+    "create_session",
+    "send_command",
+    "fetch_result",
+    "fetch_output",
+    "run_batch",
+    "read_memory",
+    "find_memory",
+    "watch_state",
+    "trace_until",
+    "checkpoint",
+    "restore_checkpoint",
+    "clone_session",
+    "get_events",
+    "close_session",
+    "attach_session",
+    "describe_session",
+    "list_sessions",
+    "stats",
+    "metrics_snapshot",
+})
+
+# Seconds to wait for a worker to exit after its connection is closed
+WORKER_EXIT_TIMEOUT = 10
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Any:
+    """Read one length-prefixed pickled message."""
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return pickle.loads(await reader.readexactly(length))
+
+
+def _write_message(writer: asyncio.StreamWriter, message: Any):
+    """Queue one length-prefixed pickled message for writing."""
+    data = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    writer.writelines((_HEADER.pack(len(data)), data))
+
+
+def _worker_main(sock: socket.socket, manager_options: Dict[str, Any]):
+    """Entry point of a worker process."""
+    # Shutdown is driven by the front process closing the connection
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(sock, manager_options))
+
+
+async def _serve(sock: socket.socket, manager_options: Dict[str, Any]):
+    """Run manager calls received from the front process until it disconnects."""
+    manager = GDBManager(**manager_options)
+    await manager.start()
+    reader, writer = await asyncio.open_unix_connection(sock=sock)
+    tasks = set()
+
+    async def handle(request_id: int, method: str, args: tuple, kwargs: Dict[str, Any]):
+        try:
+            if method not in WORKER_METHODS:
+                raise RuntimeError(f"Unsupported worker method: {method}")
+            result = getattr(manager, method)(*args, **kwargs)
+            if asyncio.iscoroutine(result):
+                result = await result
+            reply = (request_id, True, result)
+        except Exception as e:
+            # Exceptions are sent as (is_value_error, message) so any
+            # exception type can cross the process boundary
+            reply = (request_id, False, (isinstance(e, ValueError), str(e)))
+        try:
+            _write_message(writer, reply)
+        except Exception as e:
+            _write_message(writer, (request_id, False, (False, f"Cannot send result: {e}")))
+        await writer.drain()
+
+    try:
+        while True:
+            try:
+                request = await _read_message(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            task = asyncio.create_task(handle(*request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await manager.cleanup()
+        writer.close()
+
+
+class _Worker:
+    """Front-process handle of one worker process."""
+
+    def __init__(self, index: int, process: multiprocessing.process.BaseProcess):
+        self.index = index
+        self.process = process
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.reader_task: Optional[asyncio.Task] = None
+        self._request_ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        # IDs of the sessions this worker owns
+        self.sessions: set = set()
+        self.alive = True
+
+    async def connect(self, sock: socket.socket):
+        self.reader, self.writer = await asyncio.open_unix_connection(sock=sock)
+        self.reader_task = asyncio.create_task(self._read_replies())
+
+    async def _read_replies(self):
+        """Resolve pending calls as their replies arrive."""
+        try:
+            while True:
+                request_id, ok, value = await _read_message(self.reader)
+                future = self._pending.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    is_value_error, message = value
+                    future.set_exception((ValueError if is_value_error else RuntimeError)(message))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.alive = False
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(RuntimeError(f"GDB worker {self.index} exited"))
+            self._pending.clear()
+
+    async def call(self, method: str, *args, **kwargs) -> Any:
+        """Run a GDBManager method in the worker and return its result."""
+        if not self.alive:
+            raise RuntimeError(f"GDB worker {self.index} exited")
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            _write_message(self.writer, (request_id, method, args, kwargs))
+            await self.writer.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+
+class WorkerPoolManager:
+    """GDBManager counterpart that spreads sessions across worker processes.
+
+    Each worker runs its own event loop and GDBManager, so reading GDB
+    output, MI parsing and per-session bookkeeping of different sessions
+    use different cores. A session is pinned to the worker that opened it;
+    the front process only routes calls and relays pickled results.
+
+    ``max_sessions`` is enforced here across all workers; an open beyond it
+    fails at once instead of waiting. Memory admission and per-session
+    limits are applied by each worker.
+    """
+
+    def __init__(self, workers: int = 2, max_sessions: Optional[int] = None, **manager_options):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.worker_count = workers
+        self.max_sessions = max_sessions
+        self._opening = 0
+        self.manager_options = manager_options
+        self.workers: List[_Worker] = []
+        self._starting = asyncio.Lock()
+        # Session ID -> worker owning it
+        self._owners: Dict[str, _Worker] = {}
+
+    async def start(self):
+        """Start the manager; worker processes are started by the first open."""
+
+    async def _start_workers(self):
+        """Start the worker processes unless they are running."""
+        async with self._starting:
+            if self.workers:
+                return
+            # "spawn" avoids forking a process that already runs an event loop
+            context = multiprocessing.get_context("spawn")
+            for index in range(self.worker_count):
+                front_sock, worker_sock = socket.socketpair()
+                process = context.Process(
+                    target=_worker_main,
+                    args=(worker_sock, self.manager_options),
+                    name=f"gdb-mcp-worker-{index}",
+                    daemon=True,
+                )
+                process.start()
+                worker_sock.close()
+                worker = _Worker(index, process)
+                await worker.connect(front_sock)
+                self.workers.append(worker)
+            logger.info(f"Started {self.worker_count} GDB worker processes")
+
+    def _least_loaded(self) -> _Worker:
+        alive = [w for w in self.workers if w.alive]
+        if not alive:
+            raise RuntimeError("No GDB worker processes are running")
+        return min(alive, key=lambda w: len(w.sessions))
+
+    def _owner(self, session_id: str) -> _Worker:
+        worker = self._owners.get(session_id)
+        if worker is None:
+            raise ValueError(f"Session not found: {session_id}")
+        return worker
+
+    async def _session_call(self, method: str, session_id: str, *args, **kwargs) -> Any:
+        """Run a per-session method in the worker owning the session."""
+        worker = self._owner(session_id)
+        try:
+            return await worker.call(method, session_id, *args, **kwargs)
+        except ValueError as e:
+            if str(e).startswith("Session not found"):
+                # Closed by the worker, e.g. after the idle timeout
+                self._owners.pop(session_id, None)
+                worker.sessions.discard(session_id)
+            raise
+
+    async def _check_capacity(self):
+        """Refuse an open when the server-wide session limit is reached."""
+        if self.max_sessions and len(self._owners) + self._opening >= self.max_sessions:
+            # Drop sessions the workers closed on their own before refusing
+            await self.list_sessions()
+            if len(self._owners) + self._opening >= self.max_sessions:
+                raise RuntimeError(
+                    f"Cannot open a session: {self.max_sessions} sessions are already open (server limit)"
+                )
+
+    async def create_session(
+        self,
+        timeout: int = 300,
+        binary: Optional[str] = None,
+        command_timeout: float = COMMAND_TIMEOUT,
+        output_budget: Optional[int] = None,
+    ) -> str:
+        """Create a session in the worker with the fewest sessions."""
+        await self._check_capacity()
+        await self._start_workers()
+        worker = self._least_loaded()
+        self._opening += 1
+        try:
+            session_id = await worker.call("create_session", timeout, binary, command_timeout, output_budget)
+        finally:
+            self._opening -= 1
+        worker.sessions.add(session_id)
+        self._owners[session_id] = worker
+        return session_id
+
+    async def send_command(
+        self,
+        session_id: str,
+        command: str,
+        timeout: Optional[float] = None,
+        detach: bool = False,
+        max_output: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        return await self._session_call("send_command", session_id, command, timeout, detach, max_output)
+
+    async def fetch_result(
+        self, session_id: str, handle: str, timeout: float = 0, max_output: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return await self._session_call("fetch_result", session_id, handle, timeout, max_output)
+
+    async def fetch_output(self, session_id: str, handle: str, **options) -> Dict[str, Any]:
+        return await self._session_call("fetch_output", session_id, handle, **options)
+
+    async def run_batch(
+        self, session_id: str, commands: List[str], stop_on_error: bool = False, max_output: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return await self._session_call("run_batch", session_id, commands, stop_on_error, max_output)
+
+    async def read_memory(self, session_id: str, address: str, length: int, **options) -> Dict[str, Any]:
+        return await self._session_call("read_memory", session_id, address, length, **options)
+
+    async def find_memory(self, session_id: str, address: str, length: int, **options) -> Dict[str, Any]:
+        return await self._session_call("find_memory", session_id, address, length, **options)
+
+    async def watch_state(self, session_id: str, **options) -> Dict[str, Any]:
+        return await self._session_call("watch_state", session_id, **options)
+
+    async def trace_until(self, session_id: str, breakpoints: List[Any], **options) -> Dict[str, Any]:
+        return await self._session_call("trace_until", session_id, breakpoints, **options)
+
+    async def checkpoint(self, session_id: str, delete: Optional[List[str]] = None) -> Dict[str, Any]:
+        return await self._session_call("checkpoint", session_id, delete)
+
+    async def restore_checkpoint(self, session_id: str, checkpoint: str) -> Dict[str, Any]:
+        return await self._session_call("restore_checkpoint", session_id, checkpoint)
+
+    async def clone_session(self, session_id: str, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Clone a session; the clone lives in the same worker as its source."""
+        await self._check_capacity()
+        worker = self._owner(session_id)
+        self._opening += 1
+        try:
+            result = await self._session_call("clone_session", session_id, timeout)
+        finally:
+            self._opening -= 1
+        worker.sessions.add(result["id"])
+        self._owners[result["id"]] = worker
+        return result
+
+    async def get_events(self, session_id: str, cursor: int = 0, timeout: float = 0, limit: int = 100) -> Dict[str, Any]:
+        return await self._session_call("get_events", session_id, cursor, timeout, limit)
+
+    async def attach_session(self, session_id: str) -> Dict[str, Any]:
+        return await self._session_call("attach_session", session_id)
+
+    async def describe_session(self, session_id: str) -> Dict[str, Any]:
+        return await self._session_call("describe_session", session_id)
+
+    async def close_session(self, session_id: str):
+        """Close a session in its worker."""
+        worker = self._owners.pop(session_id, None)
+        if worker is None:
+            raise ValueError(f"Session not found: {session_id}")
+        worker.sessions.discard(session_id)
+        await worker.call("close_session", session_id)
+
+    async def list_sessions(self) -> list:
+        """List the sessions of all workers."""
+        alive = [w for w in self.workers if w.alive]
+        results = await asyncio.gather(*(w.call("list_sessions") for w in alive))
+        sessions = []
+        for worker, worker_sessions in zip(alive, results):
+            # Forget sessions the worker closed on its own
+            ids = {s["id"] for s in worker_sessions}
+            for session_id in worker.sessions - ids:
+                self._owners.pop(session_id, None)
+            worker.sessions = ids
+            sessions.extend(worker_sessions)
+        return sessions
+
+    async def stats(self) -> Dict[str, Any]:
+        """Return the statistics of every worker."""
+        alive = [w for w in self.workers if w.alive]
+        results = await asyncio.gather(*(w.call("stats") for w in alive))
+        return {
+            "sessions": sum(s["sessions"] for s in results),
+            "workers": [
+                {"worker": w.index, "pid": w.process.pid, **s}
+                for w, s in zip(alive, results)
+            ],
+        }
+
+    async def worker_metrics(self) -> List[Tuple[Dict[str, str], metrics.Snapshot]]:
+        """Return the metrics of every worker, labelled with its index."""
+        alive = [w for w in self.workers if w.alive]
+        results = await asyncio.gather(*(w.call("metrics_snapshot") for w in alive))
+        return [({"worker": str(w.index)}, snapshot) for w, snapshot in zip(alive, results)]
+
+    async def cleanup(self):
+        """Stop all workers, closing their sessions."""
+        for worker in self.workers:
+            if worker.writer:
+                worker.writer.close()
+        for worker in self.workers:
+            await asyncio.to_thread(worker.process.join, WORKER_EXIT_TIMEOUT)
+            if worker.process.is_alive():
+                logger.error(f"GDB worker {worker.index} did not exit, terminating it")
+                worker.process.terminate()
+                await asyncio.to_thread(worker.process.join, WORKER_EXIT_TIMEOUT)
+            if worker.reader_task:
+                worker.reader_task.cancel()
+        self.workers.clear()
+        self._owners.clear()
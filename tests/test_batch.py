@@ -0,0 +1,38 @@
+"""Batch entries are validated one by one against a stub GDB."""
+
+import asyncio
+from pathlib import Path
+
+from gdb_mcp.gdb_manager import GDBManager
+
+STUB_GDB = Path(__file__).parent.parent / "benchmarks" / "stub_gdb.py"
+
+
+def run_batch(tmp_path, commands, **kwargs):
+    async def main():
+        manager = GDBManager(pool_min_size=0, gdb_path=str(STUB_GDB), cache_dir=str(tmp_path))
+        await manager.start()
+        try:
+            session_id = await manager.create_session()
+            return await manager.run_batch(session_id, commands, **kwargs)
+        finally:
+            await manager.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_invalid_entries_get_their_own_error(tmp_path):
+    batch = run_batch(tmp_path, ["print 1", {"command": "print 2", "timeout": "5"}, 7, {"command": "print 3", "timeout": 2}])
+    results = batch["results"]
+    assert [r["command"] for r in results] == ["print 1", "print 2", None, "print 3"]
+    assert results[0]["result"]["status"] == "done"
+    assert results[1]["result"] is None and "timeout" in results[1]["error"]
+    assert results[2]["result"] is None and "Invalid batch entry" in results[2]["error"]
+    assert results[3]["result"]["status"] == "done"
+    assert "error" not in results[0]
+
+
+def test_stop_on_error_stops_at_invalid_entry(tmp_path):
+    batch = run_batch(tmp_path, ["print 1", {"command": "print 2", "timeout": True}, "print 3"], stop_on_error=True)
+    assert batch["completed"] == 2
+    assert len(batch["results"]) == 2
@@ -0,0 +1,52 @@
+"""EventLog cursors, overflow and reuse."""
+
+import asyncio
+
+from gdb_mcp.events import EventLog
+
+
+def fill(log, count):
+    for i in range(count):
+        log.append(f'~"line {i}\\n"')
+
+
+def test_read_after_cursor():
+    log = EventLog()
+    fill(log, 5)
+    page = log.read(2, limit=2)
+    assert [e["seq"] for e in page["events"]] == [3, 4]
+    assert page["cursor"] == 4
+    assert page["dropped"] == 0
+    assert log.read(5)["events"] == []
+    assert log.read(5)["cursor"] == 5
+
+
+def test_overflow_reports_dropped():
+    log = EventLog(capacity=3)
+    fill(log, 5)
+    page = log.read(0)
+    assert [e["seq"] for e in page["events"]] == [3, 4, 5]
+    assert page["dropped"] == 2
+
+
+def test_clear_starts_over():
+    log = EventLog(capacity=3)
+    fill(log, 5)
+    log.clear()
+    assert log.last_seq == 0
+    assert log.read(0) == {"events": [], "cursor": 0, "dropped": 0}
+    fill(log, 1)
+    page = log.read(0)
+    assert [e["seq"] for e in page["events"]] == [1]
+    assert page["dropped"] == 0
+
+
+def test_wait():
+    async def main():
+        log = EventLog()
+        assert not await log.wait(0, 0.01)
+        asyncio.get_running_loop().call_later(0.01, log.append, '*stopped,reason="exited"')
+        assert await log.wait(0, 1)
+        assert await log.wait(0, 0)
+
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""GDB/MI record parsing."""
+
+import pytest
+
+from gdb_mcp.mi_parser import (
+    console_text, parse_record, parse_result_record, parse_results, quote, result_data, split_token, unescape,
+)
+
+
+def test_split_token():
+    assert split_token('12^done') == (12, '^done')
+    assert split_token('*stopped') == (None, '*stopped')
+
+
+def test_unescape():
+    assert unescape(r'plain') == 'plain'
+    assert unescape(r'a\nb\t\"c\"') == 'a\nb\t"c"'
+    # Octal-escaped UTF-8 bytes are reassembled into one character
+    assert unescape(r'\303\251') == 'é'
+    assert unescape(r'\e[31mred\e[0m') == '\x1b[31mred\x1b[0m'
+    # An escaped backslash followed by "e" is not an escape character
+    assert unescape(r'a\\e') == 'a\\e'
+
+
+def test_quote_round_trip():
+    text = 'say "hi" \\ bye'
+    assert unescape(quote(text)[1:-1]) == text
+
+
+def test_parse_results_nested():
+    body = 'bkpt={number="1",type="breakpoint",thread-groups=["i1"],times="0"}'
+    assert parse_results(body) == {
+        "bkpt": {"number": "1", "type": "breakpoint", "thread-groups": ["i1"], "times": "0"}
+    }
+
+
+def test_parse_results_list_of_results():
+    body = 'stack=[frame={level="0",func="main"},frame={level="1",func="start"}]'
+    assert parse_results(body) == {"stack": [{"level": "0", "func": "main"}, {"level": "1", "func": "start"}]}
+
+
+def test_parse_results_repeated_key_and_continuation():
+    # Breakpoints with several locations repeat "bkpt" or continue it unnamed
+    assert parse_results('bkpt={number="1"},bkpt={number="1.1"},bkpt={number="1.2"}') == {
+        "bkpt": [{"number": "1"}, {"number": "1.1"}, {"number": "1.2"}]
+    }
+    assert parse_results('bkpt={number="1"},{number="1.1"}') == {
+        "bkpt": [{"number": "1"}, {"number": "1.1"}]
+    }
+
+
+def test_parse_result_record():
+    assert parse_result_record('^done') == {"status": "done", "data": {}}
+    assert parse_result_record('^running') == {"status": "running"}
+    assert parse_result_record('^done,value="3"') == {"status": "done", "data": {"value": "3"}}
+    assert parse_result_record('^error,msg="No symbol \\"x\\".",code="undefined-command"') == {
+        "status": "error",
+        "message": 'No symbol "x".',
+        "code": "undefined-command",
+    }
+    assert parse_result_record('^bogus') == {"status": "unknown", "data": '^bogus'}
+
+
+def test_parse_record_types():
+    assert parse_record('(gdb)') == {"type": "prompt"}
+    assert parse_record('~"Hello\\n"') == {"type": "console", "payload": "Hello\n"}
+    assert parse_record('&"warning\\n"') == {"type": "log", "payload": "warning\n"}
+    assert parse_record('*stopped,reason="exited-normally"') == {
+        "type": "exec", "token": None, "class": "stopped", "results": {"reason": "exited-normally"}
+    }
+    assert parse_record('5=thread-created,id="1"')["token"] == 5
+    assert parse_record('not mi') == {"type": "unknown", "payload": "not mi"}
+
+
+def test_result_data():
+    assert result_data({"result": {"status": "done", "data": {"value": "1"}}}, "evaluating") == {"value": "1"}
+    assert result_data({"result": {"status": "running"}}, "running") == {}
+    with pytest.raises(RuntimeError, match="Timed out evaluating"):
+        result_data({"result": None}, "evaluating")
+    with pytest.raises(RuntimeError, match='Failed evaluating: No symbol "x".'):
+        result_data({"result": {"status": "error", "message": 'No symbol "x".'}}, "evaluating")
+
+
+def test_console_text():
+    assert console_text(['~"checkpoint 1: "', '&"log\\n"', '~"fork returned pid 5.\\n"', "(gdb)"]) == (
+        "checkpoint 1: fork returned pid 5.\n"
+    )
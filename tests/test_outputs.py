@@ -0,0 +1,100 @@
+"""Output budgets and stored outputs."""
+
+import json
+
+import pytest
+
+from gdb_mcp.outputs import OutputStore, shrink, summarize
+
+
+def _response(lines, data=None):
+    return {"result": {"status": "done", "data": data or {}}, "lines": lines}
+
+
+def test_small_response_is_returned_whole():
+    store = OutputStore(1000)
+    limited = store.limit(_response(['~"a"', '~"b"'], {"value": "1"}), "p 1")
+    assert limited == {"result": {"status": "done", "data": {"value": "1"}}, "output": '~"a"\n~"b"'}
+    assert len(store) == 0
+
+
+def test_no_budget_returns_everything():
+    store = OutputStore(10)
+    lines = [f"line {i}" for i in range(100)]
+    assert store.limit(_response(lines), "cmd", 0)["output"] == "\n".join(lines)
+
+
+def test_long_output_is_summarized_and_stored():
+    store = OutputStore(200)
+    lines = [f"line {i:03}" for i in range(100)]
+    limited = store.limit(_response(lines), "info functions")
+    assert len(limited["output"]) < 300
+    assert limited["output"].startswith("line 000")
+    assert limited["output"].endswith("line 099")
+    truncated = limited["truncated"]
+    assert truncated["lines"] == 100
+    assert truncated["chars"] == len("\n".join(lines))
+
+    page = store.fetch(truncated["handle"], offset=10, limit=5)
+    assert [line["text"] for line in page["lines"]] == [f"line {i:03}" for i in range(10, 15)]
+    assert page["next_offset"] == 15
+    found = store.fetch(truncated["handle"], grep="line 05")
+    assert [line["line"] for line in found["lines"]] == list(range(50, 60))
+
+
+def test_large_result_data_is_budgeted():
+    frames = [{"level": str(i), "func": f"function_{i}", "file": "a.c", "line": str(i)} for i in range(200)]
+    store = OutputStore(500)
+    limited = store.limit(_response([], {"stack": frames}), "-stack-list-frames")
+
+    kept = limited["result"]["data"]["stack"]
+    assert 0 < len(kept) < 200
+    assert kept == frames[:len(kept)]
+    assert len(json.dumps(limited["result"]["data"])) <= 600
+    info = limited["truncated_data"]
+    assert info["items"] == {"stack": 200}
+
+    text, offset = [], 0
+    while offset is not None:
+        page = store.fetch(info["handle"], offset)
+        text += [line["text"] for line in page["lines"]]
+        offset = page["next_offset"]
+    assert len(text) == info["lines"]
+    assert json.loads("\n".join(text)) == {"stack": frames}
+
+
+def test_small_part_is_kept_whole():
+    store = OutputStore(1000)
+    lines = [f"line {i:03}" for i in range(500)]
+    limited = store.limit(_response(lines, {"value": "42"}), "cmd")
+    assert limited["result"]["data"] == {"value": "42"}
+    assert "truncated_data" not in limited
+    assert "truncated" in limited
+
+
+def test_shrink_nested():
+    data = {"symbols": {"debug": [{"filename": "a.c", "symbols": [{"name": f"f{i}"} for i in range(100)]}]}}
+    cut = {}
+    value, size = shrink(data, 200, cut=cut)
+    assert size <= 200
+    assert value["symbols"]["debug"][0]["filename"] == "a.c"
+    assert cut == {"symbols.debug[0].symbols": 100}
+
+
+def test_summarize_marks_omitted_lines():
+    text = summarize([f"line {i}" for i in range(50)], 40, "see handle")
+    assert "lines omitted; see handle" in text
+
+
+def test_fetch_unknown_handle():
+    with pytest.raises(ValueError):
+        OutputStore().fetch("out-1")
+
+
+def test_oldest_outputs_are_evicted():
+    store = OutputStore(10)
+    handles = [store.limit(_response(["x" * 20]), f"cmd {i}")["truncated"]["handle"] for i in range(40)]
+    assert len(store) == 32
+    with pytest.raises(ValueError):
+        store.fetch(handles[0])
+    assert store.fetch(handles[-1])["command"] == "cmd 39"
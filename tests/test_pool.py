@@ -0,0 +1,141 @@
+"""Pool acquire and release, with fake sessions and against the stub GDB."""
+
+import asyncio
+from pathlib import Path
+
+from gdb_mcp.binary import BinaryKey
+from gdb_mcp.gdb_manager import GDBManager
+from gdb_mcp.pool import GDBProcessPool
+
+STUB_GDB = Path(__file__).parent.parent / "benchmarks" / "stub_gdb.py"
+
+BINARY = BinaryKey("/bin/binary", 1, "aa")
+OTHER = BinaryKey("/bin/other", 1, "bb")
+
+
+class FakeSession:
+    """Stands in for GDBSession; reset() unloads the binary unless kept."""
+
+    def __init__(self, session_id):
+        self.id = session_id
+        self.binary_key = None
+        self.dirty = False
+        self.closed = False
+        self.resets = []
+
+    @property
+    def is_alive(self):
+        return not self.closed
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    async def reset(self, keep_symbols=False):
+        self.resets.append(keep_symbols)
+        if self.dirty:
+            return False
+        if not keep_symbols:
+            self.binary_key = None
+        return True
+
+
+def test_acquire_and_release():
+    async def main():
+        pool = GDBProcessPool(FakeSession, min_size=0, max_size=1)
+        first = await pool.acquire()
+        assert (pool.hits, pool.misses) == (0, 1)
+        await pool.release(first)
+        assert first.resets == [False] and not first.closed
+        assert await pool.acquire() is first
+        assert (pool.hits, pool.misses, pool.recycled) == (1, 1, 1)
+
+        # Only max_size processes are kept idle
+        second = await pool.acquire()
+        await pool.release(first)
+        await pool.release(second)
+        assert pool.idle_count() == 1 and second.closed
+
+    asyncio.run(main())
+
+
+def test_dirty_session_is_closed():
+    async def main():
+        pool = GDBProcessPool(FakeSession, min_size=0, max_size=4)
+        session = await pool.acquire()
+        session.dirty = True
+        await pool.release(session)
+        assert session.closed and pool.idle_count() == 0
+
+    asyncio.run(main())
+
+
+def test_template_reuse():
+    async def main():
+        pool = GDBProcessPool(FakeSession, min_size=0, max_size=4, template_size=1)
+        session = await pool.acquire(BINARY)
+        session.binary_key = BINARY
+        await pool.release(session)
+        assert session.resets == [True]
+        assert pool.stats()["idle"] == 0 and pool.idle_count() == 1
+
+        assert await pool.acquire(OTHER) is not session
+        assert await pool.acquire(BINARY) is session
+        assert (pool.template_hits, pool.template_misses) == (1, 2)
+
+    asyncio.run(main())
+
+
+def test_lost_binary_is_reset_once():
+    class Unloading(FakeSession):
+        async def reset(self, keep_symbols=False):
+            # As when the client loaded another executable
+            self.binary_key = None
+            return await super().reset(keep_symbols)
+
+    async def main():
+        pool = GDBProcessPool(Unloading, min_size=0, max_size=4)
+        session = await pool.acquire(BINARY)
+        session.binary_key = BINARY
+        await pool.release(session)
+        assert session.resets == [True]
+        assert pool.stats()["idle"] == 1 and not session.closed
+
+    asyncio.run(main())
+
+
+def test_manager_recycles_only_clean_sessions(tmp_path):
+    async def main():
+        manager = GDBManager(pool_min_size=0, gdb_path=str(STUB_GDB), cache_dir=str(tmp_path))
+        await manager.start()
+        pool = manager.pool
+
+        async def run_and_close(command):
+            session_id = await manager.create_session()
+            manager.sessions[session_id].events.append('~"left over\\n"')
+            await manager.send_command(session_id, command)
+            await manager.close_session(session_id)
+            while pool._background:
+                await asyncio.sleep(0.01)
+            return session_id
+
+        try:
+            first = await run_and_close("print 1")
+            assert (pool.recycled, pool.idle_count()) == (1, 1)
+            # The recycled process gets a new ID and an empty event log
+            session_id = await manager.create_session()
+            assert pool.hits == 1 and session_id != first
+            assert manager.sessions[session_id].events.read(0) == {"events": [], "cursor": 0, "dropped": 0}
+            await manager.close_session(session_id)
+            while pool._background:
+                await asyncio.sleep(0.01)
+
+            # A setting reset() can't undo keeps the process from being reused
+            await run_and_close("set pagination off")
+            assert (pool.recycled, pool.idle_count()) == (2, 0)
+        finally:
+            await manager.cleanup()
+
+    asyncio.run(main())
@@ -0,0 +1,25 @@
+"""Which client commands leave a GDB process that reset() can clean up."""
+
+import pytest
+
+from gdb_mcp.gdb_manager import is_resettable
+
+
+@pytest.mark.parametrize("command", [
+    "break main", "run", "-exec-continue", "print x", "set var x = 1", "set args -v",
+    "-file-exec-and-symbols /bin/ls", "-file-list-exec-source-files", "kill", "detach",
+    "disable", "disable 1 2", "disable 1.2-3", "disable $bpnum", "disable breakpoints 3",
+    "enable display 2", "enable once 2", "enable count 3 1", "enable delete 4",
+])
+def test_resettable(command):
+    assert is_resettable(command)
+
+
+@pytest.mark.parametrize("command", [
+    "attach 123", "-target-attach 123", "symbol-file /tmp/other", "-file-symbol-file /tmp/other",
+    "disable pretty-printer", "disable frame-filter global x", "disable unwinder",
+    "disable type-printer", "enable mem 1", "set pagination off", "print $x = 1",
+    "thread apply all set var x = 1", "source script.gdb", "-gdb-set confirm off",
+])
+def test_not_resettable(command):
+    assert not is_resettable(command)
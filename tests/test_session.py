@@ -0,0 +1,59 @@
+"""Token correlation and pipelining of MI commands, against a stub GDB."""
+
+import asyncio
+from pathlib import Path
+
+from gdb_mcp.gdb_manager import GDBSession
+
+STUB_GDB = Path(__file__).parent.parent / "benchmarks" / "stub_gdb.py"
+
+
+def run_session(test):
+    async def main():
+        session = GDBSession("test", gdb_path=str(STUB_GDB))
+        await session.start()
+        try:
+            return await test(session)
+        finally:
+            await session.close()
+
+    return asyncio.run(main())
+
+
+def test_concurrent_commands_get_their_own_results():
+    async def test(session):
+        commands = [f"echo {i}" for i in range(20)]
+        responses = await asyncio.gather(*(session.send_command(c) for c in commands))
+        for command, response in zip(commands, responses):
+            assert response["result"] == {"status": "done", "data": {}}
+            assert response["lines"] == [f'~"{command}\\n"']
+
+    run_session(test)
+
+
+def test_commands_are_pipelined(monkeypatch):
+    # Each answer takes a while, so all commands are in flight at once
+    monkeypatch.setenv("STUB_GDB_COMMAND_DELAY", "0.05")
+
+    async def test(session):
+        tasks = [asyncio.create_task(session.send_command(f"echo {i}", 5)) for i in range(5)]
+        await asyncio.sleep(0.02)
+        assert len(session._pending) == 5
+        responses = await asyncio.gather(*tasks)
+        assert [r["lines"] for r in responses] == [[f'~"echo {i}\\n"'] for i in range(5)]
+
+    run_session(test)
+
+
+def test_late_result_does_not_reach_the_next_command(monkeypatch):
+    monkeypatch.setenv("STUB_GDB_COMMAND_DELAY", "0.2")
+
+    async def test(session):
+        late = await session.send_command("echo late", 0.05)
+        assert late["result"] is None
+        response = await session.send_command("echo next", 5)
+        assert response["result"] == {"status": "done", "data": {}}
+        assert response["lines"] == ['~"echo next\\n"']
+        assert not session._pending
+
+    run_session(test)
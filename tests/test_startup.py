@@ -0,0 +1,62 @@
+"""Startup stays lazy and the command reference ships with the package."""
+
+import asyncio
+import importlib.util
+import statistics
+import subprocess
+import sys
+import tomllib
+from importlib import resources
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Median time from spawning the stdio server to its initialize response;
+# the same bound as benchmarks/bench_startup.py --max-initialize-ms
+MAX_INITIALIZE_SECONDS = 1.5
+
+
+def test_cli_import_does_not_load_mcp():
+    # A fresh interpreter, since this one may have imported mcp already
+    code = (
+        "import sys, gdb_mcp.cli, gdb_mcp.server; "
+        "print(' '.join(m for m in ('mcp', 'pydantic') if m in sys.modules))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(ROOT / "src")},
+    ).stdout.strip()
+    assert loaded == ""
+
+
+def test_reference_is_package_data():
+    from gdb_mcp.server import COMMANDS_FILE
+
+    assert COMMANDS_FILE == resources.files("gdb_mcp") / "resources" / "gdb_commands.md"
+    assert COMMANDS_FILE.is_file()
+    package_data = tomllib.loads((ROOT / "pyproject.toml").read_text())["tool"]["setuptools"]["package-data"]
+    assert "resources/*.md" in package_data["gdb_mcp"]
+
+
+def test_reference_parses():
+    from gdb_mcp.reference import CLI_SECTION, MI_SECTION, CommandReference
+    from gdb_mcp.server import COMMANDS_FILE
+
+    reference = CommandReference(COMMANDS_FILE)
+    assert reference.full_text()
+    assert not reference.section(CLI_SECTION).startswith("Section ")
+    assert not reference.section(MI_SECTION).startswith("Section ")
+    assert reference.commands["cli"] and reference.commands["mi"]
+
+
+def test_time_to_initialize(tmp_path):
+    # Reuse the benchmark's client, which starts the server against the stub GDB
+    spec = importlib.util.spec_from_file_location("bench_startup", ROOT / "benchmarks" / "bench_startup.py")
+    bench_startup = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bench_startup)
+
+    runs = [asyncio.run(bench_startup.run_once(str(tmp_path))) for _ in range(3)]
+    assert statistics.median(run["initialize"] for run in runs) < MAX_INITIALIZE_SECONDS
@@ -0,0 +1,56 @@
+"""Symbol table parsing and matching, without GDB."""
+
+import pytest
+
+from gdb_mcp.symbols import SymbolTable, _fuzzy_score, parse_entries
+
+FUNCTIONS = {
+    "symbols": {
+        "debug": [
+            {
+                "filename": "main.c",
+                "fullname": "/src/main.c",
+                "symbols": [
+                    {"line": "10", "name": "main", "type": "int (void)"},
+                    {"line": "20", "name": "parse_args", "type": "void (int, char **)"},
+                    {"line": "30", "name": "ParseConfig", "type": "int (void)"},
+                ],
+            }
+        ],
+        "nondebug": [{"address": "0x1000", "name": "_start"}],
+    }
+}
+
+
+def test_parse_entries():
+    entries = parse_entries("function", FUNCTIONS)
+    assert ("main", "/src/main.c", 10, "int (void)", None) in entries
+    assert ("_start", None, None, None, "0x1000") in entries
+    files = parse_entries("source", {"files": [{"file": "main.c", "fullname": "/src/main.c"}]})
+    assert files == [("main.c", "/src/main.c", None, None, None)]
+
+
+def _names(table, query, mode, ignore_case=False):
+    return [entry[0] for _, entry in table.match(query, mode, ignore_case)]
+
+
+def test_prefix_match():
+    table = SymbolTable("function", parse_entries("function", FUNCTIONS))
+    assert _names(table, "parse", "prefix") == ["parse_args"]
+    assert sorted(_names(table, "parse", "prefix", ignore_case=True)) == ["ParseConfig", "parse_args"]
+    assert len(_names(table, "", "prefix")) == 4
+
+
+def test_regex_match():
+    table = SymbolTable("function", parse_entries("function", FUNCTIONS))
+    assert _names(table, "^_|in$", "regex") == ["_start", "main"]
+    with pytest.raises(ValueError):
+        table.match("(", "regex", False)
+
+
+def test_fuzzy_ranking():
+    # Whole substrings first, then by how close together the characters are
+    assert _fuzzy_score("arg", "parse_args") < _fuzzy_score("arg", "a_r_g")
+    assert _fuzzy_score("pa", "parse") < _fuzzy_score("pa", "p_a")
+    table = SymbolTable("function", parse_entries("function", FUNCTIONS))
+    assert _names(table, "pcfg", "fuzzy") == ["ParseConfig"]
@@ -0,0 +1,65 @@
+"""Session routing across worker processes, against the stub GDB."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from gdb_mcp.workers import WorkerPoolManager
+
+STUB_GDB = Path(__file__).parent.parent / "benchmarks" / "stub_gdb.py"
+
+
+def run_workers(tmp_path, test, **options):
+    async def main():
+        manager = WorkerPoolManager(
+            workers=2, gdb_path=str(STUB_GDB), pool_min_size=0, cache_dir=str(tmp_path), **options
+        )
+        await manager.start()
+        try:
+            return await test(manager)
+        finally:
+            await manager.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_sessions_are_spread_and_pinned(tmp_path):
+    async def test(manager):
+        ids = [await manager.create_session() for _ in range(4)]
+        assert [len(w.sessions) for w in manager.workers] == [2, 2]
+
+        # Each worker only knows its own sessions
+        for worker in manager.workers:
+            listed = {s["id"] for s in await worker.call("list_sessions")}
+            assert listed == worker.sessions
+
+        # Calls reach the session in its owner, whichever worker that is
+        responses = await asyncio.gather(*(
+            manager.send_command(session_id, f"echo {session_id}") for session_id in ids
+        ))
+        for session_id, response in zip(ids, responses):
+            assert response["output"] == f'~"echo {session_id}\\n"'
+
+        await manager.close_session(ids[0])
+        assert ids[0] not in manager._owners
+        assert sum(len(w.sessions) for w in manager.workers) == 3
+        with pytest.raises(ValueError, match="Session not found"):
+            await manager.send_command(ids[0], "echo closed")
+
+        # The next open goes to the worker that has room again
+        owner = next(w for w in manager.workers if len(w.sessions) == 1)
+        session_id = await manager.create_session()
+        assert manager._owners[session_id] is owner
+
+    run_workers(tmp_path, test)
+
+
+def test_session_limit_spans_workers(tmp_path):
+    async def test(manager):
+        await manager.create_session()
+        await manager.create_session()
+        with pytest.raises(RuntimeError, match="2 sessions are already open"):
+            await manager.create_session()
+
+    run_workers(tmp_path, test, max_sessions=2)